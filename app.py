@@ -3,22 +3,33 @@ Aplicativo Streamlit para cadastro e validação de componentes curriculares.
 Interface principal para professores e coordenadores de curso.
 """
 
+import atexit
 import streamlit as st
-import pandas as pd
 from datetime import datetime
+from itertools import islice
+import math
 import os
-import json
 from utils.calculos import (
     calcular_ch_total,
-    calcular_ch_total_curso,
-    calcular_ch_por_nucleo,
-    calcular_percentual_extensao,
-    calcular_percentual_pratica_pedagogica,
+    calcular_indicadores,
     obter_ch_minima_por_nucleo,
     validar_ch_minima_nucleo
 )
-from utils.validacoes import validar_componente, validar_curso_completo
-from utils.exportacoes import exportar_csv, exportar_xlsx, exportar_pdf, gerar_resumo_por_semestre_nucleo, gerar_matriz_por_periodo
+from utils.validacoes import validar_alteracoes, validar_componente, validar_curso_completo
+from utils.armazenamento import ComponentStore
+from utils.backup import exportar_backup_json
+from utils.diario import DiarioOperacoes, restaurar_cadeia
+from utils.historico import HistoricoAlteracoes, descrever_alteracao
+from utils.importacoes import importar_componentes
+from utils.perfil import perfil_habilitado, perfilar_execucao, secao
+from utils.persistencia import RepositorioCursos, persistencia_habilitada
+from utils.espaco_trabalho import EspacoTrabalho
+from utils.exportacoes import (
+    aquecer_exportadores,
+    exportar_com_cache,
+    gerar_resumo_por_semestre_nucleo,
+    gerar_matriz_por_periodo
+)
 
 # Configuração da página
 st.set_page_config(
@@ -241,9 +252,42 @@ TIPOS_POR_NUCLEO = {
     "IV": ["Estágio"]
 }
 
+# Opções de tamanho de página da lista de componentes
+TAMANHOS_PAGINA_COMPONENTES = [25, 50, 100]
+
+# Colunas da lista de componentes editáveis na própria tabela → campo do componente
+CAMPOS_EDITAVEIS_LISTA = {"Semestre": "semestre", "Nome": "nome"}
+
+# Parâmetro da URL que identifica o curso salvo automaticamente
+PARAMETRO_CURSO = "curso"
+
+# Avisos sobre a guarda dos dados, com e sem salvamento automático
+AVISO_DADOS_SALVOS = """
+**💾 Salvamento automático**
+
+Cada alteração é **salva automaticamente** neste servidor.
+
+O curso fica vinculado ao **endereço desta página** (parâmetro `curso` da URL): guarde o link para retomar o trabalho.
+
+Para levar os dados para outro computador ou guardar uma cópia, use o **backup** na aba "Exportar".
+"""
+
+AVISO_DADOS_NAO_SALVOS = """
+**⚠️ IMPORTANTE**
+
+O site **não salva seus dados automaticamente**.
+
+Realize o **backup manual** na aba "Exportar" para não perder seus dados!
+
+Caso feche o site sem backup, os dados **não serão restaurados**.
+"""
+
+# Aviso exibido quando uma exportação é reaproveitada do cache
+MENSAGEM_EXPORTACAO_CACHE = "Arquivo reaproveitado do cache: o curso não mudou desde a última exportação com estas opções."
+
 # Inicializar estado da sessão
 if "componentes" not in st.session_state:
-    st.session_state.componentes = []
+    st.session_state.componentes = ComponentStore()
 
 if "ultimo_id" not in st.session_state:
     st.session_state.ultimo_id = 0
@@ -280,148 +324,344 @@ def limpar_formulario():
     st.session_state["valores_limpos"] = valores_limpos
 
 
-def adicionar_componente(dados: dict):
-    """Adiciona um novo componente à lista."""
-    st.session_state.ultimo_id += 1
-    dados["id"] = st.session_state.ultimo_id
-    st.session_state.componentes.append(dados.copy())
+@st.cache_resource
+def obter_repositorio() -> RepositorioCursos:
+    """Repositório SQLite compartilhado pelas sessões; as conexões são fechadas ao encerrar o servidor."""
+    repositorio = RepositorioCursos()
+    atexit.register(repositorio.fechar)
+    return repositorio
 
 
-def remover_componente(id_componente: int):
-    """Remove um componente da lista."""
-    st.session_state.componentes = [
-        comp for comp in st.session_state.componentes 
-        if comp.get("id") != id_componente
-    ]
+def obter_espaco_trabalho() -> EspacoTrabalho:
+    """Espaço de trabalho da sessão, com os cursos criados nela ou abertos pelo link ?curso=."""
+    if "espaco_trabalho" not in st.session_state:
+        st.session_state.espaco_trabalho = EspacoTrabalho(obter_repositorio())
+    return st.session_state.espaco_trabalho
 
 
-def exportar_backup_json(componentes: list, ultimo_id: int) -> str:
+def abrir_curso(curso_id: str):
     """
-    Exporta os dados do curso para um arquivo JSON (backup).
-    
+    Torna o curso informado o curso da sessão.
+
+    Cursos abertos recentemente são reaproveitados da memória; os demais são
+    lidos do banco. O identificador vai para a URL, para que a página possa
+    ser reaberta no mesmo curso.
+    """
+    espaco = obter_espaco_trabalho()
+    st.session_state.componentes = espaco.abrir(curso_id)
+    st.session_state.ultimo_id = espaco.resumo(curso_id).ultimo_id
+    st.session_state.curso_id = curso_id
+    st.query_params[PARAMETRO_CURSO] = curso_id
+
+
+def carregar_curso_na_sessao(componentes: list, ultimo_id: int):
+    """
+    Substitui os componentes do curso da sessão (ex.: ao restaurar um backup).
+
+    Com o salvamento automático ativo, o curso é gravado por inteiro e as
+    alterações seguintes passam a ser gravadas componente a componente.
+
     Args:
-        componentes: Lista de componentes
-        ultimo_id: Último ID usado
+        componentes: Componentes do curso
+        ultimo_id: Último id usado
+    """
+    curso_id = st.session_state.get("curso_id")
+    if curso_id and persistencia_habilitada():
+        obter_espaco_trabalho().substituir(curso_id, componentes, ultimo_id)
+        abrir_curso(curso_id)
+    else:
+        st.session_state.componentes = ComponentStore(componentes)
+        st.session_state.ultimo_id = ultimo_id
+
+
+def iniciar_sessao():
+    """
+    Abre o curso de uma nova sessão.
+
+    O curso é identificado pelo parâmetro ?curso= da URL. Se ele já estiver
+    gravado, é restaurado; caso contrário, é criado com o conteúdo atual da
+    sessão e recebe um identificador, colocado na URL. Um curso novo só é
+    gravado no banco na primeira alteração.
+    """
+    if not persistencia_habilitada():
+        st.session_state.curso_id = None
+        return
+
+    espaco = obter_espaco_trabalho()
+    curso_id = st.query_params.get(PARAMETRO_CURSO)
+    if not curso_id or not espaco.incluir(curso_id):
+        curso_id = espaco.criar(
+            componentes=st.session_state.componentes.para_lista(),
+            ultimo_id=st.session_state.ultimo_id,
+            curso_id=curso_id
+        )
+    abrir_curso(curso_id)
+
+
+def exibir_seletor_cursos():
+    """Exibe, na barra lateral, a lista de cursos do espaço de trabalho e a criação de cursos."""
+    espaco = obter_espaco_trabalho()
+    curso_atual = st.session_state.curso_id
+    resumos = {resumo.id: resumo for resumo in espaco.listar()}
+    
+    st.header("Cursos")
+    curso_escolhido = st.selectbox(
+        "Curso aberto",
+        list(resumos),
+        index=list(resumos).index(curso_atual),
+        format_func=lambda curso_id: (
+            f"{'✅' if resumos[curso_id].conforme else '⚠️'} {resumos[curso_id].nome} "
+            f"({resumos[curso_id].quantidade_componentes} comp., {resumos[curso_id].ch_total:.0f}h)"
+        ),
+        help="Cursos criados nesta sessão ou abertos pelo link (?curso=). Guarde o link de cada curso para reabri-lo depois."
+    )
+    if curso_escolhido != curso_atual:
+        abrir_curso(curso_escolhido)
+        curso_atual = curso_escolhido
+    
+    nome = st.text_input("Nome do curso", value=resumos[curso_atual].nome, key=f"nome_curso_{curso_atual}")
+    if nome.strip() and nome.strip() != resumos[curso_atual].nome:
+        espaco.renomear(curso_atual, nome.strip())
+        st.rerun()
+    
+    if st.button("Novo curso", key="btn_novo_curso", use_container_width=True):
+        abrir_curso(espaco.criar())
+        st.rerun()
+    
+    st.markdown("---")
+
+
+def obter_diario() -> DiarioOperacoes:
+    """Diário de operações do curso aberto, recriado quando o curso da sessão muda."""
+    diario = st.session_state.get("diario")
+    if diario is None or diario.componentes is not st.session_state.componentes:
+        if diario is not None:
+            diario.componentes.deixar_de_observar(diario.registrar)
+        diario = st.session_state.diario = DiarioOperacoes(st.session_state.componentes)
+    return diario
+
+
+def obter_historico() -> HistoricoAlteracoes:
+    """Histórico de desfazer/refazer do curso aberto, recriado quando o curso da sessão muda."""
+    historico = st.session_state.get("historico")
+    if historico is None or historico.componentes is not st.session_state.componentes:
+        if historico is not None:
+            historico.componentes.deixar_de_observar(historico.registrar)
+        historico = st.session_state.historico = HistoricoAlteracoes(st.session_state.componentes)
+    return historico
+
+
+def exibir_historico():
+    """Exibe, na barra lateral, os botões para desfazer e refazer alterações."""
+    historico = obter_historico()
+    proximo_desfazer = historico.proximo_desfazer()
+    proximo_refazer = historico.proximo_refazer()
     
+    col_desfazer, col_refazer = st.columns(2)
+    with col_desfazer:
+        if st.button(
+            "↩️ Desfazer",
+            key="btn_desfazer",
+            disabled=proximo_desfazer is None,
+            help=f"Desfazer {descrever_alteracao(proximo_desfazer)}" if proximo_desfazer else None,
+            use_container_width=True
+        ):
+            alteracao = historico.desfazer()
+            st.toast(f"Desfeito: {descrever_alteracao(alteracao)}")
+            st.rerun()
+    with col_refazer:
+        if st.button(
+            "↪️ Refazer",
+            key="btn_refazer",
+            disabled=proximo_refazer is None,
+            help=f"Refazer {descrever_alteracao(proximo_refazer)}" if proximo_refazer else None,
+            use_container_width=True
+        ):
+            alteracao = historico.refazer()
+            st.toast(f"Refeito: {descrever_alteracao(alteracao)}")
+            st.rerun()
+    
+    st.markdown("---")
+
+
+def reservar_ids(quantidade: int) -> range:
+    """
+    Reserva ids para novos componentes do curso da sessão.
+
+    Com o salvamento automático, os ids são reservados no banco, para que
+    duas sessões abertas no mesmo curso nunca usem o mesmo id.
+
+    Args:
+        quantidade: Quantidade de ids
+
     Returns:
-        String JSON serializada
+        Ids reservados, em ordem crescente
     """
-    dados_backup = {
-        "componentes": componentes,
-        "ultimo_id": ultimo_id,
-        "data_backup": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "versao": "1.0"
-    }
-    return json.dumps(dados_backup, ensure_ascii=False, indent=2)
+    curso_id = st.session_state.get("curso_id")
+    if curso_id and persistencia_habilitada():
+        ids = obter_espaco_trabalho().reservar_ids(curso_id, quantidade)
+    else:
+        ids = range(st.session_state.ultimo_id + 1, st.session_state.ultimo_id + quantidade + 1)
+    if ids:
+        st.session_state.ultimo_id = max(st.session_state.ultimo_id, ids[-1])
+    return ids
 
 
-def importar_backup_json(arquivo_json: str) -> tuple[list, int, bool, str]:
+def adicionar_componente(dados: dict):
+    """Adiciona um novo componente ao curso."""
+    dados["id"] = reservar_ids(1)[0]
+    st.session_state.componentes.adicionar(dados.copy())
+
+
+def adicionar_componentes(componentes: list[dict]) -> int:
     """
-    Importa dados de backup a partir de um arquivo JSON.
-    
+    Adiciona vários componentes ao curso em uma única operação (ex.: importação).
+
+    Returns:
+        Quantidade de componentes adicionados
+    """
+    novos = [
+        {**componente, "id": id_componente}
+        for componente, id_componente in zip(componentes, reservar_ids(len(componentes)))
+    ]
+    return len(st.session_state.componentes.adicionar_varios(novos))
+
+
+def remover_componente(id_componente: int):
+    """Remove um componente do curso."""
+    st.session_state.componentes.remover(id_componente)
+
+
+def remover_componentes(ids: list[int]) -> int:
+    """
+    Remove vários componentes do curso em uma única operação.
+
+    Returns:
+        Quantidade de componentes removidos
+    """
+    return len(st.session_state.componentes.remover_varios(ids))
+
+
+def atualizar_componentes(alteracoes: dict[int, dict]) -> tuple[bool, dict[int, list[str]]]:
+    """
+    Altera vários componentes do curso em uma única operação.
+
+    As alterações são validadas em conjunto antes da gravação: se alguma
+    introduzir erros, nenhuma é aplicada. Erros que o componente já tinha
+    não impedem a edição.
+
     Args:
-        arquivo_json: String JSON com os dados
-    
+        alteracoes: Mapa id → campos a alterar
+
     Returns:
-        Tupla (componentes, ultimo_id, sucesso, mensagem)
+        Tupla (sucesso, erros novos por id do componente)
     """
-    try:
-        dados = json.loads(arquivo_json)
-        
-        if "componentes" not in dados or "ultimo_id" not in dados:
-            return [], 0, False, "Formato de arquivo inválido. O arquivo deve conter 'componentes' e 'ultimo_id'."
-        
-        componentes = dados["componentes"]
-        ultimo_id = dados.get("ultimo_id", 0)
-        
-        if not isinstance(componentes, list):
-            return [], 0, False, "Formato inválido: 'componentes' deve ser uma lista."
-        
-        if not isinstance(ultimo_id, (int, float)):
-            return [], 0, False, "Formato inválido: 'ultimo_id' deve ser um número."
-        
-        return componentes, int(ultimo_id), True, f"Backup restaurado com sucesso! {len(componentes)} componente(s) carregado(s)."
+    erros = validar_alteracoes(st.session_state.componentes, alteracoes)
+    if erros:
+        return False, erros
+    st.session_state.componentes.atualizar_varios(alteracoes)
+    return True, {}
+
+
+def exibir_tabela(nome: str, dados, **opcoes):
+    """Exibe um st.dataframe, medindo sua renderização no diagnóstico de desempenho."""
+    with secao(f"st.dataframe: {nome}"):
+        st.dataframe(dados, **opcoes)
+
+
+def exibir_painel_perfil(perfil):
+    """Mostra, na barra lateral, o tempo de cada seção da última execução."""
+    with st.sidebar.expander("Diagnóstico de desempenho", expanded=True):
+        st.caption(f"Execução completa: {perfil.total_ms:.1f} ms")
+        linhas = [
+            {
+                "Seção": "\u2003" * item["nivel"] + item["nome"],
+                "Chamadas": item["chamadas"],
+                "Tempo (ms)": round(item["total_ms"], 2),
+                "% da execução": item["percentual"]
+            }
+            for item in perfil.secoes()
+        ]
+        st.dataframe(linhas, width='stretch', hide_index=True)
+
+
+# Explicação das regras de cada núcleo, exibida no cadastro
+EXPLICACOES_NUCLEOS = {
+    "I": """
+    **NÚCLEO I – Estudos de Formação Geral - EFG**
     
-    except json.JSONDecodeError as e:
-        return [], 0, False, f"Erro ao ler arquivo JSON: {str(e)}"
-    except Exception as e:
-        return [], 0, False, f"Erro ao importar backup: {str(e)}"
+    Art. 13. Os cursos de formação inicial, respeitadas a diversidade nacional e a autonomia pedagógica das instituições, serão constituídos dos seguintes núcleos:
+    
+    I - Núcleo I – Estudos de Formação Geral - EFG: composto pelos conhecimentos científicos, educacionais e pedagógicos que fundamentam a compreensão do fenômeno educativo e da educação escolar e formam a base comum para todas as licenciaturas, articulando:
+    
+    a) princípios e fundamentos sociológicos, filosóficos, históricos e epistemológicos da educação;
+    b) princípios, valores e atitudes comprometidos com a justiça social, reconhecimento, respeito e apreço à diversidade, promoção da participação, da equidade e da inclusão e gestão democrática;
+    c) observação, análise, planejamento, desenvolvimento e avaliação de processos educativos, experiências pedagógicas e de situações de ensino e aprendizagem em instituições de Educação Básica;
+    d) conhecimento multidimensional e interdisciplinar sobre o ser humano e práticas educativas, incluindo conhecimento de processos de desenvolvimento de crianças, adolescentes, jovens e adultos, nas dimensões física, cognitiva, afetiva, estética, cultural, lúdica, artística, ética e biopsicossocial;
+    e) diagnóstico e análise das necessidades e aspirações dos diferentes segmentos da sociedade, relativas à educação, sendo capaz de identificar diferentes forças e interesses, de captar contradições e de considerá-los nos planos pedagógicos, no ensino e, consequentemente, nos processos de aprendizagem;
+    f) pesquisa e estudo da legislação educacional, dos processos de organização e gestão do trabalho dos profissionais do magistério da educação escolar básica, das políticas de financiamento, da avaliação e do currículo;
+    g) pesquisa e estudo das relações entre educação e trabalho, educação e diversidade, educação e comunicação, direitos humanos, cidadania, educação ambiental, entre outras problemáticas centrais da sociedade contemporânea;
+    h) estudos de aspectos éticos, didáticos e comportamentais no contexto do exercício profissional, articulando o saber acadêmico, a pesquisa, a extensão e a prática educativa; e
+    i) conhecimento sobre diferentes estratégias de planejamento e avaliação das aprendizagens, centradas no desenvolvimento pleno dos estudantes da Educação Básica.
+    
+    **Requisitos complementares:**
+    - Selecionar pelo menos um dos temas acima para cada componente.
+    - Garantir carga horária mínima de 880 horas neste núcleo.
+    """,
+    "II": """
+    **NÚCLEO II – Formação Específica da Área de Conhecimento**
+    
+    O Núcleo II deve ter **mínimo de 1600 horas** e compreende a Formação Específica da Área.
+    
+    **Requisitos:**
+    - Deve indicar a **vinculação com as Diretrizes da área de conhecimento específica**
+    - Campo de texto livre para descrever como o componente se relaciona com as diretrizes curriculares da área
+    - Não há lista fixa de temas, mas deve estar alinhado com as diretrizes nacionais da área
+    
+    **Características:**
+    - Flexível e adaptável às necessidades específicas de cada curso
+    - Deve contemplar conhecimentos específicos da área de formação
+    - Integração com as práticas pedagógicas da área
+    """,
+    "III": """
+    **NÚCLEO III – Atividades de Extensão**
+    
+    O Núcleo III deve ter **mínimo de 320 horas** e representa as Atividades de Extensão.
+    
+    **Requisitos:**
+    - Deve representar **pelo menos 10% da CH total do curso**
+    - Componente deve ter **vínculo explícito com projeto extensionista**
+    - Campo obrigatório para descrever o vínculo com o projeto de extensão
+    
+    **Características:**
+    - Articulação entre ensino, pesquisa e extensão
+    - Interação com a comunidade
+    - Aplicação de conhecimentos em contextos reais
+    - Se o componente tiver CH de Extensão > 0, deve obrigatoriamente pertencer a este núcleo
+    """,
+    "IV": """
+    **NÚCLEO IV – Estágios Supervisionados**
+    
+    O Núcleo IV deve ter **mínimo de 400 horas** e compreende os Estágios Supervisionados.
+    
+    **Requisitos:**
+    - Componentes do tipo **Estágio** devem obrigatoriamente pertencer a este núcleo
+    - Estágios devem ter **mínimo de 400 horas totais**
+    - **Local de realização** é obrigatório (ex: escolas, centros de educação)
+    - **Etapa do estágio** é obrigatória (Observação, Regência Parcial, Regência Final, etc.)
+    
+    **Características:**
+    - Vivência prática em ambientes escolares
+    - Supervisão docente
+    - Progressão das etapas formativas
+    - Articulação entre teoria e prática
+    """
+}
 
 
 def obter_explicacao_nucleo(nucleo: str) -> str:
     """Retorna explicação detalhada sobre as regras do núcleo."""
-    explicacoes = {
-        "I": """
-        **NÚCLEO I – Estudos de Formação Geral - EFG**
-        
-        Art. 13. Os cursos de formação inicial, respeitadas a diversidade nacional e a autonomia pedagógica das instituições, serão constituídos dos seguintes núcleos:
-        
-        I - Núcleo I – Estudos de Formação Geral - EFG: composto pelos conhecimentos científicos, educacionais e pedagógicos que fundamentam a compreensão do fenômeno educativo e da educação escolar e formam a base comum para todas as licenciaturas, articulando:
-        
-        a) princípios e fundamentos sociológicos, filosóficos, históricos e epistemológicos da educação;
-        b) princípios, valores e atitudes comprometidos com a justiça social, reconhecimento, respeito e apreço à diversidade, promoção da participação, da equidade e da inclusão e gestão democrática;
-        c) observação, análise, planejamento, desenvolvimento e avaliação de processos educativos, experiências pedagógicas e de situações de ensino e aprendizagem em instituições de Educação Básica;
-        d) conhecimento multidimensional e interdisciplinar sobre o ser humano e práticas educativas, incluindo conhecimento de processos de desenvolvimento de crianças, adolescentes, jovens e adultos, nas dimensões física, cognitiva, afetiva, estética, cultural, lúdica, artística, ética e biopsicossocial;
-        e) diagnóstico e análise das necessidades e aspirações dos diferentes segmentos da sociedade, relativas à educação, sendo capaz de identificar diferentes forças e interesses, de captar contradições e de considerá-los nos planos pedagógicos, no ensino e, consequentemente, nos processos de aprendizagem;
-        f) pesquisa e estudo da legislação educacional, dos processos de organização e gestão do trabalho dos profissionais do magistério da educação escolar básica, das políticas de financiamento, da avaliação e do currículo;
-        g) pesquisa e estudo das relações entre educação e trabalho, educação e diversidade, educação e comunicação, direitos humanos, cidadania, educação ambiental, entre outras problemáticas centrais da sociedade contemporânea;
-        h) estudos de aspectos éticos, didáticos e comportamentais no contexto do exercício profissional, articulando o saber acadêmico, a pesquisa, a extensão e a prática educativa; e
-        i) conhecimento sobre diferentes estratégias de planejamento e avaliação das aprendizagens, centradas no desenvolvimento pleno dos estudantes da Educação Básica.
-        
-        **Requisitos complementares:**
-        - Selecionar pelo menos um dos temas acima para cada componente.
-        - Garantir carga horária mínima de 880 horas neste núcleo.
-        """,
-        "II": """
-        **NÚCLEO II – Formação Específica da Área de Conhecimento**
-        
-        O Núcleo II deve ter **mínimo de 1600 horas** e compreende a Formação Específica da Área.
-        
-        **Requisitos:**
-        - Deve indicar a **vinculação com as Diretrizes da área de conhecimento específica**
-        - Campo de texto livre para descrever como o componente se relaciona com as diretrizes curriculares da área
-        - Não há lista fixa de temas, mas deve estar alinhado com as diretrizes nacionais da área
-        
-        **Características:**
-        - Flexível e adaptável às necessidades específicas de cada curso
-        - Deve contemplar conhecimentos específicos da área de formação
-        - Integração com as práticas pedagógicas da área
-        """,
-        "III": """
-        **NÚCLEO III – Atividades de Extensão**
-        
-        O Núcleo III deve ter **mínimo de 320 horas** e representa as Atividades de Extensão.
-        
-        **Requisitos:**
-        - Deve representar **pelo menos 10% da CH total do curso**
-        - Componente deve ter **vínculo explícito com projeto extensionista**
-        - Campo obrigatório para descrever o vínculo com o projeto de extensão
-        
-        **Características:**
-        - Articulação entre ensino, pesquisa e extensão
-        - Interação com a comunidade
-        - Aplicação de conhecimentos em contextos reais
-        - Se o componente tiver CH de Extensão > 0, deve obrigatoriamente pertencer a este núcleo
-        """,
-        "IV": """
-        **NÚCLEO IV – Estágios Supervisionados**
-        
-        O Núcleo IV deve ter **mínimo de 400 horas** e compreende os Estágios Supervisionados.
-        
-        **Requisitos:**
-        - Componentes do tipo **Estágio** devem obrigatoriamente pertencer a este núcleo
-        - Estágios devem ter **mínimo de 400 horas totais**
-        - **Local de realização** é obrigatório (ex: escolas, centros de educação)
-        - **Etapa do estágio** é obrigatória (Observação, Regência Parcial, Regência Final, etc.)
-        
-        **Características:**
-        - Vivência prática em ambientes escolares
-        - Supervisão docente
-        - Progressão das etapas formativas
-        - Articulação entre teoria e prática
-        """
-    }
-    return explicacoes.get(nucleo, "")
+    return EXPLICACOES_NUCLEOS.get(nucleo, "")
 
 
 def exibir_regras_ppc():
@@ -496,510 +736,492 @@ def exibir_regras_ppc():
         """)
 
 
-def main():
-    """Função principal da aplicação."""
+def exibir_como_usar():
+    """Exibe as instruções de uso do sistema."""
+    st.header("Como Usar o Sistema")
+    st.markdown("---")
     
-    col_logo, col_title, col_aviso = st.columns([0.10, 0.75, 0.15])
-    with col_logo:
-        logo_path = "assets/logo_ufal.png"
-        if os.path.exists(logo_path):
-            st.image(logo_path, width=100)
+    st.subheader("Visão Geral")
+    st.markdown("""
+    Este sistema foi desenvolvido para auxiliar professores e coordenadores de curso no cadastro, 
+    validação e organização de componentes curriculares de cursos de Licenciatura, seguindo as 
+    diretrizes da Resolução CNE/CP nº 4/2024.
     
-    with col_title:
-        st.markdown('<h1 style="margin-top: 30px; margin-bottom: 0; padding-left: 10px;">Sistema de Componentes Curriculares</h1>', unsafe_allow_html=True)
+    O sistema permite cadastrar componentes curriculares, validar automaticamente a conformidade 
+    com as normas, visualizar a matriz curricular organizada por período e núcleo, e exportar 
+    relatórios em diferentes formatos.
+    """)
     
-    with col_aviso:
-        st.markdown('<div id="ufal-backup-menu" style="margin-top:35px; text-align:right; position:relative;">',unsafe_allow_html=True)
-
-        with st.expander("⚠️ Não perca seus dados, backup", expanded=False):
-            st.markdown("""
-            **⚠️ IMPORTANTE**
-        
-            O site **não salva seus dados automaticamente**.
-        
-            Realize o **backup manual** na aba "Exportar" para não perder seus dados!
-        
-            Caso feche o site sem backup, os dados **não serão restaurados**.
-            """)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    st.subheader("Passo a Passo para Criar um PPC")
     
-    st.markdown("---")
+    st.markdown("""
+    **1. Cadastrar Componentes Curriculares**
     
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-        "Como Usar",
-        "Cadastrar", 
-        "Componentes", 
-        "Prévia - Matriz", 
-        "Prévia - Por Núcleo",
-        "Exportar", 
-        "Regras"
-    ])
-    
-    with tab1:
-        st.header("Como Usar o Sistema")
-        st.markdown("---")
-        
-        st.subheader("Visão Geral")
-        st.markdown("""
-        Este sistema foi desenvolvido para auxiliar professores e coordenadores de curso no cadastro, 
-        validação e organização de componentes curriculares de cursos de Licenciatura, seguindo as 
-        diretrizes da Resolução CNE/CP nº 4/2024.
-        
-        O sistema permite cadastrar componentes curriculares, validar automaticamente a conformidade 
-        com as normas, visualizar a matriz curricular organizada por período e núcleo, e exportar 
-        relatórios em diferentes formatos.
-        """)
-        
-        st.subheader("Passo a Passo para Criar um PPC")
-        
-        st.markdown("""
-        **1. Cadastrar Componentes Curriculares**
-        
-        Acesse a aba "Cadastrar" e preencha o formulário para cada componente do curso:
-        
-        - **Semestre**: Informe em qual período o componente será oferecido (1 a 20)
-        - **Nome do Componente**: Digite o nome completo da disciplina, módulo, estágio, etc.
-        - **Tipo**: Selecione o tipo (Disciplina, Módulo, Bloco, Estágio, TCC, Extensão, Outro)
-        - **Carga Horária**: 
-          - Para Disciplinas: informe o número de aulas semanais (a CH total será calculada automaticamente: aulas × 18h)
-          - Para outros tipos: informe a CH total manualmente
-        - **Núcleo**: Selecione o núcleo curricular (I, II, III ou IV)
-        
-        Após selecionar o núcleo, clique em "Atualizar Informações" para ver os campos específicos:
-        
-        - **Núcleo I – Estudos de Formação Geral - EFG**: selecione pelo menos um dos temas previstos:
-          - a) princípios e fundamentos sociológicos, filosóficos, históricos e epistemológicos da educação;
-          - b) princípios, valores e atitudes comprometidos com a justiça social, reconhecimento, respeito e apreço à diversidade, promoção da participação, da equidade e da inclusão e gestão democrática;
-          - c) observação, análise, planejamento, desenvolvimento e avaliação de processos educativos, experiências pedagógicas e de situações de ensino e aprendizagem em instituições de Educação Básica;
-          - d) conhecimento multidimensional e interdisciplinar sobre o ser humano e práticas educativas, incluindo conhecimento de processos de desenvolvimento de crianças, adolescentes, jovens e adultos, nas dimensões física, cognitiva, afetiva, estética, cultural, lúdica, artística, ética e biopsicossocial;
-          - e) diagnóstico e análise das necessidades e aspirações dos diferentes segmentos da sociedade, relativas à educação, sendo capaz de identificar diferentes forças e interesses, de captar contradições e de considerá-los nos planos pedagógicos, no ensino e, consequentemente, nos processos de aprendizagem;
-          - f) pesquisa e estudo da legislação educacional, dos processos de organização e gestão do trabalho dos profissionais do magistério da educação escolar básica, das políticas de financiamento, da avaliação e do currículo;
-          - g) pesquisa e estudo das relações entre educação e trabalho, educação e diversidade, educação e comunicação, direitos humanos, cidadania, educação ambiental, entre outras problemáticas centrais da sociedade contemporânea;
-          - h) estudos de aspectos éticos, didáticos e comportamentais no contexto do exercício profissional, articulando o saber acadêmico, a pesquisa, a extensão e a prática educativa; e
-          - i) conhecimento sobre diferentes estratégias de planejamento e avaliação das aprendizagens, centradas no desenvolvimento pleno dos estudantes da Educação Básica.
-        - **Núcleo II (Formação Específica)**: Descreva a vinculação com as Diretrizes da área e informe manualmente a carga horária total do componente.
-        - **Núcleo III (Extensão)**: Descreva o vínculo com projeto extensionista. Toda a carga horária é registrada como Extensão e o tipo fica limitado a componentes extensionistas.
-        - **Núcleo IV (Estágios)**: Informe local de realização e etapa do estágio. Toda a carga horária é prática supervisionada e o tipo fica restrito a Estágio.
-        
-        Campos adicionais que podem ajudar nas análises:
-        - Distribuição Teórica/Prática (definida pelas caixas de seleção ao lado do formulário)
-        - Bloco (se o componente faz parte de um grupo)
-        - Observações
-        
-        Clique em "Adicionar Componente" para salvar.
-        
-        **2. Visualizar Componentes Cadastrados**
-        
-        Na aba "Componentes", você pode:
-        - Ver todos os componentes cadastrados
-        - Visualizar o resumo por semestre e núcleo
-        - Remover componentes se necessário
-        
-        **3. Verificar a Matriz Curricular**
-        
-        A aba "Prévia - Matriz" mostra a organização completa do curso:
-        - Componentes organizados por período/semestre
-        - Linha "TOTAL DO PERÍODO" após cada semestre
-        - Resumo geral no rodapé (CH Total, CH Teórica, CH Prática, CH Extensão)
-        
-        **4. Analisar por Núcleo**
-        
-        A aba "Prévia - Por Núcleo" permite:
-        - Visualizar quadro-resumo de CH por semestre e núcleo
-        - Ver indicadores de conformidade (verde para conforme, vermelho para não conforme)
-        - Inspecionar detalhes de cada núcleo através dos expanders
-        
-        **5. Validar Conformidade**
-        
-        No painel lateral esquerdo, o sistema exibe em tempo real:
-        - Carga horária total do curso
-        - CH por núcleo com validação (verde/vermelho)
-        - Percentuais de extensão e prática pedagógica
-        - Status geral do curso
-        
-        Regras de validação:
-        - Núcleo I: mínimo de 880h
-        - Núcleo II: mínimo de 1600h
-        - Núcleo III: mínimo de 320h e pelo menos 10% da CH total
-        - Núcleo IV: mínimo de 400h
-        - CH total do curso: mínimo de 3200h
-        
-        **6. Exportar Relatórios**
-        
-        Na aba "Exportar", você pode gerar arquivos personalizados:
-        - **CSV**: Formato para migração no sistema SIGAA (UTF-8 com BOM, delimitador ponto e vírgula). Escolha qual tabela exportar (Componentes, Matriz ou Resumo por Núcleo).
-        - **XLSX**: Planilha Excel em que você define quais abas (Matriz, Resumo por Núcleo, Componentes) deseja incluir.
-        - **PDF**: Relatório A4 em orientação retrato, com ajuste automático de colunas e divisão visual por período. Selecione as seções que farão parte do arquivo.
-        
-        Após escolher o conteúdo desejado, clique no botão correspondente e em seguida em "Download" para salvar o arquivo.
-        
-        **7. Consultar Regras**
-        
-        A aba "Regras" contém todas as informações sobre:
-        - Cargas horárias mínimas por núcleo
-        - Regras de percentuais
-        - Associações obrigatórias
-        - Campos obrigatórios por núcleo
-        - Cálculo de carga horária
-        - Validações automáticas
-        """)
-        
-        st.subheader("Dicas Importantes")
-        st.markdown("""
-        - O sistema valida automaticamente as regras de conformidade. Preste atenção aos alertas 
-        vermelhos no painel lateral e corrija os problemas antes de exportar.
+    Acesse a aba "Cadastrar" e preencha o formulário para cada componente do curso:
+    
+    - **Semestre**: Informe em qual período o componente será oferecido (1 a 20)
+    - **Nome do Componente**: Digite o nome completo da disciplina, módulo, estágio, etc.
+    - **Tipo**: Selecione o tipo (Disciplina, Módulo, Bloco, Estágio, TCC, Extensão, Outro)
+    - **Carga Horária**: 
+      - Para Disciplinas: informe o número de aulas semanais (a CH total será calculada automaticamente: aulas × 18h)
+      - Para outros tipos: informe a CH total manualmente
+    - **Núcleo**: Selecione o núcleo curricular (I, II, III ou IV)
+    
+    Após selecionar o núcleo, clique em "Atualizar Informações" para ver os campos específicos:
+    
+    - **Núcleo I – Estudos de Formação Geral - EFG**: selecione pelo menos um dos temas previstos:
+      - a) princípios e fundamentos sociológicos, filosóficos, históricos e epistemológicos da educação;
+      - b) princípios, valores e atitudes comprometidos com a justiça social, reconhecimento, respeito e apreço à diversidade, promoção da participação, da equidade e da inclusão e gestão democrática;
+      - c) observação, análise, planejamento, desenvolvimento e avaliação de processos educativos, experiências pedagógicas e de situações de ensino e aprendizagem em instituições de Educação Básica;
+      - d) conhecimento multidimensional e interdisciplinar sobre o ser humano e práticas educativas, incluindo conhecimento de processos de desenvolvimento de crianças, adolescentes, jovens e adultos, nas dimensões física, cognitiva, afetiva, estética, cultural, lúdica, artística, ética e biopsicossocial;
+      - e) diagnóstico e análise das necessidades e aspirações dos diferentes segmentos da sociedade, relativas à educação, sendo capaz de identificar diferentes forças e interesses, de captar contradições e de considerá-los nos planos pedagógicos, no ensino e, consequentemente, nos processos de aprendizagem;
+      - f) pesquisa e estudo da legislação educacional, dos processos de organização e gestão do trabalho dos profissionais do magistério da educação escolar básica, das políticas de financiamento, da avaliação e do currículo;
+      - g) pesquisa e estudo das relações entre educação e trabalho, educação e diversidade, educação e comunicação, direitos humanos, cidadania, educação ambiental, entre outras problemáticas centrais da sociedade contemporânea;
+      - h) estudos de aspectos éticos, didáticos e comportamentais no contexto do exercício profissional, articulando o saber acadêmico, a pesquisa, a extensão e a prática educativa; e
+      - i) conhecimento sobre diferentes estratégias de planejamento e avaliação das aprendizagens, centradas no desenvolvimento pleno dos estudantes da Educação Básica.
+    - **Núcleo II (Formação Específica)**: Descreva a vinculação com as Diretrizes da área e informe manualmente a carga horária total do componente.
+    - **Núcleo III (Extensão)**: Descreva o vínculo com projeto extensionista. Toda a carga horária é registrada como Extensão e o tipo fica limitado a componentes extensionistas.
+    - **Núcleo IV (Estágios)**: Informe local de realização e etapa do estágio. Toda a carga horária é prática supervisionada e o tipo fica restrito a Estágio.
+    
+    Campos adicionais que podem ajudar nas análises:
+    - Distribuição Teórica/Prática (definida pelas caixas de seleção ao lado do formulário)
+    - Bloco (se o componente faz parte de um grupo)
+    - Observações
+    
+    Clique em "Adicionar Componente" para salvar.
+    
+    Para aproveitar uma matriz já exportada pelo sistema, use a aba "Importar": envie o CSV ou o XLSX
+    (aba "Componentes") e todos os componentes válidos são adicionados de uma vez.
+    
+    **2. Visualizar Componentes Cadastrados**
+    
+    Na aba "Componentes", você pode:
+    - Ver todos os componentes cadastrados
+    - Visualizar o resumo por semestre e núcleo
+    - Remover componentes se necessário (marque a coluna "Remover" e clique em "Remover selecionados")
+    
+    **3. Verificar a Matriz Curricular**
+    
+    A aba "Prévia - Matriz" mostra a organização completa do curso:
+    - Componentes organizados por período/semestre
+    - Linha "TOTAL DO PERÍODO" após cada semestre
+    - Resumo geral no rodapé (CH Total, CH Teórica, CH Prática, CH Extensão)
+    
+    **4. Analisar por Núcleo**
+    
+    A aba "Prévia - Por Núcleo" permite:
+    - Visualizar quadro-resumo de CH por semestre e núcleo
+    - Ver indicadores de conformidade (verde para conforme, vermelho para não conforme)
+    - Inspecionar detalhes de cada núcleo através dos expanders
+    
+    **5. Validar Conformidade**
+    
+    No painel lateral esquerdo, o sistema exibe em tempo real:
+    - Carga horária total do curso
+    - CH por núcleo com validação (verde/vermelho)
+    - Percentuais de extensão e prática pedagógica
+    - Status geral do curso
+    
+    Regras de validação:
+    - Núcleo I: mínimo de 880h
+    - Núcleo II: mínimo de 1600h
+    - Núcleo III: mínimo de 320h e pelo menos 10% da CH total
+    - Núcleo IV: mínimo de 400h
+    - CH total do curso: mínimo de 3200h
+    
+    **6. Exportar Relatórios**
+    
+    Na aba "Exportar", você pode gerar arquivos personalizados:
+    - **CSV**: Formato para migração no sistema SIGAA (UTF-8 com BOM, delimitador ponto e vírgula). Escolha qual tabela exportar (Componentes, Matriz ou Resumo por Núcleo).
+    - **XLSX**: Planilha Excel em que você define quais abas (Matriz, Resumo por Núcleo, Componentes) deseja incluir.
+    - **PDF**: Relatório A4 em orientação retrato, com ajuste automático de colunas e divisão visual por período. Selecione as seções que farão parte do arquivo.
+    
+    Após escolher o conteúdo desejado, clique no botão correspondente e em seguida em "Download" para salvar o arquivo.
+    
+    **7. Consultar Regras**
+    
+    A aba "Regras" contém todas as informações sobre:
+    - Cargas horárias mínimas por núcleo
+    - Regras de percentuais
+    - Associações obrigatórias
+    - Campos obrigatórios por núcleo
+    - Cálculo de carga horária
+    - Validações automáticas
+    """)
+    
+    st.subheader("Dicas Importantes")
+    st.markdown("""
+    - O sistema valida automaticamente as regras de conformidade. Preste atenção aos alertas 
+    vermelhos no painel lateral e corrija os problemas antes de exportar.
+    
+    - Para Disciplinas, o cálculo de CH é automático (aulas semanais × 18h). Para outros tipos, 
+    informe a CH total manualmente.
+    
+    - Componentes do tipo "Estágio" são automaticamente associados ao Núcleo IV.
+    
+    - Componentes com CH de Extensão maior que zero devem pertencer ao Núcleo III.
+    
+    - Cada alteração é salva automaticamente e o curso fica vinculado ao endereço (link) da 
+    página: guarde o link para retomar o trabalho. Para guardar uma cópia ou levar o curso 
+    para outro computador, faça o backup na aba "Exportar".
+    
+    - Use a visualização "Por Núcleo" para verificar se todos os núcleos estão preenchidos 
+    corretamente e se atingem os mínimos exigidos.
+    """)
+    
+    st.subheader("Ajuda Adicional")
+    st.markdown("""
+    Em caso de dúvidas sobre as regras e normas, consulte a aba "Regras" ou a documentação 
+    oficial da Resolução CNE/CP nº 4/2024.
+    
+    Para problemas técnicos ou sugestões, entre em contato com a coordenação do curso ou 
+    o suporte técnico da universidade.
+    """)
+
+
+def exibir_barra_lateral():
+    """Exibe o resumo de carga horária e as validações na barra lateral."""
+    st.header("Validações e Resumo")
+    
+    if st.session_state.componentes:
+        indicadores = calcular_indicadores(st.session_state.componentes)
+        ch_total = indicadores.ch_total
+        perc_extensao = indicadores.percentual_extensao
+        perc_pratica = indicadores.percentual_pratica
         
-        - Para Disciplinas, o cálculo de CH é automático (aulas semanais × 18h). Para outros tipos, 
-        informe a CH total manualmente.
+        st.subheader("Carga Horária Total")
+        st.metric("CH Total", f"{ch_total:.0f}h", delta="≥3200h mínimo" if ch_total >= 3200 else None, delta_color="normal")
         
-        - Componentes do tipo "Estágio" são automaticamente associados ao Núcleo IV.
+        st.subheader("CH por Núcleo")
         
-        - Componentes com CH de Extensão maior que zero devem pertencer ao Núcleo III.
+        for nucleo in ["I", "II", "III", "IV"]:
+            ch_atual = indicadores.ch_por_nucleo[nucleo]
+            ch_minima = obter_ch_minima_por_nucleo(nucleo)
+            valido, mensagem = validar_ch_minima_nucleo(ch_atual, ch_minima)
+            
+            if valido:
+                st.success(f"**Núcleo {nucleo}**: {mensagem}")
+            else:
+                st.error(f"**Núcleo {nucleo}**: {mensagem}")
         
-        - Os dados são mantidos apenas durante a sessão do navegador. Após fechar o navegador, 
-        os dados são perdidos. Sempre exporte os relatórios após concluir o cadastro.
+        st.subheader("Percentuais")
+        st.write(f"**Extensão:** {perc_extensao:.2f}% (mínimo 10%)")
+        if perc_extensao >= 10:
+            st.success("Conforme")
+        else:
+            st.error(f"Faltam {10 - perc_extensao:.2f}%")
         
-        - Use a visualização "Por Núcleo" para verificar se todos os núcleos estão preenchidos 
-        corretamente e se atingem os mínimos exigidos.
-        """)
+        st.write(f"**Prática Pedagógica:** {perc_pratica:.2f}%")
         
-        st.subheader("Ajuda Adicional")
-        st.markdown("""
-        Em caso de dúvidas sobre as regras e normas, consulte a aba "Regras" ou a documentação 
-        oficial da Resolução CNE/CP nº 4/2024.
+        # Validação resumida (sem mostrar todos os erros)
+        st.subheader("Status do Curso")
+        resultado_validacao = validar_curso_completo(st.session_state.componentes)
         
-        Para problemas técnicos ou sugestões, entre em contato com a coordenação do curso ou 
-        o suporte técnico da universidade.
-        """)
+        if resultado_validacao["valido"]:
+            st.success("Curso conforme com todas as normas")
+        else:
+            num_erros = len(resultado_validacao["erros"])
+            st.warning(f"Curso não conforme ({num_erros} problema(s) encontrado(s))")
+            st.caption("Os erros serão validados na exportação")
+    else:
+        st.info("Adicione componentes curriculares para ver o resumo e validações.")
+
+
+def exibir_exportacoes():
+    """Exibe o backup/restauração e a exportação de relatórios."""
+    st.header("Exportar Relatórios e Backup")
     
-    with st.sidebar:
-        st.header("Validações e Resumo")
-        
-        if st.session_state.componentes:
-            ch_total = calcular_ch_total_curso(st.session_state.componentes)
-            ch_i = calcular_ch_por_nucleo(st.session_state.componentes, "I")
-            ch_ii = calcular_ch_por_nucleo(st.session_state.componentes, "II")
-            ch_iii = calcular_ch_por_nucleo(st.session_state.componentes, "III")
-            ch_iv = calcular_ch_por_nucleo(st.session_state.componentes, "IV")
-            perc_extensao = calcular_percentual_extensao(st.session_state.componentes)
-            perc_pratica = calcular_percentual_pratica_pedagogica(st.session_state.componentes)
-            
-            st.subheader("Carga Horária Total")
-            st.metric("CH Total", f"{ch_total:.0f}h", delta="≥3200h mínimo" if ch_total >= 3200 else None, delta_color="normal")
-            
-            st.subheader("CH por Núcleo")
-            
-            for nucleo in ["I", "II", "III", "IV"]:
-                ch_atual = calcular_ch_por_nucleo(st.session_state.componentes, nucleo)
-                ch_minima = obter_ch_minima_por_nucleo(nucleo)
-                valido, mensagem = validar_ch_minima_nucleo(ch_atual, ch_minima)
+    st.subheader("Backup e Restauração de Dados")
+    if persistencia_habilitada():
+        st.info("**Importante**: Os dados são salvos automaticamente neste servidor e ficam vinculados ao endereço (link) desta página. Use o backup para guardar uma cópia ou levar o curso para outro computador.")
+    else:
+        st.info("**Importante**: Faça backup regularmente dos seus dados! Os dados são mantidos apenas durante a sessão do navegador. Use os botões abaixo para salvar e restaurar seus dados.")
+    
+    col_backup1, col_backup2 = st.columns(2)
+    
+    with col_backup1:
+        st.markdown("**Fazer Backup (Salvar Dados)**")
+        st.caption("Baixe um arquivo JSON com todos os componentes cadastrados para guardar em segurança.")
+        if st.button("Exportar Backup JSON", key="btn_backup", type="primary"):
+            if st.session_state.componentes:
+                backup_json = exportar_backup_json(st.session_state.componentes.para_lista(), st.session_state.ultimo_id)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                nome_arquivo = f"backup_componentes_{timestamp}.json"
                 
-                if valido:
-                    st.success(f"**Núcleo {nucleo}**: {mensagem}")
-                else:
-                    st.error(f"**Núcleo {nucleo}**: {mensagem}")
-            
-            st.subheader("Percentuais")
-            st.write(f"**Extensão:** {perc_extensao:.2f}% (mínimo 10%)")
-            if perc_extensao >= 10:
-                st.success("Conforme")
-            else:
-                st.error(f"Faltam {10 - perc_extensao:.2f}%")
-            
-            st.write(f"**Prática Pedagógica:** {perc_pratica:.2f}%")
-            
-            # Validação resumida (sem mostrar todos os erros)
-            st.subheader("Status do Curso")
-            resultado_validacao = validar_curso_completo(st.session_state.componentes)
-            
-            if resultado_validacao["valido"]:
-                st.success("Curso conforme com todas as normas")
+                st.success("Backup gerado com sucesso!")
+                st.download_button(
+                    label="Download Backup JSON",
+                    data=backup_json,
+                    file_name=nome_arquivo,
+                    mime="application/json",
+                    key="dl_backup"
+                )
             else:
-                num_erros = len(resultado_validacao["erros"])
-                st.warning(f"Curso não conforme ({num_erros} problema(s) encontrado(s))")
-                st.caption("Os erros serão validados na exportação")
-        else:
-            st.info("Adicione componentes curriculares para ver o resumo e validações.")
+                st.warning("Não há componentes cadastrados para fazer backup.")
+        
+        diario = obter_diario()
+        st.caption(
+            "O backup incremental contém apenas as alterações feitas desde o último backup completo "
+            f"({diario.operacoes_pendentes} operação(ões)). O primeiro da sequência, e um a cada "
+            f"{diario.limite_compactacao} operações, é completo. Para restaurar, envie o último backup completo "
+            "junto com o incremental mais recente gerado depois dele."
+        )
+        if st.button("Exportar Backup Incremental", key="btn_backup_incremental"):
+            backup_json, completo = diario.exportar_backup(st.session_state.ultimo_id)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            tipo_backup = "completo" if completo else "incremental"
+            st.success(f"Backup {tipo_backup} gerado com sucesso!")
+            st.download_button(
+                label=f"Download Backup ({tipo_backup})",
+                data=backup_json,
+                file_name=f"backup_{tipo_backup}_{diario.linhagem}_{diario.seq:06d}_{timestamp}.json",
+                mime="application/json",
+                key="dl_backup_incremental"
+            )
     
-    with tab6:
-        st.header("Exportar Relatórios e Backup")
-        
-        st.subheader("Backup e Restauração de Dados")
-        st.info("**Importante**: Faça backup regularmente dos seus dados! Os dados são mantidos apenas durante a sessão do navegador. Use os botões abaixo para salvar e restaurar seus dados.")
-        
-        col_backup1, col_backup2 = st.columns(2)
-        
-        with col_backup1:
-            st.markdown("**Fazer Backup (Salvar Dados)**")
-            st.caption("Baixe um arquivo JSON com todos os componentes cadastrados para guardar em segurança.")
-            if st.button("Exportar Backup JSON", key="btn_backup", type="primary"):
-                if st.session_state.componentes:
-                    backup_json = exportar_backup_json(st.session_state.componentes, st.session_state.ultimo_id)
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    nome_arquivo = f"backup_componentes_{timestamp}.json"
-                    
-                    st.success("Backup gerado com sucesso!")
-                    st.download_button(
-                        label="Download Backup JSON",
-                        data=backup_json,
-                        file_name=nome_arquivo,
-                        mime="application/json",
-                        key="dl_backup"
-                    )
+    with col_backup2:
+        st.markdown("**Restaurar Backup (Carregar Dados)**")
+        st.caption("Faça upload de um arquivo JSON de backup anterior para restaurar seus dados. Para backups incrementais, selecione o backup completo e o incremental mais recente.")
+        arquivos_backup = st.file_uploader(
+            "Selecione o arquivo JSON de backup",
+            type=["json"],
+            key="upload_backup",
+            accept_multiple_files=True,
+            help="Selecione um arquivo de backup gerado anteriormente pelo sistema"
+        )
+        
+        if arquivos_backup:
+            try:
+                conteudos = [(arquivo.name, arquivo.read().decode("utf-8")) for arquivo in arquivos_backup]
+                componentes_restaurados, ultimo_id_restaurado, sucesso, mensagem = restaurar_cadeia(conteudos)
+                
+                if sucesso:
+                    st.success(mensagem)
+                    if st.button("Restaurar Dados", key="btn_restaurar", type="primary"):
+                        carregar_curso_na_sessao(componentes_restaurados, ultimo_id_restaurado)
+                        st.success("Dados restaurados com sucesso! Os componentes foram carregados.")
+                        st.rerun()
                 else:
-                    st.warning("Não há componentes cadastrados para fazer backup.")
-        
-        with col_backup2:
-            st.markdown("**Restaurar Backup (Carregar Dados)**")
-            st.caption("Faça upload de um arquivo JSON de backup anterior para restaurar seus dados.")
-            arquivo_backup = st.file_uploader(
-                "Selecione o arquivo JSON de backup",
-                type=["json"],
-                key="upload_backup",
-                help="Selecione um arquivo de backup gerado anteriormente pelo sistema"
+                    st.error(mensagem)
+            except Exception as e:
+                st.error(f"Erro ao processar arquivo: {str(e)}")
+    
+    st.markdown("---")
+    st.subheader("Exportar Relatórios")
+    
+    if not st.session_state.componentes:
+        st.warning("Adicione pelo menos um componente antes de exportar relatórios.")
+        st.info("Use a aba 'Cadastrar' para adicionar componentes curriculares.")
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        st.info("**Como exportar**: Selecione abaixo quais tabelas ou seções deseja gerar em cada formato. Os arquivos são gerados em memória e ficam disponíveis para download imediato.")
+        
+        col_exp1, col_exp2, col_exp3 = st.columns(3)
+        
+        csv_opcoes = {
+            "Componentes (formato SIGAA)": "componentes",
+            "Matriz Curricular por Período": "matriz",
+            "Resumo por Semestre e Núcleo": "resumo_nucleo"
+        }
+        with col_exp1:
+            st.subheader("CSV (Migração SIGAA)")
+            st.caption("Escolha qual tabela gerar em CSV. Codificação UTF-8 com BOM e delimitador ponto e vírgula.")
+            csv_label = st.selectbox(
+                "Tabela para exportar em CSV",
+                list(csv_opcoes.keys()),
+                key="export_csv_select",
+                help="O CSV é gerado individualmente para cada tabela."
             )
-            
-            if arquivo_backup is not None:
-                try:
-                    conteudo = arquivo_backup.read().decode("utf-8")
-                    componentes_restaurados, ultimo_id_restaurado, sucesso, mensagem = importar_backup_json(conteudo)
-                    
-                    if sucesso:
-                        st.success(mensagem)
-                        if st.button("Restaurar Dados", key="btn_restaurar", type="primary"):
-                            st.session_state.componentes = componentes_restaurados
-                            st.session_state.ultimo_id = ultimo_id_restaurado
-                            st.success("Dados restaurados com sucesso! Os componentes foram carregados.")
-                            st.rerun()
-                    else:
-                        st.error(mensagem)
-                except Exception as e:
-                    st.error(f"Erro ao processar arquivo: {str(e)}")
-        
-        st.markdown("---")
-        st.subheader("Exportar Relatórios")
-        
-        if not st.session_state.componentes:
-            st.warning("Adicione pelo menos um componente antes de exportar relatórios.")
-            st.info("Use a aba 'Cadastrar' para adicionar componentes curriculares.")
-        else:
-            os.makedirs("exportacoes", exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            st.info("**Como exportar**: Selecione abaixo quais tabelas ou seções deseja gerar em cada formato. Os arquivos são salvos em `exportacoes/` e ficam disponíveis para download imediato.")
-            
-            col_exp1, col_exp2, col_exp3 = st.columns(3)
-            
-            csv_opcoes = {
-                "Componentes (formato SIGAA)": "componentes",
-                "Matriz Curricular por Período": "matriz",
-                "Resumo por Semestre e Núcleo": "resumo_nucleo"
-            }
-            with col_exp1:
-                st.subheader("CSV (Migração SIGAA)")
-                st.caption("Escolha qual tabela gerar em CSV. Codificação UTF-8 com BOM e delimitador ponto e vírgula.")
-                csv_label = st.selectbox(
-                    "Tabela para exportar em CSV",
-                    list(csv_opcoes.keys()),
-                    key="export_csv_select",
-                    help="O CSV é gerado individualmente para cada tabela."
-                )
-                if st.button("Gerar CSV selecionado", key="btn_csv"):
-                    tabela_csv = csv_opcoes[csv_label]
-                    nome_csv = f"{tabela_csv}_{timestamp}.csv"
-                    caminho_csv = os.path.join("exportacoes", nome_csv)
-                    exportar_csv(st.session_state.componentes, caminho_csv, tabela=tabela_csv)
-                    st.success(f"Arquivo CSV '{csv_label}' gerado!")
-                    
-                    with open(caminho_csv, "rb") as f:
-                        st.download_button(
-                            label=f"Download CSV ({csv_label})",
-                            data=f.read(),
-                            file_name=nome_csv,
-                            mime="text/csv",
-                            key=f"dl_csv_{timestamp}_{tabela_csv}"
-                        )
-            
-            abas_opcoes = {
-                "Matriz Curricular": "matriz",
-                "Resumo por Núcleo": "resumo_nucleo",
-                "Lista de Componentes": "componentes"
-            }
-            with col_exp2:
-                st.subheader("XLSX (Planilha)")
-                st.caption("Selecione as abas que deseja incluir na planilha Excel.")
-                abas_escolhidas = st.multiselect(
-                    "Abas da planilha",
-                    list(abas_opcoes.keys()),
-                    default=list(abas_opcoes.keys()),
-                    key="export_xlsx_multiselect",
-                    help="Escolha ao menos uma aba para montar a planilha."
-                )
+            if st.button("Gerar CSV selecionado", key="btn_csv"):
+                tabela_csv = csv_opcoes[csv_label]
+                nome_csv = f"{tabela_csv}_{timestamp}.csv"
+                dados_csv, do_cache = exportar_com_cache("csv", st.session_state.componentes, tabela_csv)
+                st.success(f"Arquivo CSV '{csv_label}' gerado!")
+                if do_cache:
+                    st.caption(MENSAGEM_EXPORTACAO_CACHE)
                 
-                if st.button("Gerar XLSX selecionado", key="btn_xlsx"):
-                    if not abas_escolhidas:
-                        st.warning("Selecione ao menos uma aba para gerar a planilha XLSX.")
-                    else:
-                        abas_codigos = [abas_opcoes[label] for label in abas_escolhidas]
-                        slug_abas = "-".join(abas_codigos)
-                        nome_xlsx = f"planilha_{slug_abas}_{timestamp}.xlsx"
-                        caminho_xlsx = os.path.join("exportacoes", nome_xlsx)
-                        exportar_xlsx(st.session_state.componentes, caminho_xlsx, abas=abas_codigos)
-                        st.success("Arquivo XLSX gerado com as abas selecionadas!")
-                        
-                        with open(caminho_xlsx, "rb") as f:
-                            st.download_button(
-                                label="Download XLSX",
-                                data=f.read(),
-                                file_name=nome_xlsx,
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                key=f"dl_xlsx_{timestamp}_{slug_abas}"
-                            )
-            
-            secoes_opcoes = {
-                "Matriz Curricular por Período": "matriz",
-                "Quadro-Resumo por Núcleo": "resumo_nucleo",
-                "Resumo Geral do Curso": "resumo_geral",
-                "Resumo de Conformidade": "conformidade"
-            }
-            with col_exp3:
-                st.subheader("PDF (Relatório)")
-                st.caption("Selecione as seções do relatório PDF. O arquivo é gerado em formato A4 retrato, com colunas ajustadas e divisão visual por período.")
-                secoes_escolhidas = st.multiselect(
-                    "Seções do relatório",
-                    list(secoes_opcoes.keys()),
-                    default=list(secoes_opcoes.keys()),
-                    key="export_pdf_multiselect",
-                    help="Escolha as seções que deseja incluir no PDF."
+                st.download_button(
+                    label=f"Download CSV ({csv_label})",
+                    data=dados_csv,
+                    file_name=nome_csv,
+                    mime="text/csv",
+                    key=f"dl_csv_{timestamp}_{tabela_csv}"
                 )
-                
-                if st.button("Gerar PDF selecionado", key="btn_pdf"):
-                    if not secoes_escolhidas:
-                        st.warning("Selecione ao menos uma seção para gerar o PDF.")
-                    else:
-                        secoes_codigos = [secoes_opcoes[label] for label in secoes_escolhidas]
-                        slug_secoes = "-".join(secoes_codigos)
-                        nome_pdf = f"relatorio_{slug_secoes}_{timestamp}.pdf"
-                        caminho_pdf = os.path.join("exportacoes", nome_pdf)
-                        exportar_pdf(st.session_state.componentes, caminho_pdf, secoes=secoes_codigos)
-                        st.success("Arquivo PDF gerado com as seções selecionadas!")
-                        
-                        with open(caminho_pdf, "rb") as f:
-                            st.download_button(
-                                label="Download PDF",
-                                data=f.read(),
-                                file_name=nome_pdf,
-                                mime="application/pdf",
-                                key=f"dl_pdf_{timestamp}_{slug_secoes}"
-                            )
-    
-    with tab7:
-        exibir_regras_ppc()
-    
-    with tab2:
-        st.header("Cadastro de Componente Curricular")
-        st.info("**Como preencher**: Preencha os campos obrigatórios (marcados com *). Selecione o tipo de componente e o núcleo. As cargas teórica e prática são definidas pelas caixas de seleção ao lado do formulário (por padrão, a carga é teórica). Nos núcleos III e IV a alocação é automática (Extensão e Prática, respectivamente). O sistema valida automaticamente as regras de conformidade.")
         
-        if st.session_state.get("limpar_formulario", False):
-            valores_limpos = st.session_state.get("valores_limpos", {})
-            for key, value in valores_limpos.items():
-                if key in st.session_state:
-                    del st.session_state[key]
-            if "limpar_formulario" in st.session_state:
-                del st.session_state["limpar_formulario"]
-            if "valores_limpos" in st.session_state:
-                del st.session_state["valores_limpos"]
-            st.rerun()
-        
-        for key in ["form_semestre", "form_nome", "form_tipo", "form_aulas_semanais", "form_ch_manual", 
-                   "form_ch_teorica", "form_ch_pratica", "form_ch_extensao", "form_nucleo", 
-                   "form_temas_nucleo_i", "form_diretrizes_nucleo_ii", "form_descricao_extensao",
-                   "form_local_realizacao", "form_etapa_estagio_opcao", "form_etapa_estagio_outro",
-                   "form_bloco", "form_observacoes", "form_nucleo_selecionado", "form_ch_preview",
-                   "form_marca_teorica", "form_marca_pratica", "form_ch_teorica_manual"]:
-            if key not in st.session_state:
-                if key == "form_semestre":
-                    st.session_state[key] = 1
-                elif key == "form_aulas_semanais":
-                    st.session_state[key] = 2  # Valor padrão para disciplinas
-                elif key in ["form_ch_manual", "form_ch_teorica", 
-                            "form_ch_pratica", "form_ch_extensao", "form_ch_preview", "form_ch_teorica_manual"]:
-                    st.session_state[key] = 0.0
-                elif key == "form_marca_teorica":
-                    st.session_state[key] = True
-                elif key == "form_marca_pratica":
-                    st.session_state[key] = False
-                elif key == "form_temas_nucleo_i":
-                    st.session_state[key] = []
-                elif key in ["form_nucleo_selecionado", "form_nucleo", "form_etapa_estagio_opcao"]:
-                    st.session_state[key] = ""
-                else:
-                    st.session_state[key] = ""
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            semestre = st.number_input(
-                "Semestre *",
-                min_value=1,
-                max_value=20,
-                step=1,
-                key="form_semestre"
+        abas_opcoes = {
+            "Matriz Curricular": "matriz",
+            "Resumo por Núcleo": "resumo_nucleo",
+            "Lista de Componentes": "componentes"
+        }
+        with col_exp2:
+            st.subheader("XLSX (Planilha)")
+            st.caption("Selecione as abas que deseja incluir na planilha Excel.")
+            abas_escolhidas = st.multiselect(
+                "Abas da planilha",
+                list(abas_opcoes.keys()),
+                default=list(abas_opcoes.keys()),
+                key="export_xlsx_multiselect",
+                help="Escolha ao menos uma aba para montar a planilha."
             )
             
-            nome = st.text_input(
-                "Nome do Componente *",
-                placeholder="Ex: Didática Geral",
-                key="form_nome"
-            )
-            
-            nucleo_opcoes = ["I", "II", "III", "IV"]
-            nucleo_index = 0
-            if st.session_state.form_nucleo in nucleo_opcoes:
-                nucleo_index = nucleo_opcoes.index(st.session_state.form_nucleo)
-            
-            nucleo = st.selectbox(
-                "Núcleo *",
-                options=nucleo_opcoes,
-                index=nucleo_index,
-                key="form_nucleo"
-            )
-            
-            tipos_disponiveis = TIPOS_POR_NUCLEO.get(nucleo, TIPOS_COMPONENTES)
-            if not tipos_disponiveis:
-                tipos_disponiveis = TIPOS_COMPONENTES
-            
-            if st.session_state.form_tipo not in tipos_disponiveis:
-                st.session_state.form_tipo = tipos_disponiveis[0]
-            
-            tipo = st.selectbox(
-                "Tipo de Componente *",
-                options=tipos_disponiveis,
-                key="form_tipo"
+            if st.button("Gerar XLSX selecionado", key="btn_xlsx"):
+                if not abas_escolhidas:
+                    st.warning("Selecione ao menos uma aba para gerar a planilha XLSX.")
+                else:
+                    abas_codigos = [abas_opcoes[label] for label in abas_escolhidas]
+                    slug_abas = "-".join(abas_codigos)
+                    nome_xlsx = f"planilha_{slug_abas}_{timestamp}.xlsx"
+                    dados_xlsx, do_cache = exportar_com_cache("xlsx", st.session_state.componentes, abas_codigos)
+                    st.success("Arquivo XLSX gerado com as abas selecionadas!")
+                    if do_cache:
+                        st.caption(MENSAGEM_EXPORTACAO_CACHE)
+                    
+                    st.download_button(
+                        label="Download XLSX",
+                        data=dados_xlsx,
+                        file_name=nome_xlsx,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        key=f"dl_xlsx_{timestamp}_{slug_abas}"
+                    )
+        
+        secoes_opcoes = {
+            "Matriz Curricular por Período": "matriz",
+            "Quadro-Resumo por Núcleo": "resumo_nucleo",
+            "Resumo Geral do Curso": "resumo_geral",
+            "Resumo de Conformidade": "conformidade"
+        }
+        with col_exp3:
+            st.subheader("PDF (Relatório)")
+            st.caption("Selecione as seções do relatório PDF. O arquivo é gerado em formato A4 retrato, com colunas ajustadas e divisão visual por período.")
+            secoes_escolhidas = st.multiselect(
+                "Seções do relatório",
+                list(secoes_opcoes.keys()),
+                default=list(secoes_opcoes.keys()),
+                key="export_pdf_multiselect",
+                help="Escolha as seções que deseja incluir no PDF."
             )
             
-            ch_total_calc = 0.0
-            if tipo == "Disciplina":
-                aulas_semanais = st.number_input(
-                    "Número de Aulas Semanais *",
-                    min_value=1,
-                    max_value=10,
-                    step=1,
-                    key="form_aulas_semanais"
-                )
-                if nucleo == "II":
-                    ch_manual = st.number_input(
-                        "CH Total (horas) *",
-                        min_value=0.0,
-                        step=1.0,
-                        key="form_ch_manual"
-                    )
-                    ch_total_calc = ch_manual
+            if st.button("Gerar PDF selecionado", key="btn_pdf"):
+                if not secoes_escolhidas:
+                    st.warning("Selecione ao menos uma seção para gerar o PDF.")
                 else:
-                    ch_total_calc = calcular_ch_total(tipo, int(aulas_semanais))
+                    secoes_codigos = [secoes_opcoes[label] for label in secoes_escolhidas]
+                    slug_secoes = "-".join(secoes_codigos)
+                    nome_pdf = f"relatorio_{slug_secoes}_{timestamp}.pdf"
+                    dados_pdf, do_cache = exportar_com_cache("pdf", st.session_state.componentes, secoes_codigos)
+                    st.success("Arquivo PDF gerado com as seções selecionadas!")
+                    if do_cache:
+                        st.caption(MENSAGEM_EXPORTACAO_CACHE)
+                    
+                    st.download_button(
+                        label="Download PDF",
+                        data=dados_pdf,
+                        file_name=nome_pdf,
+                        mime="application/pdf",
+                        key=f"dl_pdf_{timestamp}_{slug_secoes}"
+                    )
+
+
+@st.fragment
+def exibir_cadastro():
+    """
+    Exibe o formulário de cadastro de componente.
+
+    Como fragmento, a edição dos campos executa apenas o formulário; adicionar
+    um componente executa o app inteiro, atualizando a barra lateral.
+    """
+    st.header("Cadastro de Componente Curricular")
+    st.info("**Como preencher**: Preencha os campos obrigatórios (marcados com *). Selecione o tipo de componente e o núcleo. As cargas teórica e prática são definidas pelas caixas de seleção ao lado do formulário (por padrão, a carga é teórica). Nos núcleos III e IV a alocação é automática (Extensão e Prática, respectivamente). O sistema valida automaticamente as regras de conformidade.")
+    
+    if st.session_state.get("limpar_formulario", False):
+        valores_limpos = st.session_state.get("valores_limpos", {})
+        for key, value in valores_limpos.items():
+            if key in st.session_state:
+                del st.session_state[key]
+        if "limpar_formulario" in st.session_state:
+            del st.session_state["limpar_formulario"]
+        if "valores_limpos" in st.session_state:
+            del st.session_state["valores_limpos"]
+        st.rerun()
+    
+    for key in ["form_semestre", "form_nome", "form_tipo", "form_aulas_semanais", "form_ch_manual", 
+               "form_ch_teorica", "form_ch_pratica", "form_ch_extensao", "form_nucleo", 
+               "form_temas_nucleo_i", "form_diretrizes_nucleo_ii", "form_descricao_extensao",
+               "form_local_realizacao", "form_etapa_estagio_opcao", "form_etapa_estagio_outro",
+               "form_bloco", "form_observacoes", "form_nucleo_selecionado", "form_ch_preview",
+               "form_marca_teorica", "form_marca_pratica", "form_ch_teorica_manual"]:
+        if key not in st.session_state:
+            if key == "form_semestre":
+                st.session_state[key] = 1
+            elif key == "form_aulas_semanais":
+                st.session_state[key] = 2  # Valor padrão para disciplinas
+            elif key in ["form_ch_manual", "form_ch_teorica", 
+                        "form_ch_pratica", "form_ch_extensao", "form_ch_preview", "form_ch_teorica_manual"]:
+                st.session_state[key] = 0.0
+            elif key == "form_marca_teorica":
+                st.session_state[key] = True
+            elif key == "form_marca_pratica":
+                st.session_state[key] = False
+            elif key == "form_temas_nucleo_i":
+                st.session_state[key] = []
+            elif key in ["form_nucleo_selecionado", "form_nucleo", "form_etapa_estagio_opcao"]:
+                st.session_state[key] = ""
             else:
+                st.session_state[key] = ""
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        semestre = st.number_input(
+            "Semestre *",
+            min_value=1,
+            max_value=20,
+            step=1,
+            key="form_semestre"
+        )
+        
+        nome = st.text_input(
+            "Nome do Componente *",
+            placeholder="Ex: Didática Geral",
+            key="form_nome"
+        )
+        
+        nucleo_opcoes = ["I", "II", "III", "IV"]
+        nucleo_index = 0
+        if st.session_state.form_nucleo in nucleo_opcoes:
+            nucleo_index = nucleo_opcoes.index(st.session_state.form_nucleo)
+        
+        nucleo = st.selectbox(
+            "Núcleo *",
+            options=nucleo_opcoes,
+            index=nucleo_index,
+            key="form_nucleo"
+        )
+        
+        tipos_disponiveis = TIPOS_POR_NUCLEO.get(nucleo, TIPOS_COMPONENTES)
+        if not tipos_disponiveis:
+            tipos_disponiveis = TIPOS_COMPONENTES
+        
+        if st.session_state.form_tipo not in tipos_disponiveis:
+            st.session_state.form_tipo = tipos_disponiveis[0]
+        
+        tipo = st.selectbox(
+            "Tipo de Componente *",
+            options=tipos_disponiveis,
+            key="form_tipo"
+        )
+        
+        ch_total_calc = 0.0
+        if tipo == "Disciplina":
+            aulas_semanais = st.number_input(
+                "Número de Aulas Semanais *",
+                min_value=1,
+                max_value=10,
+                step=1,
+                key="form_aulas_semanais"
+            )
+            if nucleo == "II":
                 ch_manual = st.number_input(
                     "CH Total (horas) *",
                     min_value=0.0,
@@ -1007,485 +1229,731 @@ def main():
                     key="form_ch_manual"
                 )
                 ch_total_calc = ch_manual
-            
+            else:
+                ch_total_calc = calcular_ch_total(tipo, int(aulas_semanais))
+        else:
+            ch_manual = st.number_input(
+                "CH Total (horas) *",
+                min_value=0.0,
+                step=1.0,
+                key="form_ch_manual"
+            )
+            ch_total_calc = ch_manual
+        
+        st.session_state.form_ch_preview = ch_total_calc
+        
+        atualizar_info = st.button("Atualizar Informações", type="primary", use_container_width=True)
+        if atualizar_info:
+            st.session_state.form_nucleo_selecionado = nucleo
             st.session_state.form_ch_preview = ch_total_calc
-            
-            atualizar_info = st.button("Atualizar Informações", type="primary", use_container_width=True)
-            if atualizar_info:
-                st.session_state.form_nucleo_selecionado = nucleo
-                st.session_state.form_ch_preview = ch_total_calc
-                st.rerun()
-            
-            st.markdown("---")
-            st.subheader("Preview da Carga Horária")
-            delta_msg = "Disciplina: Aulas Semanais × 18h" if tipo == "Disciplina" and nucleo != "II" else "CH informada manualmente"
-            st.metric("CH Total do Componente", f"{st.session_state.form_ch_preview:.0f}h", 
-                     delta=delta_msg,
-                     delta_color="normal")
-            if tipo == "Disciplina" and nucleo == "II":
-                st.caption("Para componentes do Núcleo II, informe manualmente a carga horária total.")
-            elif tipo != "Disciplina":
-                st.caption("Para tipos diferentes de disciplina, informe manualmente a carga horária total.")
+            st.rerun()
         
-        with col2:
-            carga_total = st.session_state.form_ch_preview
+        st.markdown("---")
+        st.subheader("Preview da Carga Horária")
+        delta_msg = "Disciplina: Aulas Semanais × 18h" if tipo == "Disciplina" and nucleo != "II" else "CH informada manualmente"
+        st.metric("CH Total do Componente", f"{st.session_state.form_ch_preview:.0f}h", 
+                 delta=delta_msg,
+                 delta_color="normal")
+        if tipo == "Disciplina" and nucleo == "II":
+            st.caption("Para componentes do Núcleo II, informe manualmente a carga horária total.")
+        elif tipo != "Disciplina":
+            st.caption("Para tipos diferentes de disciplina, informe manualmente a carga horária total.")
+    
+    with col2:
+        carga_total = st.session_state.form_ch_preview
+        ch_teorica_calc = 0.0
+        ch_pratica_calc = 0.0
+        ch_extensao_calc = 0.0
+        
+        if nucleo == "III":
+            st.session_state.form_marca_teorica = False
+            st.session_state.form_marca_pratica = False
+            st.session_state.form_ch_teorica_manual = 0.0
             ch_teorica_calc = 0.0
             ch_pratica_calc = 0.0
+            ch_extensao_calc = carga_total
+            st.info("No Núcleo III, toda a carga horária do componente é contabilizada como Extensão.")
+        elif nucleo == "IV":
+            st.session_state.form_marca_teorica = False
+            st.session_state.form_marca_pratica = True
+            st.session_state.form_ch_teorica_manual = 0.0
+            ch_teorica_calc = 0.0
+            ch_pratica_calc = carga_total
             ch_extensao_calc = 0.0
+            st.info("No Núcleo IV, a carga horária é integralmente prática supervisionada.")
+        else:
+            st.session_state.form_ch_extensao = 0.0
             
-            if nucleo == "III":
-                st.session_state.form_marca_teorica = False
+            st.checkbox(
+                "Carga horária teórica",
+                key="form_marca_teorica",
+                help="Marque se a carga horária deve ser alocada como Teórica."
+            )
+            st.checkbox(
+                "Carga horária prática",
+                key="form_marca_pratica",
+                help="Marque se a carga horária deve ser alocada como Prática."
+            )
+            marca_teorica = st.session_state.form_marca_teorica
+            marca_pratica = st.session_state.form_marca_pratica
+            
+            if not (marca_teorica or marca_pratica):
+                st.warning("Selecione ao menos uma classificação. A opção Teórica será marcada por padrão.")
+                st.session_state.form_marca_teorica = True
                 st.session_state.form_marca_pratica = False
-                st.session_state.form_ch_teorica_manual = 0.0
-                ch_teorica_calc = 0.0
+                marca_teorica = True
+                marca_pratica = False
+            
+            if marca_teorica and marca_pratica:
+                valor_manual = st.number_input(
+                    "Defina a carga horária Teórica (a Prática será o restante)",
+                    min_value=0.0,
+                    step=1.0,
+                    key="form_ch_teorica_manual"
+                )
+                if valor_manual > carga_total:
+                    st.warning("A carga teórica não pode exceder a carga total do componente.")
+                    valor_manual = carga_total
+                ch_teorica_calc = valor_manual
+                ch_pratica_calc = max(carga_total - valor_manual, 0.0)
+            elif marca_teorica:
+                ch_teorica_calc = carga_total
                 ch_pratica_calc = 0.0
-                ch_extensao_calc = carga_total
-                st.info("No Núcleo III, toda a carga horária do componente é contabilizada como Extensão.")
-            elif nucleo == "IV":
-                st.session_state.form_marca_teorica = False
-                st.session_state.form_marca_pratica = True
-                st.session_state.form_ch_teorica_manual = 0.0
+            else:
                 ch_teorica_calc = 0.0
                 ch_pratica_calc = carga_total
-                ch_extensao_calc = 0.0
-                st.info("No Núcleo IV, a carga horária é integralmente prática supervisionada.")
-            else:
-                st.session_state.form_ch_extensao = 0.0
-                
-                st.checkbox(
-                    "Carga horária teórica",
-                    key="form_marca_teorica",
-                    help="Marque se a carga horária deve ser alocada como Teórica."
-                )
-                st.checkbox(
-                    "Carga horária prática",
-                    key="form_marca_pratica",
-                    help="Marque se a carga horária deve ser alocada como Prática."
+        st.session_state.form_ch_teorica = ch_teorica_calc
+        st.session_state.form_ch_pratica = ch_pratica_calc
+        st.session_state.form_ch_extensao = ch_extensao_calc
+        
+        st.caption(
+            f"Distribuição atual: {ch_teorica_calc:.0f}h Teórica | {ch_pratica_calc:.0f}h Prática | {ch_extensao_calc:.0f}h Extensão"
+        )
+        
+        if "form_faz_parte_bloco" not in st.session_state:
+            st.session_state.form_faz_parte_bloco = False
+        
+        faz_parte_bloco = st.checkbox(
+            "Faz parte de um Bloco?",
+            value=st.session_state.form_faz_parte_bloco,
+            key="form_faz_parte_bloco",
+            help="Marque se este componente faz parte de um bloco (grupo de disciplinas/módulos)"
+        )
+        
+        if faz_parte_bloco:
+            bloco = st.text_input(
+                    "Nome do Bloco *",
+                    placeholder="Ex: Bloco Temático I, Módulo Integrador",
+                    value=st.session_state.form_bloco if "form_bloco" in st.session_state else "",
+                    key="form_bloco",
+                    help="Informe o nome do bloco ao qual este componente pertence"
                 )
-                marca_teorica = st.session_state.form_marca_teorica
-                marca_pratica = st.session_state.form_marca_pratica
-                
-                if not (marca_teorica or marca_pratica):
-                    st.warning("Selecione ao menos uma classificação. A opção Teórica será marcada por padrão.")
-                    st.session_state.form_marca_teorica = True
-                    st.session_state.form_marca_pratica = False
-                    marca_teorica = True
-                    marca_pratica = False
-                
-                if marca_teorica and marca_pratica:
-                    valor_manual = st.number_input(
-                        "Defina a carga horária Teórica (a Prática será o restante)",
-                        min_value=0.0,
-                        step=1.0,
-                        key="form_ch_teorica_manual"
-                    )
-                    if valor_manual > carga_total:
-                        st.warning("A carga teórica não pode exceder a carga total do componente.")
-                        valor_manual = carga_total
-                    ch_teorica_calc = valor_manual
-                    ch_pratica_calc = max(carga_total - valor_manual, 0.0)
-                elif marca_teorica:
-                    ch_teorica_calc = carga_total
-                    ch_pratica_calc = 0.0
-                else:
-                    ch_teorica_calc = 0.0
-                    ch_pratica_calc = carga_total
-            st.session_state.form_ch_teorica = ch_teorica_calc
-            st.session_state.form_ch_pratica = ch_pratica_calc
-            st.session_state.form_ch_extensao = ch_extensao_calc
-            
-            st.caption(
-                f"Distribuição atual: {ch_teorica_calc:.0f}h Teórica | {ch_pratica_calc:.0f}h Prática | {ch_extensao_calc:.0f}h Extensão"
-            )
-            
-            if "form_faz_parte_bloco" not in st.session_state:
-                st.session_state.form_faz_parte_bloco = False
-            
-            faz_parte_bloco = st.checkbox(
-                "Faz parte de um Bloco?",
-                value=st.session_state.form_faz_parte_bloco,
-                key="form_faz_parte_bloco",
-                help="Marque se este componente faz parte de um bloco (grupo de disciplinas/módulos)"
-            )
-            
-            if faz_parte_bloco:
-                bloco = st.text_input(
-                        "Nome do Bloco *",
-                        placeholder="Ex: Bloco Temático I, Módulo Integrador",
-                        value=st.session_state.form_bloco if "form_bloco" in st.session_state else "",
-                        key="form_bloco",
-                        help="Informe o nome do bloco ao qual este componente pertence"
-                    )
-            else:
-                bloco = ""
-                if "form_bloco" in st.session_state:
-                    st.session_state.form_bloco = ""
-            
-            observacoes = st.text_area(
-                "Observações (opcional)",
-                height=100,
-                key="form_observacoes"
+        else:
+            bloco = ""
+            if "form_bloco" in st.session_state:
+                st.session_state.form_bloco = ""
+        
+        observacoes = st.text_area(
+            "Observações (opcional)",
+            height=100,
+            key="form_observacoes"
+        )
+    
+    st.markdown("---")
+    
+    nucleo_atual = st.session_state.form_nucleo_selecionado if st.session_state.form_nucleo_selecionado else st.session_state.form_nucleo
+    
+    if nucleo_atual:
+        with st.expander(f"Informações sobre o Núcleo {nucleo_atual}", expanded=True):
+            st.markdown(obter_explicacao_nucleo(nucleo_atual))
+    
+    st.markdown("---")
+    st.subheader("Campos Específicos por Núcleo")
+    st.info("**Importante**: Selecione o Núcleo acima e clique em 'Atualizar Informações' para ver os campos específicos. Cada núcleo tem requisitos obrigatórios diferentes.")
+    
+    if nucleo_atual == "I":
+        temas_nucleo_i = st.multiselect(
+            "Temas do Art. 13 (selecione pelo menos um) *",
+            options=TEMAS_NUCLEO_I,
+            key="form_temas_nucleo_i"
+        )
+        diretrizes_nucleo_ii = ""
+        descricao_extensao = ""
+        local_realizacao = ""
+        etapa_estagio = ""
+    
+    elif nucleo_atual == "II":
+        diretrizes_nucleo_ii = st.text_area(
+            "Diretrizes Específicas da Área (texto livre) *",
+            height=100,
+            placeholder="Descreva a vinculação com as Diretrizes da área de conhecimento específica do curso",
+            key="form_diretrizes_nucleo_ii"
+        )
+        temas_nucleo_i = []
+        descricao_extensao = ""
+        local_realizacao = ""
+        etapa_estagio = ""
+    
+    elif nucleo_atual == "III":
+        descricao_extensao = st.text_area(
+            "Vínculo com Projeto Extensionista *",
+            height=100,
+            placeholder="Descreva o vínculo do componente com o projeto de extensão",
+            key="form_descricao_extensao"
+        )
+        temas_nucleo_i = []
+        diretrizes_nucleo_ii = ""
+        local_realizacao = ""
+        etapa_estagio = ""
+    
+    elif nucleo_atual == "IV":
+        local_realizacao = st.text_input(
+            "Local de Realização *",
+            placeholder="Ex: Escola Municipal X, Centro de Educação Infantil Y",
+            key="form_local_realizacao"
+        )
+        etapa_opcoes = ["Observação", "Regência Parcial", "Regência Final", "Outro"]
+        etapa_index = 0
+        if st.session_state.form_etapa_estagio_opcao in etapa_opcoes:
+            etapa_index = etapa_opcoes.index(st.session_state.form_etapa_estagio_opcao)
+        
+        etapa_opcao = st.selectbox(
+            "Etapa do Estágio *",
+            options=etapa_opcoes,
+            index=etapa_index,
+            key="form_etapa_estagio_opcao"
+        )
+        etapa_estagio = etapa_opcao
+        if etapa_opcao == "Outro":
+            etapa_estagio_outro = st.text_input(
+                "Especifique a etapa do estágio *",
+                placeholder="Ex: Gestão Escolar, Coordenação Pedagógica",
+                key="form_etapa_estagio_outro"
             )
+            if etapa_estagio_outro:
+                etapa_estagio = etapa_estagio_outro
+        temas_nucleo_i = []
+        diretrizes_nucleo_ii = ""
+        descricao_extensao = ""
+    
+    else:
+        temas_nucleo_i = []
+        diretrizes_nucleo_ii = ""
+        descricao_extensao = ""
+        local_realizacao = ""
+        etapa_estagio = ""
         
-        st.markdown("---")
-        
-        nucleo_atual = st.session_state.form_nucleo_selecionado if st.session_state.form_nucleo_selecionado else st.session_state.form_nucleo
-        
-        if nucleo_atual:
-            with st.expander(f"Informações sobre o Núcleo {nucleo_atual}", expanded=True):
-                st.markdown(obter_explicacao_nucleo(nucleo_atual))
+    
+    st.markdown("---")
+    pode_adicionar = st.session_state.form_nucleo_selecionado != ""
+    
+    col_submit1, col_submit2, col_submit3 = st.columns([1, 1, 2])
+    with col_submit1:
+        if pode_adicionar:
+            submit = st.button("Adicionar Componente", type="primary", use_container_width=True)
+        else:
+            submit = st.button("Adicionar Componente", disabled=True, use_container_width=True, 
+                             help="Clique em 'Atualizar Informações' primeiro")
+    
+    if submit:
+        if st.session_state.form_faz_parte_bloco and not st.session_state.form_bloco:
+            st.error("Se o componente faz parte de um bloco, informe o nome do bloco.")
+            st.stop()
+        
+        componente = {
+            "semestre": st.session_state.form_semestre,
+            "nome": st.session_state.form_nome,
+            "tipo": st.session_state.form_tipo,
+            "aulas_semanais": int(st.session_state.form_aulas_semanais) if st.session_state.form_tipo == "Disciplina" else None,
+            "ch_total": st.session_state.form_ch_preview,
+            "ch_teorica": st.session_state.form_ch_teorica,
+            "ch_pratica": st.session_state.form_ch_pratica,
+            "ch_extensao": st.session_state.form_ch_extensao,
+            "nucleo": st.session_state.form_nucleo_selecionado,
+            "temas_nucleo_i": temas_nucleo_i if nucleo_atual == "I" else [],
+            "diretrizes_nucleo_ii": diretrizes_nucleo_ii if nucleo_atual == "II" else "",
+            "descricao_extensao": descricao_extensao if nucleo_atual == "III" else "",
+            "local_realizacao": local_realizacao if nucleo_atual == "IV" else "",
+            "etapa_estagio": etapa_estagio if nucleo_atual == "IV" else "",
+            "bloco": st.session_state.form_bloco if st.session_state.form_faz_parte_bloco else "",
+            "observacoes": st.session_state.form_observacoes
+        }
+        
+        valido, erros = validar_componente(componente)
+        
+        if valido:
+            adicionar_componente(componente)
+            st.success("Componente adicionado com sucesso!")
+            valores_limpos = {
+                "form_nome": "",
+                "form_tipo": "",
+                "form_aulas_semanais": 0.0,
+                "form_ch_manual": 0.0,
+                "form_ch_teorica": 0.0,
+                "form_ch_pratica": 0.0,
+                "form_ch_extensao": 0.0,
+                "form_nucleo": "",
+                "form_temas_nucleo_i": [],
+                "form_diretrizes_nucleo_ii": "",
+                "form_descricao_extensao": "",
+                "form_local_realizacao": "",
+                "form_etapa_estagio_opcao": "",
+                "form_etapa_estagio_outro": "",
+                "form_bloco": "",
+                "form_faz_parte_bloco": False,
+                "form_observacoes": "",
+                "form_nucleo_selecionado": "",
+                "form_ch_preview": 0.0,
+                "form_marca_teorica": True,
+                "form_marca_pratica": False,
+                "form_ch_teorica_manual": 0.0
+            }
+            st.session_state["limpar_formulario"] = True
+            st.session_state["valores_limpos"] = valores_limpos
+            st.rerun()
+        else:
+            st.error("Erros de validação:")
+            for erro in erros:
+                st.error(f"• {erro}")
+
+
+@st.fragment
+def exibir_lista_componentes():
+    """
+    Exibe a lista de componentes paginada, com seleção para remoção em lote.
+
+    Apenas a página atual é montada; marcar componentes ou editar semestre e
+    nome executa somente este fragmento. A remoção dos selecionados e a
+    gravação das alterações são aplicadas em lote, em uma única execução.
+    """
+    componentes = st.session_state.componentes
+    
+    col_tamanho, col_pagina, col_posicao = st.columns([1, 1, 2])
+    with col_tamanho:
+        tamanho_pagina = st.selectbox(
+            "Componentes por página",
+            TAMANHOS_PAGINA_COMPONENTES,
+            key="lista_tamanho_pagina"
+        )
+    
+    total_paginas = max(1, math.ceil(len(componentes) / tamanho_pagina))
+    # Após remoções, a página guardada pode não existir mais
+    if st.session_state.get("lista_pagina", 1) > total_paginas:
+        st.session_state.lista_pagina = total_paginas
+    
+    with col_pagina:
+        pagina = st.number_input(
+            "Página",
+            min_value=1,
+            max_value=total_paginas,
+            step=1,
+            key="lista_pagina"
+        )
+    
+    inicio = (pagina - 1) * tamanho_pagina
+    dados_tabela = [
+        {
+            "ID": comp.get("id"),
+            "Semestre": comp.get("semestre"),
+            "Nome": comp.get("nome"),
+            "Tipo": comp.get("tipo"),
+            "CH Total": f"{comp.get('ch_total', 0):.0f}h",
+            "Núcleo": comp.get("nucleo"),
+            "Remover": False
+        }
+        for comp in islice(componentes, inicio, inicio + tamanho_pagina)
+    ]
+    
+    with col_posicao:
+        st.caption(
+            f"Página {pagina} de {total_paginas}: componentes {inicio + 1} a "
+            f"{inicio + len(dados_tabela)} de {len(componentes)}"
+        )
+    
+    # pandas é carregado sob demanda (não é necessário na inicialização)
+    import pandas as pd
+    with secao("DataFrame: lista de componentes"):
+        df_componentes = pd.DataFrame(dados_tabela)
+    
+    with secao("st.data_editor: Lista de componentes"):
+        df_editado = st.data_editor(
+            df_componentes,
+            # A seleção é reiniciada quando o curso muda ou a página é trocada
+            key=f"editor_componentes_{componentes.versao}_{pagina}_{tamanho_pagina}",
+            width='stretch',
+            hide_index=True,
+            disabled=[coluna for coluna in df_componentes.columns if coluna not in (*CAMPOS_EDITAVEIS_LISTA, "Remover")],
+            column_config={
+                "ID": st.column_config.NumberColumn("ID", width="small"),
+                "Semestre": st.column_config.NumberColumn("Semestre", min_value=1, max_value=20, step=1, required=True),
+                "Nome": st.column_config.TextColumn("Nome do Componente", width="large", required=True),
+                "Remover": st.column_config.CheckboxColumn(
+                    "Remover",
+                    help="Marque os componentes a remover",
+                    width="small"
+                )
+            }
+        )
+    
+    selecionados = [int(id_componente) for id_componente in df_editado.loc[df_editado["Remover"], "ID"]]
+    
+    # Alterações de semestre e nome feitas diretamente na tabela
+    alteracoes = {}
+    for original, editado in zip(dados_tabela, df_editado.to_dict("records")):
+        campos = {}
+        for coluna, campo in CAMPOS_EDITAVEIS_LISTA.items():
+            valor = editado[coluna]
+            if pd.isna(valor) or valor == original[coluna]:
+                continue
+            campos[campo] = int(valor) if campo == "semestre" else valor
+        if campos:
+            alteracoes[original["ID"]] = campos
+    
+    col_remover, col_salvar = st.columns(2)
+    with col_remover:
+        if st.button(
+            f"Remover selecionados ({len(selecionados)})",
+            key="btn_remover_selecionados",
+            disabled=not selecionados
+        ):
+            remover_componentes(selecionados)
+            st.rerun()
+    with col_salvar:
+        salvar = st.button(
+            f"Salvar alterações ({len(alteracoes)})",
+            key="btn_salvar_alteracoes",
+            disabled=not alteracoes
+        )
+    
+    if salvar:
+        sucesso, erros = atualizar_componentes(alteracoes)
+        if sucesso:
+            st.rerun()
+        st.error("Nenhuma alteração foi salva. Corrija os componentes abaixo:")
+        for id_componente, erros_componente in erros.items():
+            st.error(f"Componente {id_componente}: " + "; ".join(erros_componente))
+
+
+def exibir_importacao():
+    """Exibe a importação de componentes a partir de planilhas exportadas pelo sistema."""
+    st.header("Importar Componentes")
+    st.info("**Como usar**: Envie a tabela de componentes exportada pelo sistema, em CSV (formato SIGAA) ou XLSX (aba \"Componentes\"). Todas as linhas são validadas antes da importação; os componentes válidos são adicionados ao curso aberto de uma só vez, e a importação pode ser desfeita pelo botão \"Desfazer\" da barra lateral.")
+    
+    # A chave muda a cada importação, para que o arquivo enviado não seja importado duas vezes
+    versao = st.session_state.get("versao_importacao", 0)
+    arquivo = st.file_uploader(
+        "Selecione o arquivo CSV ou XLSX",
+        type=["csv", "xlsx"],
+        key=f"upload_importacao_{versao}"
+    )
+    if arquivo is None:
+        return
+    
+    try:
+        resultado = importar_componentes(arquivo.getvalue(), arquivo.name)
+    except Exception as e:
+        st.error(f"Erro ao ler o arquivo: {str(e)}")
+        return
+    
+    col_lidos, col_validos, col_invalidos = st.columns(3)
+    col_lidos.metric("Linhas lidas", resultado.total)
+    col_validos.metric("Componentes válidos", len(resultado.validos))
+    col_invalidos.metric("Com erros", len(resultado.invalidos))
+    
+    if resultado.invalidos:
+        st.warning("As linhas abaixo têm erros e não serão importadas. Corrija-as no arquivo e envie-o novamente, ou cadastre-as pelo formulário.")
+        exibir_tabela(
+            "Linhas com erros na importação",
+            [
+                {"Linha": linha, "Nome": componente.get("nome", ""), "Erros": "; ".join(erros)}
+                for linha, componente, erros in resultado.invalidos
+            ],
+            width='stretch',
+            hide_index=True
+        )
+    
+    if not resultado.validos:
+        st.info("Nenhum componente válido para importar.")
+        return
+    
+    if st.button(f"Importar {len(resultado.validos)} componente(s)", type="primary", key="btn_importar_componentes"):
+        quantidade = adicionar_componentes(resultado.validos)
+        st.session_state.versao_importacao = versao + 1
+        st.toast(f"{quantidade} componente(s) importado(s).")
+        st.rerun()
+
+
+def exibir_componentes():
+    """Exibe o resumo por semestre e núcleo e a lista de componentes."""
+    st.header("Componentes Cadastrados")
+    st.info("**Como usar**: Visualize os componentes cadastrados, página a página. Para excluir, marque a coluna \"Remover\" dos componentes desejados e clique em \"Remover selecionados\"; semestre e nome podem ser editados na própria tabela e gravados com \"Salvar alterações\". O resumo mostra a distribuição de carga horária por semestre e núcleo.")
+    
+    if st.session_state.componentes:
+        st.subheader("Resumo por Semestre e Núcleo")
+        df_resumo = gerar_resumo_por_semestre_nucleo(st.session_state.componentes)
+        exibir_tabela("Resumo por semestre e núcleo", df_resumo, width='stretch', hide_index=True)
         
         st.markdown("---")
-        st.subheader("Campos Específicos por Núcleo")
-        st.info("**Importante**: Selecione o Núcleo acima e clique em 'Atualizar Informações' para ver os campos específicos. Cada núcleo tem requisitos obrigatórios diferentes.")
-        
-        if nucleo_atual == "I":
-            temas_nucleo_i = st.multiselect(
-                "Temas do Art. 13 (selecione pelo menos um) *",
-                options=TEMAS_NUCLEO_I,
-                key="form_temas_nucleo_i"
-            )
-            diretrizes_nucleo_ii = ""
-            descricao_extensao = ""
-            local_realizacao = ""
-            etapa_estagio = ""
+        st.subheader("Lista de Componentes")
         
-        elif nucleo_atual == "II":
-            diretrizes_nucleo_ii = st.text_area(
-                "Diretrizes Específicas da Área (texto livre) *",
-                height=100,
-                placeholder="Descreva a vinculação com as Diretrizes da área de conhecimento específica do curso",
-                key="form_diretrizes_nucleo_ii"
-            )
-            temas_nucleo_i = []
-            descricao_extensao = ""
-            local_realizacao = ""
-            etapa_estagio = ""
+        exibir_lista_componentes()
         
-        elif nucleo_atual == "III":
-            descricao_extensao = st.text_area(
-                "Vínculo com Projeto Extensionista *",
-                height=100,
-                placeholder="Descreva o vínculo do componente com o projeto de extensão",
-                key="form_descricao_extensao"
-            )
-            temas_nucleo_i = []
-            diretrizes_nucleo_ii = ""
-            local_realizacao = ""
-            etapa_estagio = ""
+        st.caption(f"Total de componentes cadastrados: {len(st.session_state.componentes)}")
+    else:
+        st.info("Nenhum componente cadastrado. Use a aba 'Cadastrar Componente' para adicionar o primeiro.")
+
+
+def exibir_previa_matriz():
+    """Exibe a prévia da matriz curricular por período."""
+    st.header("Prévia - Matriz Curricular por Período")
+    
+    if not st.session_state.componentes:
+        st.info("**Nenhum componente cadastrado.** Use a aba 'Cadastrar' para adicionar componentes curriculares.")
+        st.info("**Como usar**: Esta visualização mostra a matriz curricular organizada por período/semestre, com linha TOTAL por período.")
+    else:
+        st.info("**Como interpretar**: Esta matriz mostra todos os componentes organizados por período. A linha 'TOTAL DO PERÍODO' indica a carga horária total de cada semestre.")
+        
+        df_matriz = gerar_matriz_por_periodo(st.session_state.componentes)
+        
+        st.subheader("Matriz Curricular")
+        exibir_tabela(
+            "Matriz curricular",
+            df_matriz,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Semestre": st.column_config.TextColumn("Semestre / Período", width="medium"),
+                "Nome": st.column_config.TextColumn("Nome do Componente", width="large"),
+                "Tipo": st.column_config.TextColumn("Tipo", width="small"),
+                "CH Semanal": st.column_config.NumberColumn("CH Semanal", width="small", format="%d"),
+                "CH Teórica": st.column_config.NumberColumn("CH Teórica", width="small", format="%d"),
+                "CH Prática": st.column_config.NumberColumn("CH Prática", width="small", format="%d"),
+                "CH Extensão": st.column_config.NumberColumn("CH Extensão", width="small", format="%d"),
+                "CH Total": st.column_config.NumberColumn("CH Total", width="small", format="%d"),
+                "Núcleo": st.column_config.TextColumn("Núcleo", width="small"),
+                "Observação Núcleo": st.column_config.TextColumn("Observação Núcleo", width="large")
+            }
+        )
         
-        elif nucleo_atual == "IV":
-            local_realizacao = st.text_input(
-                "Local de Realização *",
-                placeholder="Ex: Escola Municipal X, Centro de Educação Infantil Y",
-                key="form_local_realizacao"
-            )
-            etapa_opcoes = ["Observação", "Regência Parcial", "Regência Final", "Outro"]
-            etapa_index = 0
-            if st.session_state.form_etapa_estagio_opcao in etapa_opcoes:
-                etapa_index = etapa_opcoes.index(st.session_state.form_etapa_estagio_opcao)
-            
-            etapa_opcao = st.selectbox(
-                "Etapa do Estágio *",
-                options=etapa_opcoes,
-                index=etapa_index,
-                key="form_etapa_estagio_opcao"
-            )
-            etapa_estagio = etapa_opcao
-            if etapa_opcao == "Outro":
-                etapa_estagio_outro = st.text_input(
-                    "Especifique a etapa do estágio *",
-                    placeholder="Ex: Gestão Escolar, Coordenação Pedagógica",
-                    key="form_etapa_estagio_outro"
-                )
-                if etapa_estagio_outro:
-                    etapa_estagio = etapa_estagio_outro
-            temas_nucleo_i = []
-            diretrizes_nucleo_ii = ""
-            descricao_extensao = ""
+        indicadores = calcular_indicadores(st.session_state.componentes)
+        ch_total_curso = indicadores.ch_total
+        ch_teorica_total = indicadores.ch_teorica
+        ch_pratica_total = indicadores.ch_pratica
+        ch_extensao_total = indicadores.ch_extensao
         
-        else:
-            temas_nucleo_i = []
-            diretrizes_nucleo_ii = ""
-            descricao_extensao = ""
-            local_realizacao = ""
-            etapa_estagio = ""
-            
+        st.markdown("---")
+        st.subheader("Resumo Geral do Curso")
+        
+        col_res1, col_res2, col_res3, col_res4 = st.columns(4)
+        with col_res1:
+            st.metric("CH Total do Curso", f"{ch_total_curso:.0f}h", delta="≥3200h mínimo", delta_color="normal")
+        with col_res2:
+            st.metric("CH Teórica Total", f"{ch_teorica_total:.0f}h")
+        with col_res3:
+            st.metric("CH Prática Total", f"{ch_pratica_total:.0f}h")
+        with col_res4:
+            st.metric("CH Extensão Total", f"{ch_extensao_total:.0f}h")
+        
+        componentes_globais = [
+            c for tipo in ["TCC", "Extensão"]
+            for c in st.session_state.componentes.por_tipo(tipo)
+            if not c.get("semestre")
+        ]
+        if componentes_globais:
+            st.markdown("---")
+            st.subheader("Componentes Globais (não vinculados a período)")
+            for comp in componentes_globais:
+                st.write(f"**{comp.get('nome')}** ({comp.get('tipo')}) - {comp.get('ch_total', 0):.0f}h - Núcleo {comp.get('nucleo')}")
+
+
+def exibir_previa_nucleo():
+    """Exibe a prévia por núcleo curricular e os indicadores de conformidade."""
+    st.header("Prévia - Visão por Núcleo Curricular")
+    
+    if not st.session_state.componentes:
+        st.info("**Nenhum componente cadastrado.** Use a aba 'Cadastrar' para adicionar componentes curriculares.")
+        st.info("**Como usar**: Esta visualização mostra o quadro-resumo de carga horária por semestre e núcleo, além de listas de componentes agrupados por núcleo.")
+    else:
+        st.info("**Como interpretar**: O quadro mostra a distribuição de carga horária por período e núcleo. Use os expanders abaixo para ver detalhes de cada núcleo.")
+        
+        st.subheader("Quadro-Resumo: CH por Semestre e Núcleo")
+        df_resumo = gerar_resumo_por_semestre_nucleo(st.session_state.componentes)
+        exibir_tabela(
+            "Quadro por núcleo",
+            df_resumo,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Semestre": st.column_config.TextColumn("Semestre", width="medium"),
+                "CH Núc. I": st.column_config.NumberColumn("CH Núcleo I", width="medium", format="%.0fh"),
+                "CH Núc. II": st.column_config.NumberColumn("CH Núcleo II", width="medium", format="%.0fh"),
+                "CH Núc. III": st.column_config.NumberColumn("CH Núcleo III", width="medium", format="%.0fh"),
+                "CH Núc. IV": st.column_config.NumberColumn("CH Núcleo IV", width="medium", format="%.0fh"),
+                "Total": st.column_config.NumberColumn("Total Período", width="medium", format="%.0fh")
+            }
+        )
         
         st.markdown("---")
-        pode_adicionar = st.session_state.form_nucleo_selecionado != ""
+        st.subheader("Indicadores de Conformidade")
+        
+        indicadores = calcular_indicadores(st.session_state.componentes)
+        ch_i = indicadores.ch_por_nucleo["I"]
+        ch_ii = indicadores.ch_por_nucleo["II"]
+        ch_iii = indicadores.ch_por_nucleo["III"]
+        ch_iv = indicadores.ch_por_nucleo["IV"]
+        ch_total = indicadores.ch_total
+        perc_extensao = indicadores.percentual_extensao
+        perc_pratica = indicadores.percentual_pratica
+        
+        col_conf1, col_conf2, col_conf3, col_conf4 = st.columns(4)
+        
+        with col_conf1:
+            valido_i, msg_i = validar_ch_minima_nucleo(ch_i, obter_ch_minima_por_nucleo("I"))
+            if valido_i:
+                st.success(f"**Núcleo I**: {ch_i:.0f}h (Conforme)")
+            else:
+                st.error(f"**Núcleo I**: {ch_i:.0f}h (Não conforme)")
         
-        col_submit1, col_submit2, col_submit3 = st.columns([1, 1, 2])
-        with col_submit1:
-            if pode_adicionar:
-                submit = st.button("Adicionar Componente", type="primary", use_container_width=True)
+        with col_conf2:
+            valido_ii, msg_ii = validar_ch_minima_nucleo(ch_ii, obter_ch_minima_por_nucleo("II"))
+            if valido_ii:
+                st.success(f"**Núcleo II**: {ch_ii:.0f}h (Conforme)")
             else:
-                submit = st.button("Adicionar Componente", disabled=True, use_container_width=True, 
-                                 help="Clique em 'Atualizar Informações' primeiro")
+                st.error(f"**Núcleo II**: {ch_ii:.0f}h (Não conforme)")
         
-        if submit:
-            if st.session_state.form_faz_parte_bloco and not st.session_state.form_bloco:
-                st.error("Se o componente faz parte de um bloco, informe o nome do bloco.")
-                st.stop()
-            
-            componente = {
-                "semestre": st.session_state.form_semestre,
-                "nome": st.session_state.form_nome,
-                "tipo": st.session_state.form_tipo,
-                "aulas_semanais": int(st.session_state.form_aulas_semanais) if st.session_state.form_tipo == "Disciplina" else None,
-                "ch_total": st.session_state.form_ch_preview,
-                "ch_teorica": st.session_state.form_ch_teorica,
-                "ch_pratica": st.session_state.form_ch_pratica,
-                "ch_extensao": st.session_state.form_ch_extensao,
-                "nucleo": st.session_state.form_nucleo_selecionado,
-                "temas_nucleo_i": temas_nucleo_i if nucleo_atual == "I" else [],
-                "diretrizes_nucleo_ii": diretrizes_nucleo_ii if nucleo_atual == "II" else "",
-                "descricao_extensao": descricao_extensao if nucleo_atual == "III" else "",
-                "local_realizacao": local_realizacao if nucleo_atual == "IV" else "",
-                "etapa_estagio": etapa_estagio if nucleo_atual == "IV" else "",
-                "bloco": st.session_state.form_bloco if st.session_state.form_faz_parte_bloco else "",
-                "observacoes": st.session_state.form_observacoes
-            }
-            
-            valido, erros = validar_componente(componente)
-            
-            if valido:
-                adicionar_componente(componente)
-                st.success("Componente adicionado com sucesso!")
-                valores_limpos = {
-                    "form_nome": "",
-                    "form_tipo": "",
-                    "form_aulas_semanais": 0.0,
-                    "form_ch_manual": 0.0,
-                    "form_ch_teorica": 0.0,
-                    "form_ch_pratica": 0.0,
-                    "form_ch_extensao": 0.0,
-                    "form_nucleo": "",
-                    "form_temas_nucleo_i": [],
-                    "form_diretrizes_nucleo_ii": "",
-                    "form_descricao_extensao": "",
-                    "form_local_realizacao": "",
-                    "form_etapa_estagio_opcao": "",
-                    "form_etapa_estagio_outro": "",
-                    "form_bloco": "",
-                    "form_faz_parte_bloco": False,
-                    "form_observacoes": "",
-                    "form_nucleo_selecionado": "",
-                    "form_ch_preview": 0.0,
-                    "form_marca_teorica": True,
-                    "form_marca_pratica": False,
-                    "form_ch_teorica_manual": 0.0
-                }
-                st.session_state["limpar_formulario"] = True
-                st.session_state["valores_limpos"] = valores_limpos
-                st.rerun()
+        with col_conf3:
+            valido_iii, msg_iii = validar_ch_minima_nucleo(ch_iii, obter_ch_minima_por_nucleo("III"))
+            if valido_iii:
+                st.success(f"**Núcleo III**: {ch_iii:.0f}h (Conforme)")
             else:
-                st.error("Erros de validação:")
-                for erro in erros:
-                    st.error(f"• {erro}")
-    
-    with tab3:
-        st.header("Componentes Cadastrados")
-        st.info("**Como usar**: Visualize todos os componentes cadastrados. Use o botão de remover para excluir componentes. O resumo mostra a distribuição de carga horária por semestre e núcleo.")
+                st.error(f"**Núcleo III**: {ch_iii:.0f}h (Não conforme)")
         
-        if st.session_state.componentes:
-            st.subheader("Resumo por Semestre e Núcleo")
-            df_resumo = gerar_resumo_por_semestre_nucleo(st.session_state.componentes)
-            st.dataframe(df_resumo, width='stretch', hide_index=True)
-            
-            st.markdown("---")
-            st.subheader("Lista de Componentes")
-            
-            dados_tabela = []
-            for comp in st.session_state.componentes:
-                linha = {
-                    "ID": comp.get("id"),
-                    "Semestre": comp.get("semestre"),
-                    "Nome": comp.get("nome"),
-                    "Tipo": comp.get("tipo"),
-                    "CH Total": f"{comp.get('ch_total', 0):.0f}h",
-                    "Núcleo": comp.get("nucleo"),
-                    "Ações": comp.get("id")
-                }
-                dados_tabela.append(linha)
-            
-            df_componentes = pd.DataFrame(dados_tabela)
-            
-            for idx, row in df_componentes.iterrows():
-                with st.container():
-                    col_info, col_action = st.columns([6, 1])
-                    with col_info:
-                        st.write(f"**{row['Nome']}** ({row['Tipo']}) - Semestre {row['Semestre']} - Núcleo {row['Núcleo']} - {row['CH Total']}")
-                    with col_action:
-                        if st.button("Remover", key=f"remover_{row['ID']}", help="Remover componente"):
-                            remover_componente(row['ID'])
-                            st.rerun()
-                    st.divider()
-            
-            st.caption(f"Total de componentes cadastrados: {len(st.session_state.componentes)}")
-        else:
-            st.info("Nenhum componente cadastrado. Use a aba 'Cadastrar Componente' para adicionar o primeiro.")
-    
-    with tab4:
-        st.header("Prévia - Matriz Curricular por Período")
+        with col_conf4:
+            valido_iv, msg_iv = validar_ch_minima_nucleo(ch_iv, obter_ch_minima_por_nucleo("IV"))
+            if valido_iv:
+                st.success(f"**Núcleo IV**: {ch_iv:.0f}h (Conforme)")
+            else:
+                st.error(f"**Núcleo IV**: {ch_iv:.0f}h (Não conforme)")
         
-        if not st.session_state.componentes:
-            st.info("**Nenhum componente cadastrado.** Use a aba 'Cadastrar' para adicionar componentes curriculares.")
-            st.info("**Como usar**: Esta visualização mostra a matriz curricular organizada por período/semestre, com linha TOTAL por período.")
-        else:
-            st.info("**Como interpretar**: Esta matriz mostra todos os componentes organizados por período. A linha 'TOTAL DO PERÍODO' indica a carga horária total de cada semestre.")
-            
-            df_matriz = gerar_matriz_por_periodo(st.session_state.componentes)
-            
-            st.subheader("Matriz Curricular")
-            st.dataframe(
-                df_matriz,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Semestre": st.column_config.TextColumn("Semestre / Período", width="medium"),
-                    "Nome": st.column_config.TextColumn("Nome do Componente", width="large"),
-                    "Tipo": st.column_config.TextColumn("Tipo", width="small"),
-                    "CH Semanal": st.column_config.NumberColumn("CH Semanal", width="small", format="%d"),
-                    "CH Teórica": st.column_config.NumberColumn("CH Teórica", width="small", format="%d"),
-                    "CH Prática": st.column_config.NumberColumn("CH Prática", width="small", format="%d"),
-                    "CH Extensão": st.column_config.NumberColumn("CH Extensão", width="small", format="%d"),
-                    "CH Total": st.column_config.NumberColumn("CH Total", width="small", format="%d"),
-                    "Núcleo": st.column_config.TextColumn("Núcleo", width="small"),
-                    "Observação Núcleo": st.column_config.TextColumn("Observação Núcleo", width="large")
-                }
-            )
-            
-            ch_total_curso = calcular_ch_total_curso(st.session_state.componentes)
-            ch_teorica_total = sum(c.get("ch_teorica", 0) for c in st.session_state.componentes)
-            ch_pratica_total = sum(c.get("ch_pratica", 0) for c in st.session_state.componentes)
-            ch_extensao_total = sum(c.get("ch_extensao", 0) for c in st.session_state.componentes)
-            
-            st.markdown("---")
-            st.subheader("Resumo Geral do Curso")
-            
-            col_res1, col_res2, col_res3, col_res4 = st.columns(4)
-            with col_res1:
-                st.metric("CH Total do Curso", f"{ch_total_curso:.0f}h", delta="≥3200h mínimo", delta_color="normal")
-            with col_res2:
-                st.metric("CH Teórica Total", f"{ch_teorica_total:.0f}h")
-            with col_res3:
-                st.metric("CH Prática Total", f"{ch_pratica_total:.0f}h")
-            with col_res4:
-                st.metric("CH Extensão Total", f"{ch_extensao_total:.0f}h")
-            
-            componentes_globais = [c for c in st.session_state.componentes if c.get("tipo") in ["TCC", "Extensão"] and not c.get("semestre")]
-            if componentes_globais:
-                st.markdown("---")
-                st.subheader("Componentes Globais (não vinculados a período)")
-                for comp in componentes_globais:
-                    st.write(f"**{comp.get('nome')}** ({comp.get('tipo')}) - {comp.get('ch_total', 0):.0f}h - Núcleo {comp.get('nucleo')}")
-    
-    with tab5:
-        st.header("Prévia - Visão por Núcleo Curricular")
+        st.markdown("---")
+        st.write(f"**CH Total do Curso**: {ch_total:.0f}h ({'Conforme' if ch_total >= 3200 else 'Não conforme'}) - mínimo: 3200h")
+        st.write(f"**Percentual de Extensão**: {perc_extensao:.2f}% ({'Conforme' if perc_extensao >= 10 else 'Não conforme'}) - mínimo: 10%")
+        st.write(f"**Percentual de Prática Pedagógica**: {perc_pratica:.2f}%")
         
-        if not st.session_state.componentes:
-            st.info("**Nenhum componente cadastrado.** Use a aba 'Cadastrar' para adicionar componentes curriculares.")
-            st.info("**Como usar**: Esta visualização mostra o quadro-resumo de carga horária por semestre e núcleo, além de listas de componentes agrupados por núcleo.")
-        else:
-            st.info("**Como interpretar**: O quadro mostra a distribuição de carga horária por período e núcleo. Use os expanders abaixo para ver detalhes de cada núcleo.")
-            
-            st.subheader("Quadro-Resumo: CH por Semestre e Núcleo")
-            df_resumo = gerar_resumo_por_semestre_nucleo(st.session_state.componentes)
-            st.dataframe(
-                df_resumo,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Semestre": st.column_config.TextColumn("Semestre", width="medium"),
-                    "CH Núc. I": st.column_config.NumberColumn("CH Núcleo I", width="medium", format="%.0fh"),
-                    "CH Núc. II": st.column_config.NumberColumn("CH Núcleo II", width="medium", format="%.0fh"),
-                    "CH Núc. III": st.column_config.NumberColumn("CH Núcleo III", width="medium", format="%.0fh"),
-                    "CH Núc. IV": st.column_config.NumberColumn("CH Núcleo IV", width="medium", format="%.0fh"),
-                    "Total": st.column_config.NumberColumn("Total Período", width="medium", format="%.0fh")
-                }
-            )
-            
-            st.markdown("---")
-            st.subheader("Indicadores de Conformidade")
-            
-            ch_i = calcular_ch_por_nucleo(st.session_state.componentes, "I")
-            ch_ii = calcular_ch_por_nucleo(st.session_state.componentes, "II")
-            ch_iii = calcular_ch_por_nucleo(st.session_state.componentes, "III")
-            ch_iv = calcular_ch_por_nucleo(st.session_state.componentes, "IV")
-            ch_total = calcular_ch_total_curso(st.session_state.componentes)
-            perc_extensao = calcular_percentual_extensao(st.session_state.componentes)
-            perc_pratica = calcular_percentual_pratica_pedagogica(st.session_state.componentes)
-            
-            col_conf1, col_conf2, col_conf3, col_conf4 = st.columns(4)
-            
-            with col_conf1:
-                valido_i, msg_i = validar_ch_minima_nucleo(ch_i, obter_ch_minima_por_nucleo("I"))
-                if valido_i:
-                    st.success(f"**Núcleo I**: {ch_i:.0f}h (Conforme)")
-                else:
-                    st.error(f"**Núcleo I**: {ch_i:.0f}h (Não conforme)")
-            
-            with col_conf2:
-                valido_ii, msg_ii = validar_ch_minima_nucleo(ch_ii, obter_ch_minima_por_nucleo("II"))
-                if valido_ii:
-                    st.success(f"**Núcleo II**: {ch_ii:.0f}h (Conforme)")
-                else:
-                    st.error(f"**Núcleo II**: {ch_ii:.0f}h (Não conforme)")
-            
-            with col_conf3:
-                valido_iii, msg_iii = validar_ch_minima_nucleo(ch_iii, obter_ch_minima_por_nucleo("III"))
-                if valido_iii:
-                    st.success(f"**Núcleo III**: {ch_iii:.0f}h (Conforme)")
-                else:
-                    st.error(f"**Núcleo III**: {ch_iii:.0f}h (Não conforme)")
+        st.markdown("---")
+        st.subheader("Componentes por Núcleo")
+        
+        for nucleo in ["I", "II", "III", "IV"]:
+            componentes_nucleo = st.session_state.componentes.por_nucleo(nucleo)
+            ch_nucleo = indicadores.ch_por_nucleo[nucleo]
+            ch_minima = obter_ch_minima_por_nucleo(nucleo)
+            valido = indicadores.conformidade_nucleos[nucleo]
             
-            with col_conf4:
-                valido_iv, msg_iv = validar_ch_minima_nucleo(ch_iv, obter_ch_minima_por_nucleo("IV"))
-                if valido_iv:
-                    st.success(f"**Núcleo IV**: {ch_iv:.0f}h (Conforme)")
+            with st.expander(f"**Núcleo {nucleo}** - {ch_nucleo:.0f}h / {ch_minima:.0f}h mínimo ({'Conforme' if valido else 'Não conforme'})", expanded=False):
+                if componentes_nucleo:
+                    for comp in sorted(componentes_nucleo, key=lambda x: (x.get("semestre", 0), x.get("nome", ""))):
+                        st.write(f"- **{comp.get('nome')}** - Semestre {comp.get('semestre')} - {comp.get('ch_total', 0):.0f}h - {comp.get('tipo')}")
+                        if nucleo == "I" and comp.get("temas_nucleo_i"):
+                            st.caption("  Temas selecionados: " + " ".join(comp.get("temas_nucleo_i", [])))
+                        elif nucleo == "III" and comp.get("descricao_extensao"):
+                            st.caption(f"  Extensão: {comp.get('descricao_extensao')[:100]}...")
+                        elif nucleo == "IV" and comp.get("local_realizacao"):
+                            st.caption(f"  Local: {comp.get('local_realizacao')} - Etapa: {comp.get('etapa_estagio')}")
                 else:
-                    st.error(f"**Núcleo IV**: {ch_iv:.0f}h (Não conforme)")
-            
-            st.markdown("---")
-            st.write(f"**CH Total do Curso**: {ch_total:.0f}h ({'Conforme' if ch_total >= 3200 else 'Não conforme'}) - mínimo: 3200h")
-            st.write(f"**Percentual de Extensão**: {perc_extensao:.2f}% ({'Conforme' if perc_extensao >= 10 else 'Não conforme'}) - mínimo: 10%")
-            st.write(f"**Percentual de Prática Pedagógica**: {perc_pratica:.2f}%")
-            
-            st.markdown("---")
-            st.subheader("Componentes por Núcleo")
-            
-            for nucleo in ["I", "II", "III", "IV"]:
-                componentes_nucleo = [c for c in st.session_state.componentes if c.get("nucleo") == nucleo]
-                ch_nucleo = calcular_ch_por_nucleo(st.session_state.componentes, nucleo)
-                ch_minima = obter_ch_minima_por_nucleo(nucleo)
-                valido, _ = validar_ch_minima_nucleo(ch_nucleo, ch_minima)
-                
-                with st.expander(f"**Núcleo {nucleo}** - {ch_nucleo:.0f}h / {ch_minima:.0f}h mínimo ({'Conforme' if valido else 'Não conforme'})", expanded=False):
-                    if componentes_nucleo:
-                        for comp in sorted(componentes_nucleo, key=lambda x: (x.get("semestre", 0), x.get("nome", ""))):
-                            st.write(f"- **{comp.get('nome')}** - Semestre {comp.get('semestre')} - {comp.get('ch_total', 0):.0f}h - {comp.get('tipo')}")
-                            if nucleo == "I" and comp.get("temas_nucleo_i"):
-                                st.caption("  Temas selecionados: " + " ".join(comp.get("temas_nucleo_i", [])))
-                            elif nucleo == "III" and comp.get("descricao_extensao"):
-                                st.caption(f"  Extensão: {comp.get('descricao_extensao')[:100]}...")
-                            elif nucleo == "IV" and comp.get("local_realizacao"):
-                                st.caption(f"  Local: {comp.get('local_realizacao')} - Etapa: {comp.get('etapa_estagio')}")
-                    else:
-                        st.info(f"Nenhum componente cadastrado no Núcleo {nucleo}.")
-
-
-if __name__ == "__main__":
-    main()
-
+                    st.info(f"Nenhum componente cadastrado no Núcleo {nucleo}.")
 
 
+# Visões da interface; apenas a selecionada é executada a cada interação
+VISOES = {
+    "Como Usar": exibir_como_usar,
+    "Cadastrar": exibir_cadastro,
+    "Importar": exibir_importacao,
+    "Componentes": exibir_componentes,
+    "Prévia - Matriz": exibir_previa_matriz,
+    "Prévia - Por Núcleo": exibir_previa_nucleo,
+    "Exportar": exibir_exportacoes,
+    "Regras": exibir_regras_ppc
+}
 
+# Widgets cujo valor deve sobreviver à troca de visão
+PREFIXOS_ESTADO_PRESERVADO = ("form_", "export_", "lista_")
 
 
+def preservar_estado_widgets():
+    """
+    Mantém os valores dos widgets das visões que não estão sendo exibidas.
 
+    O Streamlit descarta o estado de widgets que não são renderizados em uma
+    execução; reatribuir o valor o desvincula do widget e o preserva (ex.:
+    um cadastro em andamento ao consultar a aba "Regras").
+    """
+    for chave in list(st.session_state.keys()):
+        if chave.startswith(PREFIXOS_ESTADO_PRESERVADO):
+            st.session_state[chave] = st.session_state[chave]
 
 
+def main():
+    """Função principal da aplicação."""
+    if "curso_id" not in st.session_state:
+        with secao("Sessão: abertura do curso"):
+            iniciar_sessao()
+    # O diário e o histórico acompanham o curso desde a abertura, para que nenhuma operação fique de fora
+    obter_diario()
+    obter_historico()
+    preservar_estado_widgets()
+    
+    col_logo, col_title, col_aviso = st.columns([0.10, 0.75, 0.15])
+    with col_logo:
+        logo_path = "assets/logo_ufal.png"
+        if os.path.exists(logo_path):
+            st.image(logo_path, width=100)
+    
+    with col_title:
+        st.markdown('<h1 style="margin-top: 30px; margin-bottom: 0; padding-left: 10px;">Sistema de Componentes Curriculares</h1>', unsafe_allow_html=True)
+    
+    with col_aviso:
+        st.markdown('<div id="ufal-backup-menu" style="margin-top:35px; text-align:right; position:relative;">',unsafe_allow_html=True)
 
+        if persistencia_habilitada():
+            with st.expander("💾 Dados salvos automaticamente", expanded=False):
+                st.markdown(AVISO_DADOS_SALVOS)
+        else:
+            with st.expander("⚠️ Não perca seus dados, backup", expanded=False):
+                st.markdown(AVISO_DADOS_NAO_SALVOS)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    visao = st.radio(
+        "Visão",
+        list(VISOES),
+        horizontal=True,
+        key="visao_ativa",
+        label_visibility="collapsed"
+    )
+    
+    with st.sidebar, secao("Barra lateral"):
+        if st.session_state.curso_id:
+            exibir_seletor_cursos()
+        exibir_historico()
+        exibir_barra_lateral()
+    
+    # Apenas a visão selecionada é executada
+    with secao(f"Aba: {visao}"):
+        VISOES[visao]()
+    
+    # Com a página já renderizada, carrega as bibliotecas de exportação em segundo plano
+    # (desativável com PPC_AQUECER_EXPORTADORES=0)
+    if os.environ.get("PPC_AQUECER_EXPORTADORES", "1") != "0":
+        aquecer_exportadores()
 
 
+if __name__ == "__main__":
+    # Diagnóstico opcional: PPC_PERFIL=1 ou ?perfil=1 na URL
+    if perfil_habilitado(st.query_params):
+        with perfilar_execucao() as perfil_execucao:
+            main()
+        exibir_painel_perfil(perfil_execucao)
+    else:
+        main()
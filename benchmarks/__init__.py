@@ -0,0 +1,4 @@
+"""
+Scripts de medição de desempenho do Sistema de Cadastro de PPC.
+Executados com ``python -m benchmarks.<script>`` a partir da raiz do projeto.
+"""
@@ -0,0 +1,175 @@
+"""
+Custo das exportações por curso: tempo, CPU, pico de memória e bytes gerados.
+
+Executa exportar_csv, exportar_xlsx e exportar_pdf em cursos sintéticos de
+tamanho crescente, para cada combinação de tabela (CSV), abas (XLSX) e seções
+(PDF). Cada medição usa um ComponentStore novo, sem tabelas derivadas em
+cache, como na primeira exportação de um curso no servidor.
+
+O pico de memória (tracemalloc) é medido em uma execução separada, já que o
+rastreamento de alocações deixa a execução mais lenta.
+
+Uso:
+    python -m benchmarks.custo_exportacao [--componentes 100 500 2000] [--formatos csv xlsx pdf]
+    python -m benchmarks.custo_exportacao --comparar benchmarks/resultados/exportacoes-abc1234.json
+"""
+
+import argparse
+import io
+import statistics
+import sys
+import time
+import tracemalloc
+from itertools import combinations
+from typing import Callable
+
+from benchmarks.gerador import gerar_componentes
+from benchmarks.registro import (
+    carregar_resultados,
+    comparar_resultados,
+    imprimir_comparacao,
+    salvar_resultados
+)
+from utils.armazenamento import ComponentStore
+from utils.exportacoes import exportar_csv, exportar_pdf, exportar_xlsx
+
+
+CHAVES = ("formato", "opcoes", "componentes")
+
+TABELAS_CSV = ["componentes", "matriz", "resumo_nucleo"]
+ABAS_XLSX = ["matriz", "resumo_nucleo", "componentes"]
+SECOES_PDF = ["matriz", "resumo_nucleo", "resumo_geral", "conformidade"]
+
+
+def _combinacoes(itens: list[str]) -> list[list[str]]:
+    """Todas as combinações não vazias, mantendo a ordem original dos itens."""
+    return [list(c) for tamanho in range(1, len(itens) + 1) for c in combinations(itens, tamanho)]
+
+
+def _cenarios(formatos: list[str], apenas_individuais: bool) -> list[tuple[str, str, Callable]]:
+    """
+    Monta os cenários medidos: (formato, descrição das opções, exportação).
+
+    A exportação recebe (componentes, destino).
+    """
+    cenarios = []
+    if "csv" in formatos:
+        for tabela in TABELAS_CSV:
+            cenarios.append(("csv", tabela, lambda c, d, tabela=tabela: exportar_csv(c, d, tabela)))
+    if "xlsx" in formatos:
+        grupos = [[aba] for aba in ABAS_XLSX] if apenas_individuais else _combinacoes(ABAS_XLSX)
+        for abas in grupos:
+            for memoria_constante in (False, True):
+                descricao = "+".join(abas) + (" (memória constante)" if memoria_constante else "")
+                cenarios.append((
+                    "xlsx",
+                    descricao,
+                    lambda c, d, abas=abas, mc=memoria_constante: exportar_xlsx(c, d, abas, memoria_constante=mc)
+                ))
+    if "pdf" in formatos:
+        grupos = [[secao] for secao in SECOES_PDF] if apenas_individuais else _combinacoes(SECOES_PDF)
+        for secoes in grupos:
+            cenarios.append(("pdf", "+".join(secoes), lambda c, d, secoes=secoes: exportar_pdf(c, d, secoes)))
+    return cenarios
+
+
+def medir(exportacao: Callable, componentes: list[dict], repeticoes: int = 3) -> dict:
+    """
+    Mede uma exportação de um curso.
+
+    Args:
+        exportacao: Função (componentes, destino) que gera o arquivo
+        componentes: Componentes do curso
+        repeticoes: Execuções cronometradas (é registrada a mediana)
+
+    Returns:
+        Dicionário com tempo_ms, cpu_ms, pico_kb, bytes e ms_por_100_linhas
+    """
+    tempos, tempos_cpu = [], []
+    for _ in range(repeticoes):
+        curso = ComponentStore(componentes)
+        destino = io.BytesIO()
+        inicio, inicio_cpu = time.perf_counter(), time.process_time()
+        exportacao(curso, destino)
+        tempos.append(time.perf_counter() - inicio)
+        tempos_cpu.append(time.process_time() - inicio_cpu)
+    tempo = statistics.median(tempos)
+    cpu = statistics.median(tempos_cpu)
+
+    curso = ComponentStore(componentes)
+    tracemalloc.start()
+    exportacao(curso, io.BytesIO())
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "tempo_ms": round(tempo * 1000, 3),
+        "cpu_ms": round(cpu * 1000, 3),
+        "pico_kb": round(pico / 1024, 1),
+        "bytes": len(destino.getvalue()),
+        "ms_por_100_linhas": round(tempo * 1000 * 100 / max(len(componentes), 1), 3)
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--componentes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--semestres", type=int, default=8)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--formatos", nargs="+", choices=["csv", "xlsx", "pdf"], default=["csv", "xlsx", "pdf"])
+    parser.add_argument(
+        "--individuais",
+        action="store_true",
+        help="Mede cada aba/seção isoladamente, em vez de todas as combinações"
+    )
+    parser.add_argument("--saida", help="Arquivo JSON de resultados (padrão: benchmarks/resultados/)")
+    parser.add_argument("--comparar", help="Resultados de referência para comparação")
+    parser.add_argument("--limite", type=float, default=1.10, help="Razão atual/referência considerada regressão")
+    args = parser.parse_args(argv)
+
+    # Carrega as bibliotecas antes das medições, para não contar o tempo de importação
+    exportar_pdf(gerar_componentes(5), io.BytesIO())
+    exportar_xlsx(gerar_componentes(5), io.BytesIO())
+
+    cenarios = _cenarios(args.formatos, args.individuais)
+    resultados = []
+    print(
+        f"{'formato':<8}{'opções':<52}{'comp.':>6}{'tempo':>10}{'CPU':>10}"
+        f"{'ms/100 lin.':>12}{'pico':>11}{'arquivo':>11}"
+    )
+    for quantidade in args.componentes:
+        componentes = gerar_componentes(quantidade, semestres=args.semestres)
+        for formato, opcoes, exportacao in cenarios:
+            medicao = medir(exportacao, componentes, args.repeticoes)
+            resultados.append({"formato": formato, "opcoes": opcoes, "componentes": quantidade, **medicao})
+            print(
+                f"{formato:<8}{opcoes:<52}{quantidade:>6}{medicao['tempo_ms']:>8.1f}ms{medicao['cpu_ms']:>8.1f}ms"
+                f"{medicao['ms_por_100_linhas']:>12.2f}{medicao['pico_kb'] / 1024:>9.1f}MB"
+                f"{medicao['bytes'] / 1024:>9.0f}KB"
+            )
+
+    # Resumo para dimensionamento: o pior caso de cada formato por tamanho de curso
+    print("\nPior caso por formato (tempo e pico de memória por curso):")
+    for quantidade in args.componentes:
+        for formato in args.formatos:
+            do_formato = [r for r in resultados if r["formato"] == formato and r["componentes"] == quantidade]
+            if do_formato:
+                print(
+                    f"  {formato:<5}{quantidade:>6} componentes: "
+                    f"{max(r['tempo_ms'] for r in do_formato):>9.1f}ms, "
+                    f"{max(r['pico_kb'] for r in do_formato) / 1024:>6.1f}MB"
+                )
+
+    caminho = salvar_resultados("exportacoes", resultados, args.saida)
+    print(f"\nResultados salvos em {caminho}")
+
+    if args.comparar:
+        base = carregar_resultados(args.comparar)
+        atual = carregar_resultados(caminho)
+        comparacao = comparar_resultados(base, atual, CHAVES, "tempo_ms", args.limite)
+        if imprimir_comparacao(comparacao, CHAVES, base, atual):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
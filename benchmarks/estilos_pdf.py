@@ -0,0 +1,61 @@
+"""
+Benchmark da preparação de estilos em exportações pequenas e frequentes de PDF.
+
+Compara cada exportação construindo os estilos do zero (como antes do
+registro de estilos) com o registro construído uma vez por processo.
+
+Uso:
+    python -m benchmarks.estilos_pdf [--componentes 10] [--repeticoes 200]
+"""
+
+import argparse
+import io
+import statistics
+import time
+
+from benchmarks.gerador import gerar_componentes
+from utils.estilos_pdf import _construir_estilos_pdf, obter_estilos_pdf
+from utils.exportacoes import exportar_pdf
+
+
+def _mediana_ms(funcao, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--componentes", type=int, default=10)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    parser.add_argument("--secoes", nargs="+", default=["resumo_geral", "conformidade"])
+    args = parser.parse_args(argv)
+    
+    componentes = gerar_componentes(args.componentes)
+    
+    def exportar_sem_registro():
+        obter_estilos_pdf.cache_clear()
+        exportar_pdf(componentes, io.BytesIO(), secoes=args.secoes)
+    
+    def exportar_com_registro():
+        exportar_pdf(componentes, io.BytesIO(), secoes=args.secoes)
+    
+    obter_estilos_pdf()
+    preparo_sem = _mediana_ms(_construir_estilos_pdf, args.repeticoes)
+    preparo_com = _mediana_ms(obter_estilos_pdf, args.repeticoes)
+    exportacao_sem = _mediana_ms(exportar_sem_registro, args.repeticoes)
+    obter_estilos_pdf()
+    exportacao_com = _mediana_ms(exportar_com_registro, args.repeticoes)
+    
+    print(f"Exportação PDF com {args.componentes} componentes, seções: {', '.join(args.secoes)} (mediana de {args.repeticoes})")
+    print(f"{'':<24}{'sem registro':>14}{'com registro':>14}")
+    print(f"{'preparo dos estilos':<24}{preparo_sem:>12.3f}ms{preparo_com:>12.3f}ms")
+    print(f"{'exportação completa':<24}{exportacao_sem:>12.3f}ms{exportacao_com:>12.3f}ms")
+    print(f"Redução por exportação: {exportacao_sem - exportacao_com:.3f}ms ({(1 - exportacao_com / exportacao_sem) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark do PDF: tempo de geração da matriz curricular por número de componentes.
+
+Compara os layouts "tabela_unica" e "por_periodo" de exportar_pdf. Com o
+número de semestres fixo, os períodos crescem junto com o curso; use
+--semestres para simular currículos mais longos.
+
+Uso:
+    python -m benchmarks.exportacao_pdf [--componentes 250 500 1000 2000 4000] [--semestres 8]
+"""
+
+import argparse
+import io
+import time
+
+from benchmarks.gerador import gerar_componentes
+from utils.exportacoes import exportar_pdf
+
+
+def medir(componentes: list, layout: str, secoes: list[str]) -> dict:
+    """
+    Mede o tempo de geração do PDF em um layout.
+    
+    Args:
+        componentes: Componentes a exportar
+        layout: Layout da matriz curricular
+        secoes: Seções do relatório
+    
+    Returns:
+        Dicionário com tempo_s, ms_por_componente e tamanho_kb
+    """
+    destino = io.BytesIO()
+    inicio = time.perf_counter()
+    exportar_pdf(componentes, destino, secoes=secoes, layout_matriz=layout)
+    tempo = time.perf_counter() - inicio
+    return {
+        "tempo_s": tempo,
+        "ms_por_componente": tempo * 1000 / max(len(componentes), 1),
+        "tamanho_kb": len(destino.getvalue()) / 1024
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--componentes", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000])
+    parser.add_argument("--semestres", type=int, default=8)
+    parser.add_argument("--layouts", nargs="+", default=["tabela_unica", "por_periodo"])
+    parser.add_argument("--secoes", nargs="+", default=["matriz"])
+    args = parser.parse_args(argv)
+    
+    print(f"{'componentes':>11}  {'layout':<14}{'tempo (s)':>10}{'ms/comp.':>10}{'arquivo (KB)':>14}")
+    for quantidade in args.componentes:
+        componentes = gerar_componentes(quantidade, semestres=args.semestres)
+        for layout in args.layouts:
+            resultado = medir(componentes, layout, args.secoes)
+            print(
+                f"{quantidade:>11}  {layout:<14}{resultado['tempo_s']:>10.2f}"
+                f"{resultado['ms_por_componente']:>10.2f}{resultado['tamanho_kb']:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark do XLSX: modo padrão (openpyxl) versus modo de memória constante.
+
+Uso:
+    python -m benchmarks.exportacao_xlsx [--componentes 5000 20000] [--repeticoes 3]
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+from benchmarks.gerador import gerar_componentes
+from utils.exportacoes import exportar_xlsx
+
+
+def medir(componentes: list, memoria_constante: bool, repeticoes: int) -> dict:
+    """
+    Mede tempo (melhor de N execuções), pico de memória e tamanho do arquivo.
+    
+    Args:
+        componentes: Componentes a exportar
+        memoria_constante: Modo de gravação do XLSX
+        repeticoes: Quantidade de execuções cronometradas
+    
+    Returns:
+        Dicionário com tempo_s, pico_mb e tamanho_kb
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        exportar_xlsx(componentes, io.BytesIO(), memoria_constante=memoria_constante)
+        tempos.append(time.perf_counter() - inicio)
+    
+    # Memória medida em uma execução separada, fora da cronometragem
+    destino = io.BytesIO()
+    tracemalloc.start()
+    exportar_xlsx(componentes, destino, memoria_constante=memoria_constante)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        "tempo_s": min(tempos),
+        "pico_mb": pico / (1024 * 1024),
+        "tamanho_kb": len(destino.getvalue()) / 1024
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--componentes", type=int, nargs="+", default=[5000, 20000])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+    
+    print(f"{'componentes':>11}  {'modo':<18}{'tempo (s)':>10}{'pico (MB)':>11}{'arquivo (KB)':>14}")
+    for quantidade in args.componentes:
+        componentes = gerar_componentes(quantidade)
+        for memoria_constante, modo in ((False, "padrão (openpyxl)"), (True, "memória constante")):
+            resultado = medir(componentes, memoria_constante, args.repeticoes)
+            print(
+                f"{quantidade:>11}  {modo:<18}{resultado['tempo_s']:>10.2f}"
+                f"{resultado['pico_mb']:>11.1f}{resultado['tamanho_kb']:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
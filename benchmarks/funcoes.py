@@ -0,0 +1,177 @@
+"""
+Micro-benchmarks das funções de cálculo, validação e das tabelas derivadas.
+
+Mede cada função de utils.calculos e utils.validacoes, além de
+gerar_matriz_por_periodo e gerar_resumo_por_semestre_nucleo, em cursos
+sintéticos de 50, 500 e 5000 componentes. As funções que recebem a coleção de
+componentes são medidas com uma lista simples e com um ComponentStore (que
+usa agregados e caches, como no app).
+
+Os resultados são salvos em JSON (benchmarks/resultados/funcoes-<commit>.json)
+e podem ser comparados com os de outro commit.
+
+Uso:
+    python -m benchmarks.funcoes [--componentes 50 500 5000] [--saida arquivo.json]
+    python -m benchmarks.funcoes --comparar benchmarks/resultados/funcoes-abc1234.json
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable
+
+from benchmarks.gerador import gerar_componentes
+from benchmarks.registro import (
+    carregar_resultados,
+    comparar_resultados,
+    imprimir_comparacao,
+    salvar_resultados
+)
+from utils import calculos, validacoes
+from utils.armazenamento import ComponentStore
+from utils.exportacoes import gerar_matriz_por_periodo, gerar_resumo_por_semestre_nucleo
+
+
+CHAVES = ("funcao", "entrada", "componentes")
+
+# Funções que recebem a coleção de componentes
+FUNCOES_COLECAO = [
+    ("calculos.calcular_ch_total_curso", calculos.calcular_ch_total_curso),
+    ("calculos.calcular_ch_extensao", calculos.calcular_ch_extensao),
+    ("calculos.calcular_percentual_extensao", calculos.calcular_percentual_extensao),
+    ("calculos.calcular_ch_teorica", calculos.calcular_ch_teorica),
+    ("calculos.calcular_ch_pratica", calculos.calcular_ch_pratica),
+    ("calculos.calcular_percentual_pratica_pedagogica", calculos.calcular_percentual_pratica_pedagogica),
+    ("calculos.calcular_indicadores", calculos.calcular_indicadores),
+    ("validacoes.validar_curso_completo", validacoes.validar_curso_completo),
+    ("exportacoes.gerar_matriz_por_periodo", gerar_matriz_por_periodo),
+    ("exportacoes.gerar_resumo_por_semestre_nucleo", gerar_resumo_por_semestre_nucleo),
+]
+
+
+def _casos(componentes: list[dict]) -> list[tuple[str, str, Callable[[], object]]]:
+    """
+    Monta os casos medidos para um curso: (função, entrada, chamada).
+    """
+    store = ComponentStore(componentes)
+    casos = []
+
+    for nome, funcao in FUNCOES_COLECAO:
+        casos.append((nome, "lista", lambda funcao=funcao: funcao(componentes)))
+        casos.append((nome, "store", lambda funcao=funcao: funcao(store)))
+
+    for entrada, colecao in (("lista", componentes), ("store", store)):
+        casos.append((
+            "calculos.calcular_ch_por_nucleo",
+            entrada,
+            lambda colecao=colecao: [calculos.calcular_ch_por_nucleo(colecao, n) for n in calculos.NUCLEOS]
+        ))
+
+    # Funções de um componente (ou de um núcleo): medidas sobre o curso inteiro
+    casos.extend([
+        (
+            "calculos.calcular_ch_total",
+            "por_componente",
+            lambda: [
+                calculos.calcular_ch_total(c["tipo"], c.get("aulas_semanais") or 0, c.get("ch_total", 0))
+                for c in componentes
+            ]
+        ),
+        ("validacoes.validar_componente", "por_componente", lambda: [validacoes.validar_componente(c) for c in componentes]),
+        (
+            "calculos.obter_ch_minima_por_nucleo",
+            "por_nucleo",
+            lambda: [calculos.obter_ch_minima_por_nucleo(n) for n in calculos.NUCLEOS]
+        ),
+        (
+            "calculos.validar_ch_minima_nucleo",
+            "por_nucleo",
+            lambda: [
+                calculos.validar_ch_minima_nucleo(store.agregado.por_nucleo(n), calculos.obter_ch_minima_por_nucleo(n))
+                for n in calculos.NUCLEOS
+            ]
+        ),
+    ])
+    return casos
+
+
+def cronometrar(chamada: Callable[[], object], repeticoes: int = 5, tempo_minimo: float = 0.02) -> tuple[float, float]:
+    """
+    Mede o tempo de uma chamada, em microssegundos.
+
+    O número de chamadas por repetição é ajustado para que cada repetição
+    dure ao menos tempo_minimo segundos.
+
+    Returns:
+        Tupla (mediana, mínimo) do tempo por chamada
+    """
+    chamada()  # aquece caches e imports
+    numero = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            chamada()
+        decorrido = time.perf_counter() - inicio
+        if decorrido >= tempo_minimo:
+            break
+        numero *= 2 if decorrido == 0 else max(2, int(tempo_minimo / decorrido) + 1)
+
+    tempos = [decorrido / numero]
+    for _ in range(repeticoes - 1):
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            chamada()
+        tempos.append((time.perf_counter() - inicio) / numero)
+    return statistics.median(tempos) * 1e6, min(tempos) * 1e6
+
+
+def executar(quantidades: list[int], semestres: int, repeticoes: int, tempo_minimo: float) -> list[dict]:
+    """
+    Executa todos os casos para cada tamanho de curso.
+
+    Returns:
+        Lista de medições (funcao, entrada, componentes, mediana_us, minimo_us)
+    """
+    resultados = []
+    for quantidade in quantidades:
+        componentes = gerar_componentes(quantidade, semestres=semestres)
+        for funcao, entrada, chamada in _casos(componentes):
+            mediana, minimo = cronometrar(chamada, repeticoes, tempo_minimo)
+            resultados.append({
+                "funcao": funcao,
+                "entrada": entrada,
+                "componentes": quantidade,
+                "mediana_us": round(mediana, 3),
+                "minimo_us": round(minimo, 3)
+            })
+            print(f"{funcao:<52}{entrada:<16}{quantidade:>6}{mediana:>14.2f}µs")
+    return resultados
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--componentes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--semestres", type=int, default=8)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--tempo-minimo", type=float, default=0.02, help="Duração mínima de cada repetição (s)")
+    parser.add_argument("--saida", help="Arquivo JSON de resultados (padrão: benchmarks/resultados/)")
+    parser.add_argument("--comparar", help="Resultados de referência para comparação")
+    parser.add_argument("--limite", type=float, default=1.10, help="Razão atual/referência considerada regressão")
+    args = parser.parse_args(argv)
+
+    print(f"{'função':<52}{'entrada':<16}{'comp.':>6}{'mediana':>16}")
+    resultados = executar(args.componentes, args.semestres, args.repeticoes, args.tempo_minimo)
+    caminho = salvar_resultados("funcoes", resultados, args.saida)
+    print(f"\nResultados salvos em {caminho}")
+
+    if args.comparar:
+        base = carregar_resultados(args.comparar)
+        atual = carregar_resultados(caminho)
+        comparacao = comparar_resultados(base, atual, CHAVES, "minimo_us", args.limite)
+        if imprimir_comparacao(comparacao, CHAVES, base, atual):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
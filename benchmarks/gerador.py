@@ -0,0 +1,146 @@
+"""
+Gerador determinístico de cursos sintéticos para os benchmarks.
+Responsável por produzir componentes válidos em qualquer quantidade.
+"""
+
+import random
+
+
+NUCLEOS = ("I", "II", "III", "IV")
+
+# Proporção aproximada de componentes por núcleo em um PPC de licenciatura
+PESOS_NUCLEOS = (0.34, 0.42, 0.16, 0.08)
+
+# Tipos de componente por núcleo, com o peso de cada um
+TIPOS_POR_NUCLEO = {
+    "I": (("Disciplina", 0.80), ("Módulo", 0.10), ("Bloco", 0.05), ("Outro", 0.05)),
+    "II": (("Disciplina", 0.75), ("Módulo", 0.10), ("TCC", 0.08), ("Bloco", 0.04), ("Outro", 0.03)),
+    "III": (("Extensão", 1.0),),
+    "IV": (("Estágio", 1.0),)
+}
+
+# Temas do Art. 13 (a-i) da Res. CNE/CP nº 4/2024, no formato usado pelo app
+TEMAS_NUCLEO_I = [
+    "a) princípios e fundamentos sociológicos, filosóficos, históricos e epistemológicos da educação;",
+    "b) princípios, valores e atitudes comprometidos com a justiça social e a inclusão;",
+    "c) observação, análise, planejamento e avaliação de processos educativos;",
+    "d) conhecimento multidimensional e interdisciplinar sobre o ser humano e práticas educativas;",
+    "e) diagnóstico e análise das necessidades e aspirações dos diferentes segmentos da sociedade;",
+    "f) pesquisa e estudo da legislação educacional, da gestão, do financiamento e do currículo;",
+    "g) pesquisa e estudo das relações entre educação e trabalho, diversidade e cidadania;",
+    "h) estudos de aspectos éticos, didáticos e comportamentais no exercício profissional; e",
+    "i) conhecimento sobre estratégias de planejamento e avaliação das aprendizagens."
+]
+
+DIRETRIZES_NUCLEO_II = [
+    "Diretrizes Curriculares Nacionais da área específica",
+    "Conteúdos específicos previstos na BNCC para a etapa de atuação",
+    "Fundamentos teórico-metodológicos do ensino da área"
+]
+
+PROJETOS_EXTENSAO = [
+    "Projeto de extensão em escolas públicas da rede estadual",
+    "Programa de formação continuada de professores da educação básica",
+    "Curso de extensão aberto à comunidade",
+    "Oficinas pedagógicas em comunidades quilombolas e indígenas",
+    "Feira de ciências e mostra de práticas educativas"
+]
+
+LOCAIS_ESTAGIO = ["Escola da rede pública estadual", "Escola da rede pública municipal", "Instituto Federal"]
+
+ETAPAS_ESTAGIO = ["Observação", "Regência Parcial", "Regência Final"]
+
+
+def gerar_componente(id_componente: int, gerador: random.Random, semestres: int = 8) -> dict:
+    """
+    Gera um componente válido pelas regras de validar_componente.
+
+    Args:
+        id_componente: Identificador do componente
+        gerador: Gerador pseudoaleatório (define a sequência produzida)
+        semestres: Quantidade de semestres do curso
+
+    Returns:
+        Dicionário do componente
+    """
+    nucleo = gerador.choices(NUCLEOS, weights=PESOS_NUCLEOS)[0]
+    tipos, pesos = zip(*TIPOS_POR_NUCLEO[nucleo])
+    tipo = gerador.choices(tipos, weights=pesos)[0]
+    componente = {
+        "id": id_componente,
+        "semestre": gerador.randint(1, semestres),
+        "nome": f"Componente {id_componente:05d}",
+        "tipo": tipo,
+        "nucleo": nucleo,
+        "aulas_semanais": None,
+        "ch_teorica": 0,
+        "ch_pratica": 0,
+        "ch_extensao": 0,
+        "temas_nucleo_i": [],
+        "diretrizes_nucleo_ii": "",
+        "descricao_extensao": "",
+        "local_realizacao": "",
+        "etapa_estagio": "",
+        "bloco": "",
+        "observacoes": ""
+    }
+
+    if nucleo in ("I", "II"):
+        if tipo == "Disciplina":
+            aulas = gerador.choice((2, 3, 4))
+            componente["aulas_semanais"] = aulas
+            ch_total = aulas * 18
+        else:
+            ch_total = float(gerador.choice((30, 45, 60)))
+        ch_pratica = gerador.choice((0, 15))
+        componente.update({
+            "ch_total": ch_total,
+            "ch_teorica": ch_total - ch_pratica,
+            "ch_pratica": ch_pratica
+        })
+        if tipo == "Bloco":
+            componente["bloco"] = f"Bloco {gerador.randint(1, 4)}"
+        if tipo == "TCC":
+            # TCC nos últimos semestres do curso
+            componente["semestre"] = gerador.randint(max(1, semestres - 1), semestres)
+        if nucleo == "I":
+            componente["temas_nucleo_i"] = gerador.sample(TEMAS_NUCLEO_I, gerador.randint(1, 3))
+        else:
+            componente["diretrizes_nucleo_ii"] = gerador.choice(DIRETRIZES_NUCLEO_II)
+    elif nucleo == "III":
+        ch_total = float(gerador.choice((30, 45, 60)))
+        componente.update({
+            "ch_total": ch_total,
+            "ch_extensao": ch_total,
+            "descricao_extensao": gerador.choice(PROJETOS_EXTENSAO)
+        })
+    else:
+        # Estágios na segunda metade do curso
+        componente.update({
+            "semestre": gerador.randint(max(1, semestres // 2 + 1), semestres),
+            "ch_total": 400.0,
+            "ch_pratica": 400.0,
+            "local_realizacao": gerador.choice(LOCAIS_ESTAGIO),
+            "etapa_estagio": gerador.choice(ETAPAS_ESTAGIO)
+        })
+
+    return componente
+
+
+def gerar_componentes(quantidade: int, semente: int = 2024, semestres: int = 8) -> list[dict]:
+    """
+    Gera um curso sintético com a quantidade de componentes informada.
+
+    A mesma semente sempre produz o mesmo curso, para que medições em
+    commits diferentes sejam comparáveis.
+
+    Args:
+        quantidade: Número de componentes
+        semente: Semente do gerador pseudoaleatório
+        semestres: Quantidade de semestres do curso
+
+    Returns:
+        Lista de componentes com ids de 1 a quantidade
+    """
+    gerador = random.Random(semente)
+    return [gerar_componente(i, gerador, semestres) for i in range(1, quantidade + 1)]
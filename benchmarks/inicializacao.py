@@ -0,0 +1,112 @@
+"""
+Medição do tempo de inicialização do app.
+
+Cada amostra roda em um interpretador novo (sem módulos em cache) e mede:
+- importação: tempo de importar os módulos do app (streamlit e utils);
+- primeira renderização: execução completa de app.py pelo AppTest do Streamlit;
+- bibliotecas adiadas: custo de importar pandas e reportlab, que a
+  inicialização deixa de pagar.
+
+Uso:
+    python -m benchmarks.inicializacao [--amostras 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BIBLIOTECAS_PESADAS = ("pandas", "reportlab", "openpyxl", "xlsxwriter")
+
+_CODIGO_IMPORTACAO = """
+import json, sys, time
+inicio = time.perf_counter()
+import streamlit
+import utils.calculos, utils.validacoes, utils.armazenamento, utils.backup, utils.exportacoes
+tempo = time.perf_counter() - inicio
+print(json.dumps({"tempo_s": tempo, "carregadas": [m for m in %r if m in sys.modules]}))
+""" % (BIBLIOTECAS_PESADAS,)
+
+_CODIGO_RENDERIZACAO = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("app.py", default_timeout=120)
+inicio = time.perf_counter()
+app.run()
+tempo = time.perf_counter() - inicio
+print(json.dumps({
+    "tempo_s": tempo,
+    "erro": [str(e.value) for e in app.exception],
+    "carregadas": [m for m in %r if m in sys.modules]
+}))
+""" % (BIBLIOTECAS_PESADAS,)
+
+_CODIGO_ADIADAS = """
+import json, time
+inicio = time.perf_counter()
+import pandas, reportlab.platypus
+print(json.dumps({"tempo_s": time.perf_counter() - inicio, "carregadas": []}))
+"""
+
+
+def _executar(codigo: str) -> dict:
+    # Sem aquecimento em segundo plano, para medir apenas o caminho de inicialização
+    ambiente = {**os.environ, "PPC_AQUECER_EXPORTADORES": "0"}
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo],
+        cwd=RAIZ_PROJETO,
+        env=ambiente,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def medir(codigo: str, amostras: int) -> dict:
+    """
+    Executa uma medição em interpretadores novos e resume os tempos.
+    
+    Args:
+        codigo: Código Python que imprime um JSON com tempo_s
+        amostras: Quantidade de execuções
+    
+    Returns:
+        Dicionário com mediana_ms, minimo_ms e as bibliotecas carregadas
+    """
+    resultados = [_executar(codigo) for _ in range(amostras)]
+    tempos = [r["tempo_s"] * 1000 for r in resultados]
+    return {
+        "mediana_ms": statistics.median(tempos),
+        "minimo_ms": min(tempos),
+        "carregadas": resultados[-1]["carregadas"],
+        "erro": resultados[-1].get("erro", [])
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--amostras", type=int, default=5)
+    args = parser.parse_args(argv)
+    
+    medicoes = [
+        ("importação dos módulos", _CODIGO_IMPORTACAO),
+        ("primeira renderização", _CODIGO_RENDERIZACAO),
+        ("bibliotecas adiadas", _CODIGO_ADIADAS),
+    ]
+    print(f"{'medição':<24}{'mediana':>10}{'mínimo':>10}  bibliotecas pesadas carregadas")
+    for nome, codigo in medicoes:
+        resultado = medir(codigo, args.amostras)
+        carregadas = ", ".join(resultado["carregadas"]) or "nenhuma"
+        print(f"{nome:<24}{resultado['mediana_ms']:>8.0f}ms{resultado['minimo_ms']:>8.0f}ms  {carregadas}")
+        if resultado["erro"]:
+            print(f"  erro na renderização: {resultado['erro']}")
+
+
+if __name__ == "__main__":
+    main()
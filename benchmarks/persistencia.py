@@ -0,0 +1,121 @@
+"""
+Latência do salvamento automático em SQLite.
+
+Mede, em cursos de tamanho crescente já gravados no banco, a gravação de um
+componente alterado (como a cada cadastro ou edição no app), a remoção de um
+componente e o carregamento do curso inteiro (como ao abrir uma sessão), e
+compara o pior tempo observado com os limites de utils.persistencia.
+
+Uso:
+    python -m benchmarks.persistencia [--componentes 100 1000 5000] [--repeticoes 50]
+    python -m benchmarks.persistencia --comparar benchmarks/resultados/persistencia-abc1234.json
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.gerador import gerar_componentes
+from benchmarks.registro import (
+    carregar_resultados,
+    comparar_resultados,
+    imprimir_comparacao,
+    salvar_resultados
+)
+from utils.persistencia import LIMITE_CARREGAMENTO_MS, LIMITE_GRAVACAO_MS, RepositorioCursos
+
+
+CHAVES = ("operacao", "componentes")
+
+
+def _medir(chamada, repeticoes: int) -> list[float]:
+    tempos = []
+    for i in range(repeticoes):
+        inicio = time.perf_counter()
+        chamada(i)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+
+def medir_curso(repositorio: RepositorioCursos, quantidade: int, repeticoes: int) -> list[dict]:
+    """
+    Mede as operações do repositório em um curso com a quantidade de componentes informada.
+
+    Returns:
+        Lista de medições (operacao, componentes, mediana_ms, p95_ms, maximo_ms, limite_ms)
+    """
+    curso_id = f"benchmark-{quantidade}"
+    componentes = gerar_componentes(quantidade)
+    repositorio.substituir_curso(curso_id, componentes, quantidade)
+
+    def gravar(i):
+        componente = componentes[i % quantidade]
+        repositorio.salvar_componentes(curso_id, [{**componente, "observacoes": f"edição {i}"}])
+
+    def remover_e_reinserir(i):
+        componente = componentes[i % quantidade]
+        repositorio.remover_componentes(curso_id, [componente["id"]])
+        repositorio.salvar_componentes(curso_id, [componente])
+
+    operacoes = [
+        ("gravar_componente", gravar, repeticoes, LIMITE_GRAVACAO_MS),
+        ("remover_e_reinserir", remover_e_reinserir, repeticoes, 2 * LIMITE_GRAVACAO_MS),
+        ("carregar_curso", lambda i: repositorio.carregar_curso(curso_id), max(5, repeticoes // 5), LIMITE_CARREGAMENTO_MS),
+    ]
+    resultados = []
+    for operacao, chamada, vezes, limite in operacoes:
+        tempos = sorted(_medir(chamada, vezes))
+        resultados.append({
+            "operacao": operacao,
+            "componentes": quantidade,
+            "mediana_ms": round(statistics.median(tempos), 3),
+            "p95_ms": round(tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))], 3),
+            "maximo_ms": round(tempos[-1], 3),
+            "limite_ms": limite
+        })
+    return resultados
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--componentes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeticoes", type=int, default=50)
+    parser.add_argument("--banco", help="Arquivo SQLite usado nas medições (padrão: arquivo temporário)")
+    parser.add_argument("--saida", help="Arquivo JSON de resultados (padrão: benchmarks/resultados/)")
+    parser.add_argument("--comparar", help="Resultados de referência para comparação")
+    parser.add_argument("--limite", type=float, default=1.10, help="Razão atual/referência considerada regressão")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as diretorio, \
+            RepositorioCursos(args.banco or os.path.join(diretorio, "benchmark.db")) as repositorio:
+        resultados = []
+        acima_do_limite = False
+        print(f"{'operação':<24}{'comp.':>6}{'mediana':>12}{'p95':>12}{'máximo':>12}{'limite':>10}")
+        for quantidade in args.componentes:
+            for medicao in medir_curso(repositorio, quantidade, args.repeticoes):
+                resultados.append(medicao)
+                marca = "  ACIMA DO LIMITE" if medicao["p95_ms"] > medicao["limite_ms"] else ""
+                acima_do_limite = acima_do_limite or bool(marca)
+                print(
+                    f"{medicao['operacao']:<24}{quantidade:>6}{medicao['mediana_ms']:>10.2f}ms"
+                    f"{medicao['p95_ms']:>10.2f}ms{medicao['maximo_ms']:>10.2f}ms{medicao['limite_ms']:>8.0f}ms{marca}"
+                )
+
+    caminho = salvar_resultados("persistencia", resultados, args.saida)
+    print(f"\nResultados salvos em {caminho}")
+
+    regrediu = False
+    if args.comparar:
+        base = carregar_resultados(args.comparar)
+        atual = carregar_resultados(caminho)
+        comparacao = comparar_resultados(base, atual, CHAVES, "mediana_ms", args.limite)
+        regrediu = imprimir_comparacao(comparacao, CHAVES, base, atual)
+    if acima_do_limite or regrediu:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
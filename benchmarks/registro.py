@@ -0,0 +1,136 @@
+"""
+Registro dos resultados dos benchmarks em JSON.
+Responsável por identificar a execução (commit, ambiente) e comparar
+resultados entre commits.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DIRETORIO_RESULTADOS = os.path.join(RAIZ_PROJETO, "benchmarks", "resultados")
+
+
+def _git(*argumentos: str) -> str:
+    try:
+        saida = subprocess.run(
+            ["git", *argumentos],
+            cwd=RAIZ_PROJETO,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return saida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def metadados_execucao() -> dict:
+    """
+    Identifica a execução: commit, alterações locais, data e ambiente.
+
+    Returns:
+        Dicionário com commit, alteracoes_locais, data, python e plataforma
+    """
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "desconhecido",
+        "alteracoes_locais": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform()
+    }
+
+
+def salvar_resultados(benchmark: str, resultados: list[dict], caminho: str | None = None) -> str:
+    """
+    Salva os resultados de um benchmark em JSON, junto com os metadados da execução.
+
+    Args:
+        benchmark: Nome do benchmark (ex.: "funcoes")
+        resultados: Lista de medições; cada uma tem as chaves que a
+            identificam e os valores medidos
+        caminho: Arquivo de destino; por padrão,
+            benchmarks/resultados/<benchmark>-<commit>.json
+
+    Returns:
+        Caminho do arquivo gerado
+    """
+    metadados = metadados_execucao()
+    if caminho is None:
+        os.makedirs(DIRETORIO_RESULTADOS, exist_ok=True)
+        sufixo = "-local" if metadados["alteracoes_locais"] else ""
+        caminho = os.path.join(DIRETORIO_RESULTADOS, f"{benchmark}-{metadados['commit']}{sufixo}.json")
+
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump({"benchmark": benchmark, **metadados, "resultados": resultados}, f, ensure_ascii=False, indent=2)
+    return caminho
+
+
+def carregar_resultados(caminho: str) -> dict:
+    """Lê um arquivo de resultados gerado por salvar_resultados."""
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def comparar_resultados(
+    base: dict,
+    atual: dict,
+    chaves: tuple[str, ...],
+    metrica: str,
+    limite: float = 1.10
+) -> list[dict]:
+    """
+    Compara duas execuções de um benchmark, medição a medição.
+
+    Args:
+        base: Resultados de referência (ex.: do commit anterior)
+        atual: Resultados novos
+        chaves: Campos que identificam uma medição (ex.: funcao, entrada, componentes)
+        metrica: Campo comparado (quanto menor, melhor)
+        limite: Razão atual/base a partir da qual a medição é uma regressão
+
+    Returns:
+        Lista com base, atual, razão e indicador de regressão de cada medição
+        presente nas duas execuções
+    """
+    indice_base = {tuple(r[c] for c in chaves): r for r in base["resultados"]}
+    comparacao = []
+    for resultado in atual["resultados"]:
+        identificacao = tuple(resultado[c] for c in chaves)
+        anterior = indice_base.get(identificacao)
+        if anterior is None or not anterior.get(metrica):
+            continue
+        razao = resultado[metrica] / anterior[metrica]
+        comparacao.append({
+            **dict(zip(chaves, identificacao)),
+            "base": anterior[metrica],
+            "atual": resultado[metrica],
+            "razao": razao,
+            "regressao": razao > limite
+        })
+    return comparacao
+
+
+def imprimir_comparacao(comparacao: list[dict], chaves: tuple[str, ...], base: dict, atual: dict) -> bool:
+    """
+    Exibe a comparação no terminal.
+
+    Returns:
+        True se alguma medição regrediu
+    """
+    print(f"\nComparação: {base['commit']} → {atual['commit']}")
+    regrediu = False
+    for item in comparacao:
+        identificacao = " / ".join(str(item[c]) for c in chaves)
+        marca = "  REGRESSÃO" if item["regressao"] else ""
+        regrediu = regrediu or item["regressao"]
+        print(f"  {identificacao:<60}{item['base']:>12.2f}{item['atual']:>12.2f}{item['razao']:>8.2f}x{marca}")
+    if not comparacao:
+        print("  Nenhuma medição em comum.", file=sys.stderr)
+    return regrediu
@@ -0,0 +1,82 @@
+"""
+Componentes de exemplo usados pelos testes.
+"""
+
+import random
+
+
+TEMAS_NUCLEO_I = [
+    "a) princípios e fundamentos sociológicos, filosóficos, históricos e epistemológicos da educação;",
+    "c) observação, análise, planejamento e avaliação de processos educativos;",
+    "h) estudos de aspectos éticos, didáticos e comportamentais no exercício profissional; e"
+]
+
+
+def criar_componente(id_componente: int, nucleo: str, semestre: int = 1, **campos) -> dict:
+    """
+    Cria um componente válido do núcleo informado.
+
+    Args:
+        id_componente: Identificador do componente
+        nucleo: Núcleo (I a IV)
+        semestre: Semestre do componente
+        **campos: Campos que substituem os valores padrão
+
+    Returns:
+        Dicionário do componente
+    """
+    componente = {
+        "id": id_componente,
+        "semestre": semestre,
+        "nome": f"Componente {id_componente:03d}",
+        "tipo": "Disciplina",
+        "nucleo": nucleo,
+        "aulas_semanais": None,
+        "ch_total": 0,
+        "ch_teorica": 0,
+        "ch_pratica": 0,
+        "ch_extensao": 0,
+        "temas_nucleo_i": [],
+        "diretrizes_nucleo_ii": "",
+        "descricao_extensao": "",
+        "local_realizacao": "",
+        "etapa_estagio": "",
+        "bloco": "",
+        "observacoes": ""
+    }
+    if nucleo in ("I", "II"):
+        aulas = 2 + id_componente % 3
+        componente.update({"aulas_semanais": aulas, "ch_total": aulas * 18, "ch_teorica": aulas * 18})
+        if nucleo == "I":
+            componente["temas_nucleo_i"] = TEMAS_NUCLEO_I[:1 + id_componente % len(TEMAS_NUCLEO_I)]
+        else:
+            componente["diretrizes_nucleo_ii"] = "Diretrizes Curriculares Nacionais da área"
+    elif nucleo == "III":
+        componente.update({
+            "tipo": "Extensão",
+            "ch_total": 60.0,
+            "ch_extensao": 60.0,
+            "descricao_extensao": "Projeto de extensão em escolas públicas"
+        })
+    else:
+        componente.update({
+            "tipo": "Estágio",
+            "ch_total": 400.0,
+            "ch_pratica": 400.0,
+            "local_realizacao": "Escola da rede pública estadual",
+            "etapa_estagio": "Observação"
+        })
+    componente.update(campos)
+    return componente
+
+
+def gerar_componentes(quantidade: int, semente: int = 1, semestres: int = 8) -> list[dict]:
+    """
+    Gera componentes válidos, com ids de 1 a quantidade, em núcleos e
+    semestres sorteados (a mesma semente produz o mesmo curso).
+    """
+    gerador = random.Random(semente)
+    return [
+        criar_componente(i, gerador.choice(("I", "I", "II", "II", "III", "IV")), gerador.randint(1, semestres))
+        for i in range(1, quantidade + 1)
+    ]
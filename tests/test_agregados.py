@@ -0,0 +1,86 @@
+"""
+Testes dos agregados de carga horária: os totais mantidos incrementalmente
+pelo ComponentStore devem coincidir com os recalculados a partir da lista.
+"""
+
+import pytest
+
+from tests.auxiliares import gerar_componentes
+from utils.agregados import CAMPOS_CH
+from utils.armazenamento import ComponentStore
+from utils.calculos import calcular_indicadores
+
+
+def _somar(componentes, campo, condicao=lambda c: True):
+    return sum(c.get(campo, 0) or 0 for c in componentes if condicao(c))
+
+
+def _editar(store, componentes):
+    store.adicionar_varios(componentes[80:100])
+    store.remover(componentes[0]["id"])
+    store.remover_varios([c["id"] for c in componentes[20:30]])
+    store.atualizar(componentes[40]["id"], {"ch_total": 999.0, "nucleo": "III", "ch_extensao": 999.0})
+    store.atualizar_varios({c["id"]: {"semestre": 3} for c in componentes[50:60]})
+
+
+@pytest.fixture
+def store():
+    componentes = gerar_componentes(100, semente=11)
+    store = ComponentStore(componentes[:80])
+    _editar(store, componentes)
+    return store
+
+
+def test_totais_do_agregado_equivalem_aos_da_lista(store):
+    lista = store.para_lista()
+    agregado = store.agregado
+
+    for campo in CAMPOS_CH:
+        assert agregado.total(campo) == pytest.approx(_somar(lista, campo))
+    for nucleo in ("I", "II", "III", "IV"):
+        assert agregado.por_nucleo(nucleo) == pytest.approx(_somar(lista, "ch_total", lambda c: c["nucleo"] == nucleo))
+    for semestre in {c["semestre"] for c in lista}:
+        assert agregado.por_semestre(semestre) == pytest.approx(
+            _somar(lista, "ch_total", lambda c: c["semestre"] == semestre)
+        )
+        for nucleo in ("I", "II", "III", "IV"):
+            assert agregado.por_semestre_nucleo(semestre, nucleo) == pytest.approx(
+                _somar(lista, "ch_total", lambda c: c["semestre"] == semestre and c["nucleo"] == nucleo)
+            )
+
+
+def test_indicadores_do_store_equivalem_aos_da_lista(store):
+    do_store = calcular_indicadores(store)
+    da_lista = calcular_indicadores(store.para_lista())
+
+    for campo in ("ch_total", "ch_teorica", "ch_pratica", "ch_extensao", "percentual_extensao", "percentual_pratica"):
+        assert getattr(do_store, campo) == pytest.approx(getattr(da_lista, campo))
+    assert dict(do_store.ch_por_nucleo) == pytest.approx(dict(da_lista.ch_por_nucleo))
+    assert do_store.ch_semestre_nucleo.keys() == da_lista.ch_semestre_nucleo.keys()
+    for semestre, por_nucleo in da_lista.ch_semestre_nucleo.items():
+        assert dict(do_store.ch_semestre_nucleo[semestre]) == pytest.approx(dict(por_nucleo))
+    assert dict(do_store.conformidade_nucleos) == dict(da_lista.conformidade_nucleos)
+    assert do_store.ch_total_conforme == da_lista.ch_total_conforme
+    assert do_store.extensao_conforme == da_lista.extensao_conforme
+
+
+def test_indicadores_acompanham_alteracoes_do_store():
+    componentes = gerar_componentes(40, semente=3)
+    store = ComponentStore(componentes)
+    antes = calcular_indicadores(store)
+
+    store.atualizar(componentes[0]["id"], {"ch_total": componentes[0]["ch_total"] + 100})
+
+    assert calcular_indicadores(store).ch_total == pytest.approx(antes.ch_total + 100)
+
+
+def test_curso_vazio_zera_os_totais():
+    componentes = gerar_componentes(10, semente=5)
+    store = ComponentStore(componentes)
+
+    store.remover_varios([c["id"] for c in componentes])
+
+    assert len(store) == 0
+    for campo in CAMPOS_CH:
+        assert store.agregado.total(campo) == 0
+    assert calcular_indicadores(store).ch_total == 0
@@ -0,0 +1,57 @@
+"""
+Testes da interface: lista de componentes paginada.
+"""
+
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from tests.auxiliares import gerar_componentes
+from utils.armazenamento import ComponentStore
+
+
+CAMINHO_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """App com 60 componentes na sessão, aberto na visão Componentes."""
+    monkeypatch.setenv("PPC_PERSISTENCIA", "0")
+    monkeypatch.setenv("PPC_AQUECER_EXPORTADORES", "0")
+    app = AppTest.from_file(CAMINHO_APP, default_timeout=60)
+    app.run()
+    app.session_state.componentes = ComponentStore(gerar_componentes(60, semente=5))
+    app.session_state.ultimo_id = 60
+    app.radio(key="visao_ativa").set_value("Componentes").run()
+    return app
+
+
+def _pagina(app):
+    """Tabela exibida pela lista de componentes."""
+    return app.dataframe[-1].value
+
+
+def test_lista_exibe_apenas_a_pagina_atual(app):
+    assert len(_pagina(app)) == 25
+    assert list(_pagina(app)["ID"]) == list(range(1, 26))
+    assert "Página 1 de 3: componentes 1 a 25 de 60" in [caption.value for caption in app.caption]
+
+    app.number_input(key="lista_pagina").set_value(3).run()
+
+    assert list(_pagina(app)["ID"]) == list(range(51, 61))
+
+    app.selectbox(key="lista_tamanho_pagina").set_value(100).run()
+
+    assert len(_pagina(app)) == 60
+
+
+def test_pagina_inexistente_apos_remocao_volta_para_a_ultima(app):
+    app.number_input(key="lista_pagina").set_value(3).run()
+
+    app.session_state.componentes.remover_varios(range(30, 61))
+    app.run()
+
+    assert app.number_input(key="lista_pagina").value == 2
+    assert list(_pagina(app)["ID"]) == [26, 27, 28, 29]
+    assert not app.exception
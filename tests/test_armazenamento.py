@@ -0,0 +1,115 @@
+"""
+Testes do ComponentStore: índices, ordem e equivalência com a lista simples.
+"""
+
+import pytest
+
+from tests.auxiliares import gerar_componentes
+from utils.armazenamento import ComponentStore, calcular_impressao_digital
+
+
+@pytest.fixture
+def componentes():
+    return gerar_componentes(60, semente=7)
+
+
+def _comparar_indices(store):
+    lista = store.para_lista()
+    for nucleo in ("I", "II", "III", "IV"):
+        assert store.por_nucleo(nucleo) == [c for c in lista if c["nucleo"] == nucleo]
+    for semestre in {c["semestre"] for c in lista}:
+        assert store.por_semestre(semestre) == [c for c in lista if c["semestre"] == semestre]
+    for tipo in {c["tipo"] for c in lista}:
+        assert store.por_tipo(tipo) == [c for c in lista if c["tipo"] == tipo]
+    assert set(store.semestres()) == {c["semestre"] for c in lista}
+
+
+def test_preserva_ordem_de_insercao(componentes):
+    store = ComponentStore(componentes)
+
+    assert len(store) == len(componentes)
+    assert store.para_lista() == componentes
+    assert [c["id"] for c in store] == [c["id"] for c in componentes]
+
+
+def test_indices_equivalem_a_filtrar_a_lista(componentes):
+    store = ComponentStore(componentes)
+    store.remover(componentes[3]["id"])
+    store.atualizar(componentes[10]["id"], {"nucleo": "III", "semestre": 99, "tipo": "Extensão"})
+    store.atualizar_varios({componentes[0]["id"]: {"nome": "Editado"}, componentes[1]["id"]: {"nucleo": "IV"}})
+    store.remover_varios([componentes[4]["id"], componentes[5]["id"], 999])
+    store.adicionar({**componentes[3], "semestre": 1})
+
+    _comparar_indices(store)
+
+
+def test_substituir_componente_mantem_a_posicao(componentes):
+    store = ComponentStore(componentes)
+    editado = {**componentes[5], "nucleo": "IV", "semestre": componentes[0]["semestre"]}
+
+    store.adicionar(editado)
+
+    assert store.para_lista() == [editado if c["id"] == editado["id"] else c for c in componentes]
+    _comparar_indices(store)
+
+
+def test_atualizar_nao_modifica_o_componente_anterior(componentes):
+    store = ComponentStore(componentes)
+    anterior = store.obter(1)
+
+    atual = store.atualizar(1, {"nome": "Renomeado"})
+
+    assert anterior["nome"] == componentes[0]["nome"]
+    assert atual is not anterior
+    assert store.obter(1)["nome"] == "Renomeado"
+    with pytest.raises(KeyError):
+        store.atualizar(999, {"nome": "Inexistente"})
+    with pytest.raises(KeyError):
+        store.atualizar_varios({2: {"nome": "Renomeado"}, 999: {"nome": "Inexistente"}})
+    assert store.obter(2) == componentes[1]
+
+
+def test_operacoes_em_lote_notificam_uma_vez(componentes):
+    store = ComponentStore(componentes[:10])
+    alteracoes = []
+    store.observar(alteracoes.append)
+
+    store.adicionar_varios(componentes[10:20])
+    store.atualizar_varios({1: {"observacoes": "x"}, 2: {"observacoes": "y"}})
+    store.remover_varios([3, 4, 5])
+
+    assert [a.operacao for a in alteracoes] == ["adicionar", "atualizar", "remover"]
+    assert [len(a.antes) for a in alteracoes] == [10, 2, 3]
+    assert all(antes is None for antes in alteracoes[0].antes)
+    assert all(depois is None for depois in alteracoes[2].depois)
+    assert len(store) == 17
+
+
+def test_remover_e_obter(componentes):
+    store = ComponentStore(componentes)
+
+    assert store.remover(1) == componentes[0]
+    assert store.remover(1) is None
+    assert 1 not in store
+    assert store.obter(1) is None
+    assert store.obter(2) == componentes[1]
+    _comparar_indices(store)
+
+
+def test_componente_sem_id_e_rejeitado():
+    with pytest.raises(ValueError):
+        ComponentStore([{"nome": "Sem id"}])
+
+
+def test_versao_e_impressao_digital_acompanham_o_conteudo(componentes):
+    store = ComponentStore(componentes)
+    versao = store.versao
+    impressao = store.impressao_digital()
+
+    assert impressao == calcular_impressao_digital(componentes)
+
+    store.atualizar(1, {"observacoes": "alterado"})
+
+    assert store.versao > versao
+    assert store.impressao_digital() != impressao
+    assert store.impressao_digital() == calcular_impressao_digital(store.para_lista())
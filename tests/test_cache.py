@@ -0,0 +1,69 @@
+"""
+Testes do CacheLRU: descarte dos itens usados há mais tempo.
+"""
+
+import pytest
+
+from utils.cache import CacheLRU
+
+
+def test_descarta_o_item_usado_ha_mais_tempo():
+    cache = CacheLRU(max_itens=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+
+    assert cache.obter("a") == 1
+    cache.guardar("c", 3)
+
+    assert "b" not in cache
+    assert cache.obter("a") == 1
+    assert cache.obter("c") == 3
+    assert len(cache) == 2
+
+
+def test_guardar_chave_existente_substitui_o_valor():
+    cache = CacheLRU(max_itens=2)
+    cache.guardar("a", 1)
+    cache.guardar("a", 2)
+
+    assert len(cache) == 1
+    assert cache.obter("a") == 2
+    assert cache.obter("ausente", "padrao") == "padrao"
+
+
+def test_limpar_e_limite_invalido():
+    cache = CacheLRU()
+    cache.guardar("a", 1)
+    cache.limpar()
+
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        CacheLRU(max_itens=0)
+
+
+def test_limite_em_bytes_descarta_os_mais_antigos():
+    cache = CacheLRU(max_itens=10, max_bytes=10)
+    cache.guardar("a", b"1234")
+    cache.guardar("b", b"1234")
+    cache.guardar("c", b"1234")
+
+    assert "a" not in cache
+    assert cache.bytes_ocupados == 8
+
+    cache.guardar("b", b"12")
+
+    assert cache.bytes_ocupados == 6
+    assert "c" in cache
+
+
+def test_valor_maior_que_o_limite_nao_e_guardado():
+    cache = CacheLRU(max_itens=10, max_bytes=10)
+    cache.guardar("a", b"123")
+    cache.guardar("grande", b"x" * 11)
+
+    assert "grande" not in cache
+    assert "a" in cache
+    assert cache.bytes_ocupados == 3
+
+    cache.limpar()
+    assert cache.bytes_ocupados == 0
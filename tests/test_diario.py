@@ -0,0 +1,159 @@
+"""
+Testes dos backups incrementais: restauração da cadeia (backup completo +
+incremental), incrementais perdidos e arquivos de outras cadeias.
+"""
+
+from tests.auxiliares import gerar_componentes
+from utils.armazenamento import ComponentStore
+from utils.diario import DiarioOperacoes, restaurar_cadeia
+
+
+def _curso(quantidade=20, semente=6):
+    store = ComponentStore(gerar_componentes(quantidade, semente=semente))
+    return store, DiarioOperacoes(store)
+
+
+def _editar(store, inicio):
+    componente = {**store.obter(1), "id": inicio}
+    store.adicionar(componente)
+    store.atualizar(2, {"nome": f"Editado {inicio}"})
+    store.remover(6 + inicio % 5)
+    store.atualizar_varios({4: {"semestre": 5}, 5: {"observacoes": f"obs {inicio}"}})
+
+
+def test_backup_completo_sozinho():
+    store, diario = _curso()
+    conteudo, completo = diario.exportar_backup(20)
+
+    componentes, ultimo_id, sucesso, _ = restaurar_cadeia([("completo.json", conteudo)])
+
+    assert completo and sucesso
+    assert componentes == store.para_lista()
+    assert ultimo_id == 20
+
+
+def test_completo_e_incremental_restauram_o_curso():
+    store, diario = _curso()
+    completo, _ = diario.exportar_backup(20)
+    _editar(store, 100)
+    delta, eh_completo = diario.exportar_backup(100)
+
+    # Ordem dos arquivos não importa
+    componentes, ultimo_id, sucesso, mensagem = restaurar_cadeia([("d1.json", delta), ("c.json", completo)])
+
+    assert not eh_completo
+    assert sucesso, mensagem
+    assert componentes == store.para_lista()
+    assert ultimo_id == 100
+    assert "d1.json" in mensagem
+
+
+def test_incremental_perdido_nao_deixa_lacuna():
+    store, diario = _curso()
+    completo, _ = diario.exportar_backup(20)
+    _editar(store, 100)
+    diario.exportar_backup(100)  # gerado, mas nunca baixado
+    _editar(store, 101)
+    ultimo, _ = diario.exportar_backup(101)
+
+    componentes, _, sucesso, mensagem = restaurar_cadeia([("c.json", completo), ("d2.json", ultimo)])
+
+    assert sucesso, mensagem
+    assert componentes == store.para_lista()
+
+
+def test_usa_o_incremental_mais_recente_entre_os_enviados():
+    store, diario = _curso()
+    completo, _ = diario.exportar_backup(20)
+    _editar(store, 100)
+    antigo, _ = diario.exportar_backup(100)
+    _editar(store, 101)
+    recente, _ = diario.exportar_backup(101)
+
+    componentes, _, sucesso, mensagem = restaurar_cadeia(
+        [("d2.json", recente), ("c.json", completo), ("d1.json", antigo)]
+    )
+
+    assert sucesso
+    assert componentes == store.para_lista()
+    assert "d2.json" in mensagem
+
+
+def test_incrementais_de_backup_completo_anterior_sao_ignorados():
+    store, diario = _curso()
+    primeiro, _ = diario.exportar_backup(20)
+    _editar(store, 100)
+    antigo, _ = diario.exportar_backup(100)
+    segundo = diario.exportar_snapshot(100)
+
+    componentes, _, sucesso, _ = restaurar_cadeia(
+        [("c1.json", primeiro), ("d1.json", antigo), ("c2.json", segundo)]
+    )
+
+    assert sucesso
+    assert componentes == store.para_lista()
+
+
+def test_incremental_sem_o_backup_completo():
+    store, diario = _curso()
+    diario.exportar_backup(20)
+    _editar(store, 100)
+    delta, _ = diario.exportar_backup(100)
+
+    _, _, sucesso, mensagem = restaurar_cadeia([("d1.json", delta)])
+
+    assert not sucesso
+    assert "backup completo" in mensagem
+
+
+def test_incremental_de_backup_completo_nao_enviado():
+    store, diario = _curso()
+    completo, _ = diario.exportar_backup(20)
+    _editar(store, 100)
+    diario.exportar_snapshot(100)
+    _editar(store, 101)
+    delta, _ = diario.exportar_backup(101)
+
+    _, _, sucesso, mensagem = restaurar_cadeia([("c1.json", completo), ("d.json", delta)])
+
+    assert not sucesso
+    assert "mais recente" in mensagem and "d.json" in mensagem
+
+
+def test_arquivos_de_outra_cadeia_sao_apontados():
+    store_a, diario_a = _curso(semente=1)
+    store_b, diario_b = _curso(semente=2)
+    completo_a, _ = diario_a.exportar_backup(20)
+    completo_b, _ = diario_b.exportar_backup(20)
+    _editar(store_b, 100)
+    delta_b, _ = diario_b.exportar_backup(100)
+
+    _, _, sucesso, mensagem = restaurar_cadeia([("a.json", completo_a), ("b_delta.json", delta_b)])
+    assert not sucesso
+    assert "não pertencem" in mensagem and "b_delta.json" in mensagem
+
+    _, _, sucesso, mensagem = restaurar_cadeia([("a.json", completo_a), ("b.json", completo_b)])
+    assert not sucesso
+    assert "a.json" in mensagem and "b.json" in mensagem
+
+
+def test_arquivo_invalido_e_apontado():
+    _, diario = _curso()
+    completo, _ = diario.exportar_backup(20)
+
+    _, _, sucesso, mensagem = restaurar_cadeia([("c.json", completo), ("quebrado.json", "{")])
+
+    assert not sucesso
+    assert "quebrado.json" in mensagem
+
+
+def test_compactacao_volta_ao_backup_completo():
+    store = ComponentStore(gerar_componentes(10))
+    diario = DiarioOperacoes(store, limite_compactacao=3)
+    diario.exportar_backup(10)
+    store.atualizar_varios({i: {"observacoes": "x"} for i in range(1, 5)})
+
+    assert diario.precisa_snapshot()
+    conteudo, completo = diario.exportar_backup(10)
+    assert completo
+    assert restaurar_cadeia([("c.json", conteudo)])[0] == store.para_lista()
@@ -0,0 +1,148 @@
+"""
+Testes do espaço de trabalho: cursos da sessão, cursos ainda não gravados,
+cursos abertos em memória e sessões diferentes alterando o mesmo curso.
+"""
+
+import pytest
+
+from tests.auxiliares import gerar_componentes
+from utils.espaco_trabalho import NOME_PADRAO_CURSO, EspacoTrabalho
+from utils.persistencia import RepositorioCursos
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "cursos.db")
+
+
+@pytest.fixture
+def repositorio(caminho):
+    with RepositorioCursos(caminho) as repositorio:
+        yield repositorio
+
+
+def _reabrir(repositorio, curso_id):
+    """Abre o curso em uma nova sessão, lendo-o do banco."""
+    espaco = EspacoTrabalho(repositorio)
+    assert espaco.incluir(curso_id)
+    return espaco, espaco.abrir(curso_id)
+
+
+def test_curso_gravado_e_lido_de_volta(repositorio):
+    componentes = gerar_componentes(30, semente=8)
+    espaco = EspacoTrabalho(repositorio)
+    curso_id = espaco.criar("Física", componentes, ultimo_id=30)
+    store = espaco.abrir(curso_id)
+
+    store.atualizar(5, {"nome": "Editado"})
+    store.remover_varios([1, 2])
+    store.adicionar({**componentes[0], "id": 31})
+
+    outro, lido = _reabrir(repositorio, curso_id)
+    assert lido.para_lista() == store.para_lista()
+    resumo = outro.resumo(curso_id)
+    assert resumo.nome == "Física"
+    assert resumo.ultimo_id == 31
+    assert resumo.quantidade_componentes == len(store)
+    assert resumo.ch_total == pytest.approx(store.agregado.total())
+
+
+def test_curso_vazio_so_e_gravado_na_primeira_alteracao(repositorio):
+    espaco = EspacoTrabalho(repositorio)
+    curso_id = espaco.criar()
+
+    assert curso_id in espaco
+    assert espaco.resumo(curso_id).nome == NOME_PADRAO_CURSO
+    assert repositorio.listar_cursos([curso_id]) == []
+    assert espaco.abrir(curso_id).para_lista() == []
+
+    espaco.renomear(curso_id, "Química")
+
+    assert [linha["nome"] for linha in repositorio.listar_cursos([curso_id])] == ["Química"]
+
+
+def test_primeiro_componente_grava_curso_pendente(repositorio):
+    espaco = EspacoTrabalho(repositorio)
+    curso_id = espaco.criar()
+    (id_componente,) = espaco.reservar_ids(curso_id)
+    componente = {**gerar_componentes(1)[0], "id": id_componente}
+
+    espaco.abrir(curso_id).adicionar(componente)
+
+    _, lido = _reabrir(repositorio, curso_id)
+    assert lido.para_lista() == [componente]
+
+
+def test_curso_pendente_gravado_ao_restaurar_backup(repositorio):
+    espaco = EspacoTrabalho(repositorio)
+    curso_id = espaco.criar("Biologia")
+    componentes = gerar_componentes(8, semente=10)
+
+    espaco.substituir(curso_id, componentes, 8)
+
+    _, lido = _reabrir(repositorio, curso_id)
+    assert lido.para_lista() == componentes
+    assert repositorio.listar_cursos([curso_id])[0]["nome"] == "Biologia"
+
+
+def test_cursos_abertos_mantidos_em_memoria_com_descarte_lru(repositorio, monkeypatch):
+    espaco = EspacoTrabalho(repositorio, max_cursos_abertos=2)
+    cursos = [espaco.criar(f"Curso {i}", gerar_componentes(3, semente=i), ultimo_id=3) for i in range(3)]
+    leituras = []
+    carregar_curso = repositorio.carregar_curso
+    monkeypatch.setattr(repositorio, "carregar_curso", lambda curso_id: leituras.append(curso_id) or carregar_curso(curso_id))
+
+    # O último curso criado e o anterior continuam em memória
+    store = espaco.abrir(cursos[2])
+    assert espaco.abrir(cursos[2]) is store
+    espaco.abrir(cursos[1])
+    assert leituras == []
+
+    # O primeiro foi descartado e é lido do banco, descartando o menos recente
+    espaco.abrir(cursos[0])
+    espaco.abrir(cursos[1])
+    espaco.abrir(cursos[2])
+    assert leituras == [cursos[0], cursos[2]]
+
+    # Alterações de um curso recarregado continuam sendo gravadas
+    espaco.abrir(cursos[0]).remover(1)
+    assert [c["id"] for c in repositorio.carregar_curso(cursos[0])[0]] == [2, 3]
+    assert espaco.resumo(cursos[0]).quantidade_componentes == 2
+
+
+def test_abrir_curso_inexistente(repositorio):
+    with pytest.raises(KeyError):
+        EspacoTrabalho(repositorio).abrir("inexistente")
+
+
+def test_sessao_so_lista_os_proprios_cursos(repositorio):
+    sessao_a = EspacoTrabalho(repositorio)
+    curso_a = sessao_a.criar("A", gerar_componentes(3), ultimo_id=3)
+    sessao_b = EspacoTrabalho(repositorio)
+    sessao_b.criar("B", gerar_componentes(2), ultimo_id=2)
+
+    assert curso_a not in sessao_b
+    assert [resumo.nome for resumo in sessao_b.listar()] == ["B"]
+    assert sessao_b.incluir(curso_a)
+    assert not sessao_b.incluir("inexistente")
+    assert len(sessao_b) == 2
+
+
+def test_duas_sessoes_no_mesmo_curso_nao_sobrescrevem_componentes(repositorio, caminho):
+    componentes = gerar_componentes(4, semente=9)
+    sessao_a = EspacoTrabalho(repositorio)
+    curso_id = sessao_a.criar("Compartilhado", componentes, ultimo_id=4)
+    with RepositorioCursos(caminho) as outro_repositorio:
+        sessao_b, store_b = _reabrir(outro_repositorio, curso_id)
+        store_a = sessao_a.abrir(curso_id)
+
+        (id_a,) = sessao_a.reservar_ids(curso_id)
+        (id_b,) = sessao_b.reservar_ids(curso_id)
+        store_a.adicionar({**componentes[0], "id": id_a, "nome": "Da sessão A"})
+        store_b.adicionar({**componentes[0], "id": id_b, "nome": "Da sessão B"})
+
+    assert id_a != id_b
+    _, lido = _reabrir(repositorio, curso_id)
+    nomes = [c["nome"] for c in lido]
+    assert "Da sessão A" in nomes and "Da sessão B" in nomes
+    assert len(lido) == 6
@@ -0,0 +1,199 @@
+"""
+Testes das exportações (CSV, XLSX e PDF) e dos resultados reaproveitados por elas.
+"""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+from openpyxl import load_workbook
+
+from tests.auxiliares import gerar_componentes
+from utils import exportacoes
+from utils.armazenamento import ComponentStore
+from utils.exportacoes import (
+    COLUNAS_COMPONENTES,
+    LIMITE_TABELA_UNICA_PDF,
+    _resolver_layout_matriz_pdf,
+    exportar_com_cache,
+    exportar_csv,
+    exportar_pdf,
+    exportar_xlsx,
+    gerar_csv_componentes,
+    gerar_matriz_por_periodo,
+    gerar_resumo_por_semestre_nucleo
+)
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def componentes():
+    return gerar_componentes(40, semente=11)
+
+
+def test_derivados_reaproveitados_ate_a_proxima_alteracao(componentes):
+    store = ComponentStore(componentes)
+
+    matriz = gerar_matriz_por_periodo(store)
+    matriz.loc[0, "Componente"] = "Alterado por quem chamou"
+
+    assert gerar_matriz_por_periodo(store).equals(gerar_matriz_por_periodo(componentes))
+    assert ("_construir_matriz_por_periodo", store.versao) in store.derivados
+
+    store.atualizar(componentes[0]["id"], {"nome": "Renomeado", "semestre": 1})
+    store.remover(componentes[1]["id"])
+
+    assert gerar_matriz_por_periodo(store).equals(gerar_matriz_por_periodo(store.para_lista()))
+    assert gerar_resumo_por_semestre_nucleo(store).equals(gerar_resumo_por_semestre_nucleo(store.para_lista()))
+
+
+def test_destinos_das_exportacoes(componentes, tmp_path):
+    for exportar, extensao in ((exportar_csv, "csv"), (exportar_xlsx, "xlsx"), (exportar_pdf, "pdf")):
+        dados = exportar(componentes)
+        assert isinstance(dados, bytes) and dados
+
+        fluxo = io.BytesIO()
+        assert exportar(componentes, fluxo) is fluxo
+
+        caminho = str(tmp_path / f"curso.{extensao}")
+        assert exportar(componentes, caminho) == caminho
+        with open(caminho, "rb") as arquivo:
+            gravado = arquivo.read()
+
+        if extensao == "csv":
+            assert fluxo.getvalue() == gravado == dados
+        else:
+            # XLSX e PDF registram a data de geração; basta o formato do arquivo
+            assert fluxo.getvalue()[:4] == gravado[:4] == dados[:4]
+
+
+def test_exportar_com_cache_reaproveita_mesmo_conteudo_e_opcoes(componentes):
+    exportacoes._CACHE_ARTEFATOS.limpar()
+
+    dados, do_cache = exportar_com_cache("xlsx", componentes, ["Componentes", "matriz"])
+    assert not do_cache
+
+    # Mesmas abas em outra ordem e em outra caixa: mesmo arquivo
+    repetido, do_cache = exportar_com_cache("xlsx", ComponentStore(componentes), ["matriz", "componentes", ""])
+    assert do_cache
+    assert repetido is dados
+
+    _, do_cache = exportar_com_cache("xlsx", componentes, ["matriz"])
+    assert not do_cache
+
+    alterados = [{**componentes[0], "nome": "Outro nome"}, *componentes[1:]]
+    _, do_cache = exportar_com_cache("xlsx", alterados, ["componentes", "matriz"])
+    assert not do_cache
+
+    csv, _ = exportar_com_cache("csv", componentes)
+    assert exportar_com_cache("csv", componentes, "COMPONENTES") == (csv, True)
+
+    with pytest.raises(ValueError):
+        exportar_com_cache("odt", componentes)
+
+
+def test_csv_com_numeros_inteiros_e_decimais():
+    componentes = [
+        {
+            "id": 1, "semestre": 1, "nome": "A", "tipo": "Disciplina", "aulas_semanais": 2,
+            "ch_total": 36, "ch_teorica": 36, "ch_pratica": 0, "ch_extensao": 0, "nucleo": "I",
+            "temas_nucleo_i": ["a) x;"]
+        },
+        {
+            "id": 2, "semestre": 2, "nome": "B", "tipo": "Extensão", "aulas_semanais": None,
+            "ch_total": 72.0, "ch_teorica": 0, "ch_pratica": 0.0, "ch_extensao": 72, "nucleo": "III",
+            "descricao_extensao": "p"
+        }
+    ]
+
+    esperado = (
+        "\ufeff" + ";".join(COLUNAS_COMPONENTES) + "\n"
+        '1;A;Disciplina;2.0;36.0;36.0;0.0;0.0;I;"a) x;";;;;;;\n'
+        "2;B;Extensão;;72.0;0.0;0.0;72.0;III;;;p;;;;\n"
+    ).encode("utf-8")
+
+    assert exportar_csv(componentes) == esperado
+
+
+def test_csv_em_blocos_igual_ao_arquivo_inteiro(componentes):
+    blocos = list(gerar_csv_componentes(iter(componentes), linhas_por_bloco=7))
+
+    assert len(blocos) == 6
+    assert b"".join(blocos) == exportar_csv(componentes)
+    assert b"".join(gerar_csv_componentes([])) == ("\ufeff" + ";".join(COLUNAS_COMPONENTES) + "\n").encode("utf-8")
+
+
+def _ler_planilha(dados: bytes) -> dict:
+    planilha = load_workbook(io.BytesIO(dados))
+    return {
+        aba.title: (
+            [list(linha) for linha in aba.iter_rows(values_only=True)],
+            # Colunas vizinhas de mesma largura podem vir agrupadas em um intervalo
+            {
+                coluna: dimensao.width
+                for dimensao in aba.column_dimensions.values()
+                for coluna in range(dimensao.min, dimensao.max + 1)
+            }
+        )
+        for aba in planilha.worksheets
+    }
+
+
+def test_xlsx_em_memoria_constante_igual_ao_modo_padrao(componentes):
+    componentes[0] = {**componentes[0], "observacoes": None, "bloco": "Bloco com um nome bem mais longo"}
+
+    padrao = _ler_planilha(exportar_xlsx(componentes))
+    memoria_constante = _ler_planilha(exportar_xlsx(componentes, memoria_constante=True))
+
+    assert list(memoria_constante) == list(padrao) == ["Matriz", "Por Núcleo", "Componentes"]
+    for aba, (linhas, larguras) in padrao.items():
+        assert memoria_constante[aba][0] == linhas
+        assert list(memoria_constante[aba][1]) == list(larguras)
+        # O xlsxwriter grava a largura somada à margem interna da coluna
+        for coluna, largura in larguras.items():
+            assert memoria_constante[aba][1][coluna] == pytest.approx(largura, abs=1)
+
+
+def test_layout_da_matriz_em_pdf():
+    assert _resolver_layout_matriz_pdf(None, 10) == "tabela_unica"
+    assert _resolver_layout_matriz_pdf("auto", LIMITE_TABELA_UNICA_PDF) == "tabela_unica"
+    assert _resolver_layout_matriz_pdf("AUTO", LIMITE_TABELA_UNICA_PDF + 1) == "por_periodo"
+    assert _resolver_layout_matriz_pdf("tabela_unica", 5000) == "tabela_unica"
+    assert _resolver_layout_matriz_pdf("por_periodo", 1) == "por_periodo"
+    with pytest.raises(ValueError):
+        _resolver_layout_matriz_pdf("paisagem", 1)
+
+
+def test_pdf_por_periodo(componentes):
+    for layout in ("tabela_unica", "por_periodo"):
+        assert exportar_pdf(componentes, secoes=["matriz"], layout_matriz=layout).startswith(b"%PDF")
+
+
+def test_estilos_pdf_construidos_uma_vez():
+    from utils.estilos_pdf import obter_estilos_pdf
+
+    estilos = obter_estilos_pdf()
+
+    assert obter_estilos_pdf() is estilos
+    with pytest.raises(TypeError):
+        estilos.paragrafos["novo"] = estilos.paragrafos[next(iter(estilos.paragrafos))]
+
+
+def test_bibliotecas_de_exportacao_carregadas_sob_demanda():
+    codigo = (
+        "import sys\n"
+        "import utils.exportacoes as exportacoes\n"
+        "print('pandas' in sys.modules, 'reportlab' in sys.modules)\n"
+        "exportacoes.aquecer_exportadores(em_segundo_plano=False)\n"
+        "print('pandas' in sys.modules, 'reportlab' in sys.modules)\n"
+        "print(exportacoes.aquecer_exportadores())\n"
+    )
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo], capture_output=True, text=True, check=True, cwd=RAIZ
+    ).stdout.split("\n")
+
+    assert saida[:3] == ["False False", "True True", "None"]
@@ -0,0 +1,144 @@
+"""
+Testes do histórico de alterações: desfazer e refazer operações em lote,
+inclusive com o curso gravado no banco e no diário de backups.
+"""
+
+from tests.auxiliares import gerar_componentes
+from utils.armazenamento import ComponentStore
+from utils.diario import DiarioOperacoes, restaurar_cadeia
+from utils.espaco_trabalho import EspacoTrabalho
+from utils.historico import HistoricoAlteracoes, descrever_alteracao
+from utils.persistencia import RepositorioCursos
+
+
+def test_desfazer_e_refazer_operacoes_em_lote():
+    componentes = gerar_componentes(30, semente=12)
+    store = ComponentStore(componentes[:20])
+    historico = HistoricoAlteracoes(store)
+    estados = [store.para_lista()]
+
+    store.adicionar_varios(componentes[20:])
+    estados.append(store.para_lista())
+    store.atualizar_varios({i: {"semestre": 7, "observacoes": "lote"} for i in range(1, 11)})
+    estados.append(store.para_lista())
+    store.remover_varios(range(5, 25))
+    estados.append(store.para_lista())
+
+    for estado in reversed(estados[:-1]):
+        historico.desfazer()
+        assert store.para_lista() == estado
+    assert not historico.pode_desfazer
+    assert historico.desfazer() is None
+
+    for estado in estados[1:]:
+        historico.refazer()
+        assert store.para_lista() == estado
+    assert not historico.pode_refazer
+
+
+def test_desfazer_edicao_mantem_a_posicao():
+    componentes = gerar_componentes(10, semente=13)
+    store = ComponentStore(componentes)
+    historico = HistoricoAlteracoes(store)
+
+    store.atualizar_varios({2: {"nome": "A"}, 7: {"nome": "B"}})
+    historico.desfazer()
+
+    assert store.para_lista() == componentes
+
+
+def test_desfazer_remocao_devolve_o_componente_a_posicao():
+    componentes = gerar_componentes(12, semente=15)
+    store = ComponentStore(componentes)
+    historico = HistoricoAlteracoes(store)
+
+    store.remover(5)
+    store.remover_varios([1, 12, 7, 8])
+    historico.desfazer()
+
+    assert [c["id"] for c in store] == [c["id"] for c in componentes if c["id"] != 5]
+    assert store.por_nucleo(componentes[0]["nucleo"]) == [
+        c for c in store.para_lista() if c["nucleo"] == componentes[0]["nucleo"]
+    ]
+
+    historico.desfazer()
+    assert store.para_lista() == componentes
+
+    historico.refazer()
+    historico.refazer()
+    assert store.para_lista() == [c for c in componentes if c["id"] not in (1, 5, 7, 8, 12)]
+
+
+def test_nova_alteracao_descarta_o_refazer():
+    store = ComponentStore(gerar_componentes(5))
+    historico = HistoricoAlteracoes(store)
+    store.remover(1)
+    historico.desfazer()
+
+    store.atualizar(2, {"nome": "Outro"})
+
+    assert not historico.pode_refazer
+    assert descrever_alteracao(historico.proximo_desfazer()) == "edição de \"Outro\""
+
+
+def test_historico_e_limitado():
+    store = ComponentStore(gerar_componentes(5))
+    historico = HistoricoAlteracoes(store, max_entradas=3)
+
+    for i in range(10):
+        store.atualizar(1, {"observacoes": str(i)})
+    while historico.pode_desfazer:
+        historico.desfazer()
+
+    assert store.obter(1)["observacoes"] == "6"
+
+
+def test_descricao_das_operacoes_em_lote():
+    store = ComponentStore(gerar_componentes(5))
+    historico = HistoricoAlteracoes(store)
+
+    store.remover_varios([1, 2, 3])
+
+    assert descrever_alteracao(historico.proximo_desfazer()) == "remoção de 3 componentes"
+
+
+def test_desfazer_e_refazer_sao_gravados(tmp_path):
+    caminho = str(tmp_path / "cursos.db")
+    componentes = gerar_componentes(15, semente=14)
+    espaco = EspacoTrabalho(RepositorioCursos(caminho))
+    curso_id = espaco.criar("Histórico", componentes, ultimo_id=15)
+    store = espaco.abrir(curso_id)
+    historico = HistoricoAlteracoes(store)
+
+    def gravado():
+        with RepositorioCursos(caminho) as repositorio:
+            componentes, _ = repositorio.carregar_curso(curso_id)
+        return componentes
+
+    store.remover_varios([1, 6, 15])
+    store.atualizar_varios({4: {"nome": "Editado"}})
+    historico.desfazer()
+    historico.desfazer()
+    assert gravado() == componentes
+
+    historico.refazer()
+    assert gravado() == store.para_lista()
+    assert 1 not in [c["id"] for c in gravado()]
+    assert espaco.resumo(curso_id).quantidade_componentes == 12
+    espaco.repositorio.fechar()
+
+
+def test_desfazer_remocao_no_backup_incremental():
+    componentes = gerar_componentes(15, semente=16)
+    store = ComponentStore(componentes)
+    diario = DiarioOperacoes(store)
+    historico = HistoricoAlteracoes(store)
+    completo, _ = diario.exportar_backup(15)
+
+    store.remover_varios([2, 9])
+    historico.desfazer()
+    incremental, eh_completo = diario.exportar_backup(15)
+
+    restaurados, _, sucesso, _ = restaurar_cadeia([("completo.json", completo), ("incremental.json", incremental)])
+    assert sucesso and not eh_completo
+    assert restaurados == componentes
@@ -0,0 +1,84 @@
+"""
+Testes da importação de componentes: ida e volta pelos arquivos exportados
+e erros por linha.
+"""
+
+import csv
+import io
+
+import pytest
+
+from tests.auxiliares import TEMAS_NUCLEO_I, gerar_componentes
+from utils.exportacoes import COLUNAS_COMPONENTES, exportar_csv, exportar_xlsx
+from utils.importacoes import importar_componentes
+
+
+def _sem_id(componentes):
+    return [{campo: valor for campo, valor in c.items() if campo != "id"} for c in componentes]
+
+
+def _csv(*linhas):
+    saida = io.StringIO()
+    csv.writer(saida, delimiter=";").writerows(linhas)
+    return saida.getvalue().encode("utf-8-sig")
+
+
+def _linha(**campos):
+    valores = {"Semestre": 1, "Nome": "Didática", "Tipo": "Disciplina", "Aulas Semanais": 4, "Núcleo": "I",
+               "Temas Núcleo I": TEMAS_NUCLEO_I[0]}
+    valores.update(campos)
+    return [valores.get(coluna, "") for coluna in COLUNAS_COMPONENTES]
+
+
+@pytest.mark.parametrize("formato", ["csv", "xlsx"])
+def test_ida_e_volta_pelo_arquivo_exportado(formato):
+    componentes = gerar_componentes(40, semente=15)
+    exportar = exportar_csv if formato == "csv" else exportar_xlsx
+
+    resultado = importar_componentes(exportar(componentes), f"componentes.{formato}")
+
+    assert resultado.invalidos == []
+    assert resultado.validos == _sem_id(componentes)
+
+
+def test_linhas_invalidas_sao_apontadas_sem_descartar_as_demais():
+    conteudo = _csv(
+        COLUNAS_COMPONENTES,
+        _linha(),
+        _linha(Semestre="Optativa"),
+        _linha(Semestre=""),
+        _linha(Semestre="2,5"),
+        _linha(Semestre=21),
+        _linha(**{"CH Total": "muitas"}),
+        [""] * len(COLUNAS_COMPONENTES),
+        _linha(Nome="", Semestre="3"),
+    )
+
+    resultado = importar_componentes(conteudo, "componentes.csv")
+
+    assert [c["nome"] for c in resultado.validos] == ["Didática"]
+    assert resultado.validos[0]["ch_total"] == 72
+    linhas = {linha: erros for linha, _, erros in resultado.invalidos}
+    # A linha em branco (8) é ignorada
+    assert sorted(linhas) == [3, 4, 5, 6, 7, 9]
+    for linha in (3, 4, 5, 6):
+        assert linhas[linha][0].startswith("Semestre: informe um número inteiro")
+    assert "valor vazio" in linhas[4][0]
+    assert linhas[7] == ["CH Total: valor numérico inválido (muitas)"]
+    assert resultado.total == 7
+
+
+def test_semestre_inteiro_escrito_como_decimal_e_aceito():
+    resultado = importar_componentes(_csv(COLUNAS_COMPONENTES, _linha(Semestre="2.0")), "componentes.csv")
+
+    assert resultado.validos[0]["semestre"] == 2
+
+
+def test_colunas_obrigatorias_ausentes():
+    with pytest.raises(ValueError, match="Semestre"):
+        importar_componentes(_csv(["Nome", "Tipo", "Núcleo"], ["X", "Disciplina", "I"]), "componentes.csv")
+
+
+def test_formato_nao_suportado():
+    with pytest.raises(ValueError, match="Formato não suportado"):
+        importar_componentes(b"{}", "componentes.json")
@@ -0,0 +1,115 @@
+"""
+Testes do processamento em lote de backups pela linha de comando.
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+from tests.auxiliares import gerar_componentes
+from utils.backup import exportar_backup_json
+from utils.lote import main, nomes_exportacao, validar_lote
+
+
+def _gravar_backup(caminho, componentes):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(exportar_backup_json(componentes, len(componentes)))
+    return str(caminho)
+
+
+@pytest.fixture
+def backups(tmp_path):
+    """Diretório com um backup correto, um JSON inválido e um com dados malformados."""
+    diretorio = tmp_path / "backups"
+    _gravar_backup(diretorio / "a_fisica.json", gerar_componentes(12, semente=2))
+    (diretorio / "b_ilegivel.json").write_text("{nao e json", encoding="utf-8")
+    _gravar_backup(diretorio / "c_malformado.json", [{"id": 1, "nucleo": "I", "ch_total": "setenta"}])
+    (diretorio / "leia-me.txt").write_text("ignorado", encoding="utf-8")
+    return diretorio
+
+
+def test_validar_lote_relata_cada_backup(backups):
+    caminhos = sorted(str(caminho) for caminho in backups.glob("*.json"))
+
+    relatorio = validar_lote(caminhos, processos=1)
+
+    assert relatorio["total_cursos"] == 3
+    assert relatorio["cursos_com_erro_de_leitura"] == 2
+    fisica, ilegivel, malformado = relatorio["cursos"]
+    assert fisica["carregado"] and fisica["componentes"] == 12
+    assert fisica["quantidade_erros"] == len(fisica["erros"])
+    assert not ilegivel["carregado"] and "JSON" in ilegivel["mensagem"]
+    assert not malformado["carregado"] and malformado["mensagem"].startswith("Erro ao validar curso")
+    assert not malformado["valido"] and malformado["erros"] == []
+
+
+def test_validar_em_paralelo_igual_ao_sequencial(backups):
+    caminhos = sorted(str(caminho) for caminho in backups.glob("*.json"))
+
+    def sem_tempo(relatorio):
+        return [{**curso, "tempo_ms": None} for curso in relatorio["cursos"]]
+
+    assert sem_tempo(validar_lote(caminhos, processos=2)) == sem_tempo(validar_lote(caminhos, processos=1))
+
+
+def test_comando_validar_gera_relatorios(backups, tmp_path, capsys):
+    prefixo = str(tmp_path / "relatorio")
+
+    assert main(["validar", str(backups), "--saida", prefixo, "--processos", "1"]) == 0
+
+    with open(f"{prefixo}.json", encoding="utf-8") as f:
+        relatorio = json.load(f)
+    with open(f"{prefixo}.csv", encoding="utf-8-sig", newline="") as f:
+        linhas = list(csv.DictReader(f, delimiter=";"))
+    assert [linha["arquivo"] for linha in linhas] == ["a_fisica.json", "b_ilegivel.json", "c_malformado.json"]
+    assert linhas[0]["erros"] == " | ".join(relatorio["cursos"][0]["erros"])
+    assert "3 curso(s) validado(s)" in capsys.readouterr().out
+
+
+def test_comando_validar_sem_backups(tmp_path):
+    assert main(["validar", str(tmp_path)]) == 2
+    assert main(["validar", str(tmp_path / "inexistente")]) == 2
+
+
+def test_nomes_exportacao_distinguem_backups_de_mesmo_nome(tmp_path):
+    caminhos = [
+        str(tmp_path / "campus_a" / "curso.json"),
+        str(tmp_path / "campus_b" / "curso.json"),
+        str(tmp_path / "campus_b" / "outro.json")
+    ]
+
+    assert nomes_exportacao(caminhos) == ["campus_a__curso", "campus_b__curso", "outro"]
+    assert nomes_exportacao(caminhos[1:]) == ["curso", "outro"]
+
+
+def test_comando_exportar_ignora_cursos_atualizados(tmp_path, capsys):
+    campus_a = _gravar_backup(tmp_path / "campus_a" / "curso.json", gerar_componentes(5, semente=3))
+    campus_b = _gravar_backup(tmp_path / "campus_b" / "curso.json", gerar_componentes(6, semente=4))
+    destino = tmp_path / "saida"
+    argumentos = ["exportar", campus_a, campus_b, "--destino", str(destino), "--formatos", "csv", "--processos", "1"]
+
+    assert main(argumentos) == 0
+    assert sorted(os.listdir(destino)) == ["campus_a__curso.csv", "campus_b__curso.csv"]
+    assert "2 curso(s) exportado(s), 0 já atualizado(s)" in capsys.readouterr().out
+
+    relatorio = str(tmp_path / "relatorio.json")
+    assert main([*argumentos, "--relatorio", relatorio]) == 0
+    with open(relatorio, encoding="utf-8") as f:
+        assert [curso["situacao"] for curso in json.load(f)["cursos"]] == ["atualizado", "atualizado"]
+
+    assert main([*argumentos, "--forcar"]) == 0
+    assert "2 curso(s) exportado(s)" in capsys.readouterr().out
+
+
+def test_comando_exportar_informa_backups_com_erro(backups, tmp_path, capsys):
+    destino = tmp_path / "saida"
+
+    codigo = main(["exportar", str(backups), "--destino", str(destino), "--formatos", "csv", "xlsx", "--processos", "2"])
+
+    assert codigo == 1
+    assert sorted(os.listdir(destino)) == ["a_fisica.csv", "a_fisica.xlsx"]
+    erros = capsys.readouterr().err
+    assert "b_ilegivel.json" in erros and "c_malformado.json" in erros
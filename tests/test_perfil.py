@@ -0,0 +1,80 @@
+"""
+Testes do diagnóstico de desempenho: ativação, seções aninhadas e registro no log.
+"""
+
+import json
+import logging
+
+import pytest
+
+from tests.auxiliares import gerar_componentes
+from utils.calculos import calcular_indicadores
+from utils.perfil import PerfilExecucao, instrumentar, perfil_habilitado, perfilar_execucao, secao
+
+
+@pytest.fixture(autouse=True)
+def sem_variavel_de_ambiente(monkeypatch):
+    monkeypatch.delenv("PPC_PERFIL", raising=False)
+
+
+def test_desativado_por_padrao(monkeypatch):
+    assert not perfil_habilitado()
+    assert not perfil_habilitado({})
+    assert not perfil_habilitado({"perfil": "0"})
+    assert perfil_habilitado({"perfil": "1"})
+    assert perfil_habilitado({"perfil": "Sim"})
+
+    monkeypatch.setenv("PPC_PERFIL", "true")
+    assert perfil_habilitado()
+
+
+def test_sem_diagnostico_nada_e_medido():
+    chamadas = []
+
+    @instrumentar
+    def somar(a, b):
+        chamadas.append((a, b))
+        return a + b
+
+    with secao("Fora de uma execução"):
+        assert somar(1, 2) == 3
+
+    assert chamadas == [(1, 2)]
+    assert somar.__name__ == "somar"
+
+
+def test_secoes_aninhadas_e_funcoes_instrumentadas(caplog):
+    componentes = gerar_componentes(20)
+
+    with caplog.at_level(logging.INFO, logger="ppc.perfil"), perfilar_execucao() as perfil:
+        with secao("Aba: Componentes"):
+            calcular_indicadores(componentes)
+            calcular_indicadores(componentes)
+        with secao("Barra lateral"):
+            pass
+
+    secoes = {registro["secao"]: registro for registro in perfil.secoes()}
+    assert list(secoes) == [
+        "Aba: Componentes",
+        "Aba: Componentes › calculos.calcular_indicadores",
+        "Barra lateral"
+    ]
+    assert secoes["Aba: Componentes › calculos.calcular_indicadores"]["chamadas"] == 2
+    assert secoes["Aba: Componentes › calculos.calcular_indicadores"]["nivel"] == 1
+
+    registro = json.loads(caplog.records[-1].getMessage())
+    assert registro["evento"] == "perfil_execucao"
+    assert [secao_log["secao"] for secao_log in registro["secoes"]] == list(secoes)
+
+
+def test_tempo_total_e_percentuais():
+    perfil = PerfilExecucao()
+    with perfil.secao("A"):
+        pass
+    perfil.finalizar()
+    total = perfil.total_ms
+
+    assert perfil.total_ms == total
+    (registro,) = perfil.secoes()
+    assert registro["chamadas"] == 1
+    assert 0 <= registro["percentual"] <= 100
@@ -0,0 +1,114 @@
+"""
+Testes do salvamento automático: gravação e leitura dos cursos no SQLite,
+reserva de ids e conexões do repositório.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from tests.auxiliares import gerar_componentes
+from utils import persistencia
+from utils.armazenamento import ComponentStore
+from utils.persistencia import RepositorioCursos
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "cursos.db")
+
+
+@pytest.fixture
+def repositorio(caminho):
+    with RepositorioCursos(caminho) as repositorio:
+        yield repositorio
+
+
+def _acompanhar(repositorio, curso_id, store):
+    """Grava no repositório cada alteração do store."""
+    store.observar(lambda alteracao: repositorio.gravar_alteracao(curso_id, alteracao))
+    return store
+
+
+def test_alteracoes_gravadas_e_lidas_de_volta(repositorio, caminho):
+    componentes = gerar_componentes(30, semente=8)
+    repositorio.substituir_curso("fisica", componentes, 30, "Física")
+    store = _acompanhar(repositorio, "fisica", ComponentStore(componentes))
+
+    store.atualizar(5, {"nome": "Editado"})
+    store.remover_varios([1, 2])
+    store.adicionar({**componentes[0], "id": 31})
+    store.atualizar_varios({3: {"semestre": 8}, 4: {"observacoes": "lote"}})
+
+    # Outra conexão (ex.: outra sessão) lê o mesmo conteúdo, na mesma ordem
+    with RepositorioCursos(caminho) as outro:
+        lidos, ultimo_id = outro.carregar_curso("fisica")
+    assert lidos == store.para_lista()
+    assert ultimo_id == 31
+
+
+def test_substituir_e_excluir_curso(repositorio):
+    repositorio.substituir_curso("quimica", gerar_componentes(10), 10)
+    novos = gerar_componentes(3, semente=5)
+
+    repositorio.substituir_curso("quimica", novos, 3)
+
+    assert repositorio.carregar_curso("quimica") == (novos, 10)
+    repositorio.excluir_curso("quimica")
+    assert repositorio.carregar_curso("quimica") is None
+
+
+def test_reservas_simultaneas_recebem_ids_distintos(repositorio, caminho):
+    repositorio.substituir_curso("concorrente", gerar_componentes(1), 1)
+    reservados = []
+    trava = threading.Lock()
+
+    def reservar():
+        with RepositorioCursos(caminho) as outro:
+            for _ in range(20):
+                ultimo = outro.reservar_ids("concorrente", 2)
+                with trava:
+                    reservados.extend((ultimo - 1, ultimo))
+
+    threads = [threading.Thread(target=reservar) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(reservados) == list(range(2, 2 + 4 * 20 * 2))
+
+
+def test_reserva_sem_returning(repositorio, monkeypatch):
+    monkeypatch.setattr(persistencia, "SUPORTA_RETURNING", False)
+    repositorio.substituir_curso("antigo", gerar_componentes(2), 2)
+
+    assert repositorio.reservar_ids("antigo", 3) == 5
+    assert repositorio.reservar_ids("antigo") == 6
+    with pytest.raises(KeyError):
+        repositorio.reservar_ids("inexistente")
+
+
+def test_reservar_ids_de_curso_inexistente(repositorio):
+    with pytest.raises(KeyError):
+        repositorio.reservar_ids("inexistente")
+
+
+def test_conexoes_reaproveitadas_e_fechadas(caminho):
+    repositorio = RepositorioCursos(caminho)
+    for i in range(5):
+        repositorio.substituir_curso(f"curso{i}", gerar_componentes(2), 2)
+        repositorio.carregar_curso(f"curso{i}")
+
+    assert len(repositorio._abertas) == 1
+    (conexao,) = repositorio._abertas
+
+    repositorio.fechar()
+
+    assert repositorio._abertas == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        conexao.execute("SELECT 1")
+    # Um repositório fechado volta a abrir conexões se for usado de novo
+    assert repositorio.carregar_curso("curso0") is not None
+    repositorio.fechar()
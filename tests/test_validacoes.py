@@ -0,0 +1,68 @@
+"""
+Testes da validação do curso: com um ComponentStore, o cache por
+componente deve produzir o mesmo resultado que validar a lista inteira.
+"""
+
+from tests.auxiliares import gerar_componentes
+from utils.armazenamento import ComponentStore
+from utils.validacoes import validar_alteracoes, validar_componente, validar_curso_completo
+
+
+def _comparar(store):
+    assert validar_curso_completo(store) == validar_curso_completo(store.para_lista())
+
+
+def test_curso_gerado_e_valido_por_componente():
+    componentes = gerar_componentes(50, semente=1)
+
+    assert all(validar_componente(c)[0] for c in componentes)
+    _comparar(ComponentStore(componentes))
+
+
+def test_resultado_do_store_acompanha_edicoes():
+    componentes = gerar_componentes(60, semente=2)
+    store = ComponentStore(componentes)
+    _comparar(store)
+
+    # Tornar componentes inválidos e depois corrigi-los
+    store.atualizar(componentes[5]["id"], {"nome": ""})
+    store.atualizar_varios({c["id"]: {"ch_total": -1} for c in componentes[10:13]})
+    _comparar(store)
+    resultado = validar_curso_completo(store)
+    assert not resultado["valido"]
+    assert any("Componente 6 " in erro for erro in resultado["erros"])
+
+    store.atualizar(componentes[5]["id"], {"nome": componentes[5]["nome"]})
+    _comparar(store)
+    assert not any("Componente 6 " in erro for erro in validar_curso_completo(store)["erros"])
+
+
+def test_posicoes_dos_erros_acompanham_remocoes():
+    componentes = gerar_componentes(30, semente=4)
+    store = ComponentStore(componentes)
+    store.atualizar(componentes[20]["id"], {"nome": ""})
+    _comparar(store)
+
+    store.remover_varios([c["id"] for c in componentes[:5]])
+    _comparar(store)
+    assert any("Componente 16 " in erro for erro in validar_curso_completo(store)["erros"])
+
+    store.adicionar_varios([{**c, "semestre": None} for c in componentes[:2]])
+    _comparar(store)
+
+
+def test_alteracoes_so_rejeitam_erros_novos():
+    componentes = gerar_componentes(10, semente=3)
+    # Componente já inválido, como os restaurados de backups antigos
+    componentes[0] = {**componentes[0], "ch_total": -1}
+    store = ComponentStore(componentes)
+    _, erros_anteriores = validar_componente(componentes[0])
+
+    assert validar_alteracoes(store, {1: {"nome": "Renomeado", "semestre": 2}}) == {}
+    assert validar_alteracoes(store, {2: {"semestre": 3}}) == {}
+
+    erros = validar_alteracoes(store, {1: {"nome": ""}, 2: {"nome": ""}, 99: {"nome": "x"}})
+
+    assert set(erros) == {1, 2, 99}
+    assert erros[1] and not set(erros[1]) & set(erros_anteriores)
+    assert erros[99] == ["Componente 99 não encontrado."]
@@ -0,0 +1,89 @@
+"""
+Módulo de agregados de carga horária.
+Responsável por manter totais de CH atualizados incrementalmente.
+"""
+
+# Campos de carga horária acumulados pelo agregado
+CAMPOS_CH = ("ch_total", "ch_teorica", "ch_pratica", "ch_extensao")
+
+
+class AgregadoCargaHoraria:
+    """
+    Totais de carga horária mantidos incrementalmente.
+
+    Guarda somas por curso, por núcleo, por semestre e por semestre × núcleo
+    para cada campo de CH. Cada inclusão, remoção ou edição de componente
+    atualiza os totais em O(1), de modo que as consultas não precisam
+    percorrer a lista de componentes.
+    """
+
+    def __init__(self):
+        self._curso: dict = self._novo_grupo()
+        self._por_nucleo: dict[str, dict] = {}
+        self._por_semestre: dict[int | str, dict] = {}
+        self._por_semestre_nucleo: dict[tuple, dict] = {}
+
+    @staticmethod
+    def _novo_grupo() -> dict:
+        grupo = dict.fromkeys(CAMPOS_CH, 0)
+        grupo["quantidade"] = 0
+        return grupo
+
+    @classmethod
+    def _acumular(cls, grupo: dict, componente: dict, sinal: int):
+        grupo["quantidade"] += sinal
+        for campo in CAMPOS_CH:
+            grupo[campo] += sinal * (componente.get(campo, 0) or 0)
+
+    def _aplicar(self, componente: dict, sinal: int):
+        nucleo = componente.get("nucleo")
+        semestre = componente.get("semestre")
+
+        self._acumular(self._curso, componente, sinal)
+        for indice, chave in (
+            (self._por_nucleo, nucleo),
+            (self._por_semestre, semestre),
+            (self._por_semestre_nucleo, (semestre, nucleo)),
+        ):
+            grupo = indice.get(chave)
+            if grupo is None:
+                grupo = indice[chave] = self._novo_grupo()
+            self._acumular(grupo, componente, sinal)
+            # Descartar grupos vazios evita acúmulo de resíduos de ponto flutuante
+            if grupo["quantidade"] <= 0:
+                del indice[chave]
+
+        if self._curso["quantidade"] <= 0:
+            self._curso = self._novo_grupo()
+
+    def adicionar(self, componente: dict):
+        """Soma a carga horária de um componente aos totais."""
+        self._aplicar(componente, 1)
+
+    def remover(self, componente: dict):
+        """Subtrai a carga horária de um componente dos totais."""
+        self._aplicar(componente, -1)
+
+    def atualizar(self, anterior: dict, atual: dict):
+        """Substitui a contribuição de um componente editado."""
+        self._aplicar(anterior, -1)
+        self._aplicar(atual, 1)
+
+    def total(self, campo: str = "ch_total") -> float:
+        """Retorna a soma de um campo de CH no curso inteiro."""
+        return self._curso[campo]
+
+    def por_nucleo(self, nucleo: str, campo: str = "ch_total") -> float:
+        """Retorna a soma de um campo de CH em um núcleo."""
+        grupo = self._por_nucleo.get(nucleo)
+        return grupo[campo] if grupo else 0
+
+    def por_semestre(self, semestre: int | str, campo: str = "ch_total") -> float:
+        """Retorna a soma de um campo de CH em um semestre."""
+        grupo = self._por_semestre.get(semestre)
+        return grupo[campo] if grupo else 0
+
+    def por_semestre_nucleo(self, semestre: int | str, nucleo: str, campo: str = "ch_total") -> float:
+        """Retorna a soma de um campo de CH em um núcleo dentro de um semestre."""
+        grupo = self._por_semestre_nucleo.get((semestre, nucleo))
+        return grupo[campo] if grupo else 0
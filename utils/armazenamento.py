@@ -0,0 +1,482 @@
+"""
+Módulo de armazenamento dos componentes curriculares.
+Responsável por manter os componentes indexados por id, núcleo, semestre e tipo.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from utils.agregados import AgregadoCargaHoraria
+from utils.cache import CacheLRU
+from utils.perfil import instrumentar
+
+
+@dataclass(frozen=True)
+class Alteracao:
+    """
+    Alteração aplicada a um ComponentStore, entregue aos observadores.
+
+    ``antes`` e ``depois`` têm o mesmo tamanho e trazem, para cada componente
+    afetado, o estado anterior e o novo (None quando o componente não
+    existia ou foi removido). Em remoções, ``posicoes`` traz o índice (a
+    partir de 0) que cada componente ocupava na coleção antes da operação;
+    em inserções feitas por ``inserir_varios``, o índice em que cada um
+    entrou. Nas demais operações, fica vazio.
+    """
+    operacao: str
+    antes: tuple[dict | None, ...]
+    depois: tuple[dict | None, ...]
+    posicoes: tuple[int, ...] = ()
+
+
+class ComponentStore:
+    """
+    Coleção indexada de componentes curriculares.
+
+    Mantém um mapa id → componente (na ordem de inserção) e índices
+    secundários por núcleo, semestre e tipo, permitindo consultas em O(1)
+    e visões filtradas em O(k), onde k é o número de componentes
+    retornados. Remoções registram a posição de cada componente removido
+    (para que possam ser desfeitas no mesmo lugar), o que custa O(n) na
+    primeira remoção após outra.
+
+    A coleção é iterável e pode ser usada em qualquer função que recebe
+    a lista de componentes. O atributo ``agregado`` mantém os totais de
+    carga horária atualizados a cada alteração, e ``versao`` é incrementada
+    a cada mudança de conteúdo, servindo de chave para o cache de
+    resultados derivados (``derivados``).
+
+    Observadores registrados com ``observar`` recebem uma ``Alteracao`` a
+    cada mudança (ex.: para gravar o curso em disco).
+    """
+
+    def __init__(self, componentes: list | None = None):
+        self._componentes: dict[int, dict] = {}
+        self._por_nucleo: dict[str, dict[int, dict]] = {}
+        self._por_semestre: dict[int | str, dict[int, dict]] = {}
+        self._por_tipo: dict[str, dict[int, dict]] = {}
+        self.agregado = AgregadoCargaHoraria()
+        self.derivados = CacheLRU(max_itens=8)
+        self.versao = 0
+
+        # Estado do cache de validação por componente
+        self._validador: Callable | None = None
+        self._sujos: set[int] = set()
+        self._invalidos: dict[int, list[str]] = {}
+        self._posicoes: dict[int, int] | None = {}
+
+        # Grupos dos índices (nome do índice, chave) com componentes fora da ordem da coleção
+        self._desordenados: set[tuple[str, object]] = set()
+
+        self._observadores: list[Callable[[Alteracao], None]] = []
+
+        for comp in componentes or []:
+            self.adicionar(comp)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._componentes.values())
+
+    def __len__(self) -> int:
+        return len(self._componentes)
+
+    def __contains__(self, id_componente) -> bool:
+        return id_componente in self._componentes
+
+    def observar(self, observador: Callable[[Alteracao], None]):
+        """
+        Registra uma função chamada após cada alteração da coleção.
+
+        Args:
+            observador: Função que recebe a Alteracao aplicada
+        """
+        self._observadores.append(observador)
+
+    def deixar_de_observar(self, observador: Callable[[Alteracao], None]):
+        """Remove um observador registrado com ``observar``."""
+        if observador in self._observadores:
+            self._observadores.remove(observador)
+
+    def _notificar(self, operacao: str, antes: list, depois: list, posicoes: list | None = None):
+        if self._observadores and depois:
+            alteracao = Alteracao(operacao, tuple(antes), tuple(depois), tuple(posicoes or ()))
+            for observador in self._observadores:
+                observador(alteracao)
+
+    def _indices(self, componente: dict) -> tuple:
+        return (
+            ("nucleo", self._por_nucleo, componente.get("nucleo")),
+            ("semestre", self._por_semestre, componente.get("semestre")),
+            ("tipo", self._por_tipo, componente.get("tipo")),
+        )
+
+    def _indexar(self, componente: dict):
+        id_componente = componente["id"]
+        self._por_nucleo.setdefault(componente.get("nucleo"), {})[id_componente] = componente
+        self._por_semestre.setdefault(componente.get("semestre"), {})[id_componente] = componente
+        self._por_tipo.setdefault(componente.get("tipo"), {})[id_componente] = componente
+
+    def _reindexar(self, anterior: dict, atual: dict):
+        """Troca um componente nos índices, mantendo a ordem da coleção em cada grupo."""
+        id_componente = atual["id"]
+        for (nome, indice, chave_anterior), (_, _, chave) in zip(self._indices(anterior), self._indices(atual)):
+            if chave == chave_anterior:
+                # Atribuir a uma chave existente preserva a posição no grupo
+                indice[chave][id_componente] = atual
+                continue
+            grupo = indice.get(chave_anterior)
+            if grupo is not None:
+                grupo.pop(id_componente, None)
+                if not grupo:
+                    del indice[chave_anterior]
+            grupo = indice.setdefault(chave, {})
+            grupo[id_componente] = atual
+            if len(grupo) > 1:
+                # Entrou no fim do grupo; reordenado na próxima consulta
+                self._desordenados.add((nome, chave))
+
+    def _grupo(self, nome: str, indice: dict, chave) -> dict[int, dict]:
+        grupo = indice.get(chave, {})
+        if (nome, chave) in self._desordenados:
+            self._desordenados.discard((nome, chave))
+            if grupo:
+                posicoes = self._obter_posicoes()
+                grupo = indice[chave] = dict(sorted(grupo.items(), key=lambda item: posicoes[item[0]]))
+        return grupo
+
+    def _obter_posicoes(self) -> dict[int, int]:
+        if self._posicoes is None:
+            self._posicoes = {id_componente: i for i, id_componente in enumerate(self._componentes, 1)}
+        return self._posicoes
+
+    def _desindexar(self, componente: dict):
+        id_componente = componente["id"]
+        for _, indice, chave in self._indices(componente):
+            grupo = indice.get(chave)
+            if grupo is not None:
+                grupo.pop(id_componente, None)
+                if not grupo:
+                    del indice[chave]
+
+    def adicionar(self, componente: dict):
+        """
+        Adiciona um componente à coleção.
+
+        Args:
+            componente: Dicionário do componente, já contendo a chave "id"
+        """
+        if componente.get("id") is None:
+            raise ValueError("O componente precisa de um 'id' para ser armazenado.")
+
+        existente = self._componentes.get(componente["id"])
+        if existente is not None:
+            self._reindexar(existente, componente)
+            self.agregado.atualizar(existente, componente)
+        else:
+            if self._posicoes is not None:
+                self._posicoes[componente["id"]] = len(self._componentes) + 1
+            self._indexar(componente)
+            self.agregado.adicionar(componente)
+
+        self._componentes[componente["id"]] = componente
+        self._sujos.add(componente["id"])
+        self.versao += 1
+        self._notificar("adicionar", [existente], [componente])
+
+    def remover(self, id_componente: int) -> dict | None:
+        """
+        Remove um componente pelo id.
+
+        Args:
+            id_componente: Identificador do componente
+
+        Returns:
+            Componente removido, ou None se o id não existir
+        """
+        if id_componente not in self._componentes:
+            return None
+        posicao = self._obter_posicoes()[id_componente] - 1
+        componente = self._componentes.pop(id_componente)
+        self._desindexar(componente)
+        self.agregado.remover(componente)
+        self.versao += 1
+        self._sujos.discard(id_componente)
+        self._invalidos.pop(id_componente, None)
+        # As posições seguintes mudam; recalculadas sob demanda
+        self._posicoes = None
+        self._notificar("remover", [componente], [None], [posicao])
+        return componente
+
+    def atualizar(self, id_componente: int, alteracoes: dict) -> dict:
+        """
+        Altera campos de um componente existente.
+
+        O componente armazenado não é modificado: um novo dicionário com as
+        alterações aplicadas ocupa o seu lugar, mantendo a posição original.
+
+        Args:
+            id_componente: Identificador do componente
+            alteracoes: Campos a alterar
+
+        Returns:
+            Componente atualizado
+        """
+        anterior = self._componentes.get(id_componente)
+        if anterior is None:
+            raise KeyError(f"Componente {id_componente} não encontrado.")
+
+        atual = {**anterior, **alteracoes, "id": id_componente}
+        self._reindexar(anterior, atual)
+        self._componentes[id_componente] = atual
+        self._sujos.add(id_componente)
+        self.agregado.atualizar(anterior, atual)
+        self.versao += 1
+        self._notificar("atualizar", [anterior], [atual])
+        return atual
+
+    def adicionar_varios(self, componentes: Iterable[dict]) -> list[dict]:
+        """
+        Adiciona vários componentes de uma vez.
+
+        Componentes com id já existente substituem o armazenado, mantendo a
+        posição; os demais entram no fim da coleção. A coleção muda de versão
+        uma única vez.
+
+        Args:
+            componentes: Dicionários dos componentes, já contendo a chave "id"
+
+        Returns:
+            Lista dos componentes adicionados
+        """
+        componentes = list(componentes)
+        if any(componente.get("id") is None for componente in componentes):
+            raise ValueError("O componente precisa de um 'id' para ser armazenado.")
+
+        anteriores = []
+        for componente in componentes:
+            existente = self._componentes.get(componente["id"])
+            if existente is not None:
+                self._reindexar(existente, componente)
+                self.agregado.atualizar(existente, componente)
+            else:
+                if self._posicoes is not None:
+                    self._posicoes[componente["id"]] = len(self._componentes) + 1
+                self._indexar(componente)
+                self.agregado.adicionar(componente)
+            self._componentes[componente["id"]] = componente
+            self._sujos.add(componente["id"])
+            anteriores.append(existente)
+
+        if componentes:
+            self.versao += 1
+        self._notificar("adicionar", anteriores, componentes)
+        return componentes
+
+    def remover_varios(self, ids: Iterable[int]) -> list[dict]:
+        """
+        Remove vários componentes de uma vez.
+
+        A coleção muda de versão uma única vez, independentemente da
+        quantidade de componentes removidos.
+
+        Args:
+            ids: Identificadores dos componentes (ids inexistentes são ignorados)
+
+        Returns:
+            Lista dos componentes removidos
+        """
+        removidos, posicoes = [], []
+        indices = self._obter_posicoes()
+        for id_componente in ids:
+            componente = self._componentes.pop(id_componente, None)
+            if componente is None:
+                continue
+            self._desindexar(componente)
+            self.agregado.remover(componente)
+            self._sujos.discard(id_componente)
+            self._invalidos.pop(id_componente, None)
+            removidos.append(componente)
+            posicoes.append(indices[id_componente] - 1)
+
+        if removidos:
+            self.versao += 1
+            self._posicoes = None
+        self._notificar("remover", removidos, [None] * len(removidos), posicoes)
+        return removidos
+
+    def inserir_varios(self, itens: Iterable[tuple[int, dict]]) -> list[dict]:
+        """
+        Insere componentes em posições definidas (ex.: ao desfazer uma remoção).
+
+        Os itens são inseridos em ordem crescente de posição, então os
+        índices registrados em uma remoção devolvem cada componente ao lugar
+        que ocupava. Custa O(n), ao contrário de ``adicionar_varios``, que
+        acrescenta no fim da coleção.
+
+        Args:
+            itens: Tuplas (índice a partir de 0, componente); os ids não
+                podem existir na coleção
+
+        Returns:
+            Lista dos componentes inseridos, em ordem crescente de posição
+        """
+        itens = sorted(itens, key=lambda item: item[0])
+        for _, componente in itens:
+            if componente.get("id") is None:
+                raise ValueError("O componente precisa de um 'id' para ser armazenado.")
+            if componente["id"] in self._componentes:
+                raise ValueError(f"O componente {componente['id']} já está na coleção.")
+        if not itens:
+            return []
+
+        ordenados = list(self._componentes.items())
+        posicoes = []
+        for posicao, componente in itens:
+            posicao = max(0, min(posicao, len(ordenados)))
+            ordenados.insert(posicao, (componente["id"], componente))
+            posicoes.append(posicao)
+            self._sujos.add(componente["id"])
+            self._indexar(componente)
+            self.agregado.adicionar(componente)
+            # Entrou no fim dos grupos dos índices; reordenados na próxima consulta
+            for nome, _, chave in self._indices(componente):
+                self._desordenados.add((nome, chave))
+        self._componentes = dict(ordenados)
+        self._posicoes = None
+        self.versao += 1
+        componentes = [componente for _, componente in itens]
+        self._notificar("adicionar", [None] * len(componentes), componentes, posicoes)
+        return componentes
+
+    def atualizar_varios(self, alteracoes: dict[int, dict]) -> list[dict]:
+        """
+        Altera campos de vários componentes de uma vez.
+
+        Todos os ids são conferidos antes de qualquer alteração: se algum não
+        existir, nenhum componente é alterado. A coleção muda de versão uma
+        única vez.
+
+        Args:
+            alteracoes: Mapa id → campos a alterar
+
+        Returns:
+            Lista dos componentes atualizados
+        """
+        ausentes = [id_componente for id_componente in alteracoes if id_componente not in self._componentes]
+        if ausentes:
+            raise KeyError(f"Componentes não encontrados: {', '.join(map(str, ausentes))}.")
+
+        anteriores, atualizados = [], []
+        for id_componente, campos in alteracoes.items():
+            anterior = self._componentes[id_componente]
+            atual = {**anterior, **campos, "id": id_componente}
+            self._reindexar(anterior, atual)
+            self._componentes[id_componente] = atual
+            self._sujos.add(id_componente)
+            self.agregado.atualizar(anterior, atual)
+            anteriores.append(anterior)
+            atualizados.append(atual)
+
+        if atualizados:
+            self.versao += 1
+        self._notificar("atualizar", anteriores, atualizados)
+        return atualizados
+
+    @instrumentar
+    def revalidar(self, validador: Callable[[dict], tuple[bool, list[str]]]) -> list[tuple[int, dict, list[str]]]:
+        """
+        Valida apenas os componentes alterados desde a última chamada.
+
+        Os resultados de cada componente ficam guardados até que ele seja
+        alterado ou removido, então o custo é proporcional ao número de
+        componentes modificados (e de componentes com erros).
+
+        Args:
+            validador: Função que valida um componente, no formato de
+                validar_componente
+
+        Returns:
+            Lista de tuplas (posição, componente, erros) dos componentes
+            inválidos, ordenada pela posição (1, 2, ...) na coleção
+        """
+        if validador is not self._validador:
+            self._validador = validador
+            self._sujos = set(self._componentes)
+            self._invalidos.clear()
+
+        for id_componente in self._sujos:
+            valido, erros = validador(self._componentes[id_componente])
+            if valido:
+                self._invalidos.pop(id_componente, None)
+            else:
+                self._invalidos[id_componente] = erros
+        self._sujos.clear()
+
+        if not self._invalidos:
+            return []
+
+        posicoes = self._obter_posicoes()
+        return sorted(
+            (posicoes[id_componente], self._componentes[id_componente], erros)
+            for id_componente, erros in self._invalidos.items()
+        )
+
+    def obter(self, id_componente: int) -> dict | None:
+        """Retorna o componente com o id informado, ou None."""
+        return self._componentes.get(id_componente)
+
+    def por_nucleo(self, nucleo: str) -> list[dict]:
+        """Retorna os componentes de um núcleo, na ordem de inserção."""
+        return list(self._grupo("nucleo", self._por_nucleo, nucleo).values())
+
+    def por_semestre(self, semestre: int | str) -> list[dict]:
+        """Retorna os componentes de um semestre, na ordem de inserção."""
+        return list(self._grupo("semestre", self._por_semestre, semestre).values())
+
+    def por_tipo(self, tipo: str) -> list[dict]:
+        """Retorna os componentes de um tipo, na ordem de inserção."""
+        return list(self._grupo("tipo", self._por_tipo, tipo).values())
+
+    def semestres(self) -> list:
+        """Retorna os semestres que possuem ao menos um componente."""
+        return list(self._por_semestre)
+
+    def para_lista(self) -> list[dict]:
+        """Retorna os componentes como lista simples (ex.: para backup JSON)."""
+        return list(self._componentes.values())
+
+    def impressao_digital(self) -> str:
+        """Retorna a impressão digital do conteúdo, calculada uma vez por versão."""
+        chave = ("impressao_digital", self.versao)
+        valor = self.derivados.obter(chave)
+        if valor is None:
+            valor = calcular_impressao_digital(self.para_lista())
+            self.derivados.guardar(chave, valor)
+        return valor
+
+
+def calcular_impressao_digital(componentes: list) -> str:
+    """
+    Calcula uma impressão digital (SHA-256) do conteúdo de um curso.
+
+    Cursos com os mesmos componentes, na mesma ordem, têm a mesma impressão
+    digital, mesmo que estejam em sessões diferentes.
+
+    Args:
+        componentes: Lista de dicionários com os componentes (ou ComponentStore)
+
+    Returns:
+        Hash hexadecimal do conteúdo
+    """
+    if isinstance(componentes, ComponentStore):
+        return componentes.impressao_digital()
+
+    conteudo = json.dumps(
+        list(componentes),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
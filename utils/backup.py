@@ -0,0 +1,82 @@
+"""
+Módulo de backup dos componentes curriculares.
+Responsável por serializar e restaurar cursos em arquivos JSON.
+"""
+
+import json
+from datetime import datetime
+
+from utils.perfil import instrumentar
+
+
+@instrumentar
+def exportar_backup_json(
+    componentes: list,
+    ultimo_id: int,
+    diario: dict | None = None,
+    compacto: bool = False
+) -> str:
+    """
+    Exporta os dados do curso para um arquivo JSON (backup).
+    
+    Args:
+        componentes: Lista de componentes
+        ultimo_id: Último ID usado
+        diario: Linhagem e sequência da cadeia de backups incrementais
+            que começa neste backup (ver utils.diario)
+        compacto: Se True, gera o JSON sem indentação (arquivo menor)
+    
+    Returns:
+        String JSON serializada
+    """
+    dados_backup = {
+        "componentes": componentes,
+        "ultimo_id": ultimo_id,
+        "data_backup": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "versao": "1.0"
+    }
+    if diario is not None:
+        dados_backup["diario"] = diario
+    if compacto:
+        return json.dumps(dados_backup, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(dados_backup, ensure_ascii=False, indent=2)
+
+
+@instrumentar
+def importar_backup_json(arquivo_json: str) -> tuple[list, int, bool, str]:
+    """
+    Importa dados de backup a partir de um arquivo JSON.
+    
+    Args:
+        arquivo_json: String JSON com os dados
+    
+    Returns:
+        Tupla (componentes, ultimo_id, sucesso, mensagem)
+    """
+    try:
+        dados = json.loads(arquivo_json)
+        
+        if "componentes" not in dados or "ultimo_id" not in dados:
+            return [], 0, False, "Formato de arquivo inválido. O arquivo deve conter 'componentes' e 'ultimo_id'."
+        
+        componentes = dados["componentes"]
+        ultimo_id = dados.get("ultimo_id", 0)
+        
+        if not isinstance(componentes, list):
+            return [], 0, False, "Formato inválido: 'componentes' deve ser uma lista."
+        
+        if not isinstance(ultimo_id, (int, float)):
+            return [], 0, False, "Formato inválido: 'ultimo_id' deve ser um número."
+
+        ultimo_id = int(ultimo_id)
+        for comp in componentes:
+            if comp.get("id") is None:
+                ultimo_id += 1
+                comp["id"] = ultimo_id
+
+        return componentes, ultimo_id, True, f"Backup restaurado com sucesso! {len(componentes)} componente(s) carregado(s)."
+    
+    except json.JSONDecodeError as e:
+        return [], 0, False, f"Erro ao ler arquivo JSON: {str(e)}"
+    except Exception as e:
+        return [], 0, False, f"Erro ao importar backup: {str(e)}"
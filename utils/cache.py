@@ -0,0 +1,77 @@
+"""
+Módulo de cache para resultados derivados dos componentes curriculares.
+Responsável por guardar resultados recentes com descarte LRU.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
+
+
+class CacheLRU:
+    """
+    Cache limitado com descarte do item usado há mais tempo (LRU).
+
+    O limite pode ser por quantidade de itens e, opcionalmente, pelo tamanho
+    total em bytes (medido pela função ``tamanho``). Seguro para uso entre
+    threads, já que o Streamlit atende cada sessão em uma thread própria.
+    """
+
+    def __init__(
+        self,
+        max_itens: int = 16,
+        max_bytes: int | None = None,
+        tamanho: Callable[[Any], int] = len
+    ):
+        if max_itens <= 0:
+            raise ValueError("O cache precisa comportar ao menos um item.")
+        self.max_itens = max_itens
+        self.max_bytes = max_bytes
+        self._tamanho = tamanho
+        self._itens: OrderedDict = OrderedDict()
+        self._tamanhos: dict = {}
+        self.bytes_ocupados = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def __contains__(self, chave) -> bool:
+        return chave in self._itens
+
+    def obter(self, chave, padrao=None):
+        """Retorna o valor guardado para a chave, marcando-o como usado."""
+        with self._lock:
+            if chave not in self._itens:
+                return padrao
+            self._itens.move_to_end(chave)
+            return self._itens[chave]
+
+    def guardar(self, chave, valor):
+        """
+        Guarda um valor, descartando os itens mais antigos se necessário.
+
+        Com limite em bytes, um valor maior que o próprio limite não é guardado.
+        """
+        with self._lock:
+            if self.max_bytes is not None:
+                tamanho = self._tamanho(valor)
+                if tamanho > self.max_bytes:
+                    return
+                self.bytes_ocupados += tamanho - self._tamanhos.get(chave, 0)
+                self._tamanhos[chave] = tamanho
+
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens or (
+                self.max_bytes is not None and self.bytes_ocupados > self.max_bytes
+            ):
+                chave_antiga, _ = self._itens.popitem(last=False)
+                self.bytes_ocupados -= self._tamanhos.pop(chave_antiga, 0)
+
+    def limpar(self):
+        """Remove todos os itens do cache."""
+        with self._lock:
+            self._itens.clear()
+            self._tamanhos.clear()
+            self.bytes_ocupados = 0
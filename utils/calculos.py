@@ -3,6 +3,51 @@ Módulo de cálculos para componentes curriculares.
 Responsável por calcular cargas horárias e percentuais.
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from utils.armazenamento import ComponentStore
+from utils.perfil import instrumentar
+
+
+NUCLEOS = ("I", "II", "III", "IV")
+
+# Mínimos do curso (Resolução CNE/CP nº 4/2024)
+CH_MINIMA_CURSO = 3200.0
+PERCENTUAL_MINIMO_EXTENSAO = 10.0
+
+
+@dataclass(frozen=True)
+class IndicadoresCurso:
+    """
+    Indicadores de carga horária e conformidade de um curso.
+    
+    Resultado imutável de calcular_indicadores. Os mapeamentos são somente
+    leitura, para que o mesmo objeto possa ser compartilhado entre a
+    interface e as exportações sem risco de divergência.
+    """
+    ch_total: float
+    ch_por_nucleo: Mapping[str, float]
+    ch_teorica: float
+    ch_pratica: float
+    ch_extensao: float
+    percentual_extensao: float
+    percentual_pratica: float
+    ch_semestre_nucleo: Mapping[int | str, Mapping[str, float]]
+    conformidade_nucleos: Mapping[str, bool]
+    ch_total_conforme: bool
+    extensao_conforme: bool
+    
+    @property
+    def conforme(self) -> bool:
+        """Indica se o curso atinge todos os mínimos de carga horária."""
+        return (
+            self.ch_total_conforme
+            and self.extensao_conforme
+            and all(self.conformidade_nucleos.values())
+        )
+
 
 def calcular_ch_total(tipo: str, aulas_semanais: int = 0, ch_manual: float = 0) -> float:
     """
@@ -22,17 +67,21 @@ def calcular_ch_total(tipo: str, aulas_semanais: int = 0, ch_manual: float = 0)
         return ch_manual
 
 
+@instrumentar
 def calcular_ch_por_nucleo(componentes: list, nucleo: str) -> float:
     """
     Calcula a carga horária total de um núcleo específico.
     
     Args:
-        componentes: Lista de dicionários com os componentes
+        componentes: Lista de dicionários com os componentes (ou ComponentStore)
         nucleo: Núcleo a ser calculado (I, II, III ou IV)
     
     Returns:
         Soma da CH total dos componentes do núcleo
     """
+    if isinstance(componentes, ComponentStore):
+        return componentes.agregado.por_nucleo(nucleo)
+    
     return sum(
         comp.get("ch_total", 0)
         for comp in componentes
@@ -40,6 +89,7 @@ def calcular_ch_por_nucleo(componentes: list, nucleo: str) -> float:
     )
 
 
+@instrumentar
 def calcular_ch_total_curso(componentes: list) -> float:
     """
     Calcula a carga horária total do curso.
@@ -50,9 +100,13 @@ def calcular_ch_total_curso(componentes: list) -> float:
     Returns:
         Soma da CH total de todos os componentes
     """
+    if isinstance(componentes, ComponentStore):
+        return componentes.agregado.total("ch_total")
+    
     return sum(comp.get("ch_total", 0) for comp in componentes)
 
 
+@instrumentar
 def calcular_ch_extensao(componentes: list) -> float:
     """
     Calcula a carga horária total de extensão.
@@ -63,9 +117,13 @@ def calcular_ch_extensao(componentes: list) -> float:
     Returns:
         Soma da CH de extensão de todos os componentes
     """
+    if isinstance(componentes, ComponentStore):
+        return componentes.agregado.total("ch_extensao")
+    
     return sum(comp.get("ch_extensao", 0) for comp in componentes)
 
 
+@instrumentar
 def calcular_percentual_extensao(componentes: list) -> float:
     """
     Calcula o percentual de extensão em relação à CH total do curso.
@@ -84,6 +142,24 @@ def calcular_percentual_extensao(componentes: list) -> float:
     return (ch_extensao / ch_total) * 100
 
 
+@instrumentar
+def calcular_ch_teorica(componentes: list) -> float:
+    """
+    Calcula a carga horária total teórica.
+    
+    Args:
+        componentes: Lista de dicionários com os componentes
+    
+    Returns:
+        Soma da CH teórica de todos os componentes
+    """
+    if isinstance(componentes, ComponentStore):
+        return componentes.agregado.total("ch_teorica")
+    
+    return sum(comp.get("ch_teorica", 0) for comp in componentes)
+
+
+@instrumentar
 def calcular_ch_pratica(componentes: list) -> float:
     """
     Calcula a carga horária total de prática.
@@ -94,9 +170,13 @@ def calcular_ch_pratica(componentes: list) -> float:
     Returns:
         Soma da CH prática de todos os componentes
     """
+    if isinstance(componentes, ComponentStore):
+        return componentes.agregado.total("ch_pratica")
+    
     return sum(comp.get("ch_pratica", 0) for comp in componentes)
 
 
+@instrumentar
 def calcular_percentual_pratica_pedagogica(componentes: list) -> float:
     """
     Calcula o percentual de prática pedagógica.
@@ -151,3 +231,68 @@ def obter_ch_minima_por_nucleo(nucleo: str) -> float:
     }
     return minimos.get(nucleo, 0.0)
 
+
+@instrumentar
+def calcular_indicadores(componentes: list) -> IndicadoresCurso:
+    """
+    Calcula todos os indicadores de carga horária do curso de uma só vez.
+    
+    Percorre a lista de componentes uma única vez (ou lê os totais do
+    agregado, quando recebe um ComponentStore).
+    
+    Args:
+        componentes: Lista de dicionários com os componentes
+    
+    Returns:
+        IndicadoresCurso com totais, percentuais, matriz semestre × núcleo
+        e indicadores de conformidade
+    """
+    if isinstance(componentes, ComponentStore):
+        agregado = componentes.agregado
+        ch_total = agregado.total("ch_total")
+        ch_teorica = agregado.total("ch_teorica")
+        ch_pratica = agregado.total("ch_pratica")
+        ch_extensao = agregado.total("ch_extensao")
+        ch_por_nucleo = {nucleo: agregado.por_nucleo(nucleo) for nucleo in NUCLEOS}
+        ch_semestre_nucleo = {
+            semestre: {nucleo: agregado.por_semestre_nucleo(semestre, nucleo) for nucleo in NUCLEOS}
+            for semestre in componentes.semestres()
+        }
+    else:
+        ch_total = ch_teorica = ch_pratica = ch_extensao = 0
+        ch_por_nucleo = dict.fromkeys(NUCLEOS, 0)
+        ch_semestre_nucleo = {}
+        for comp in componentes:
+            ch_comp = comp.get("ch_total", 0)
+            nucleo = comp.get("nucleo")
+            ch_total += ch_comp
+            ch_teorica += comp.get("ch_teorica", 0)
+            ch_pratica += comp.get("ch_pratica", 0)
+            ch_extensao += comp.get("ch_extensao", 0)
+            linha = ch_semestre_nucleo.get(comp.get("semestre"))
+            if linha is None:
+                linha = ch_semestre_nucleo[comp.get("semestre")] = dict.fromkeys(NUCLEOS, 0)
+            if nucleo in ch_por_nucleo:
+                ch_por_nucleo[nucleo] += ch_comp
+                linha[nucleo] += ch_comp
+    
+    percentual_extensao = (ch_extensao / ch_total) * 100 if ch_total else 0.0
+    percentual_pratica = (ch_pratica / ch_total) * 100 if ch_total else 0.0
+    
+    return IndicadoresCurso(
+        ch_total=ch_total,
+        ch_por_nucleo=MappingProxyType(ch_por_nucleo),
+        ch_teorica=ch_teorica,
+        ch_pratica=ch_pratica,
+        ch_extensao=ch_extensao,
+        percentual_extensao=percentual_extensao,
+        percentual_pratica=percentual_pratica,
+        ch_semestre_nucleo=MappingProxyType({
+            semestre: MappingProxyType(linha) for semestre, linha in ch_semestre_nucleo.items()
+        }),
+        conformidade_nucleos=MappingProxyType({
+            nucleo: ch_por_nucleo[nucleo] >= obter_ch_minima_por_nucleo(nucleo) for nucleo in NUCLEOS
+        }),
+        ch_total_conforme=ch_total >= CH_MINIMA_CURSO,
+        extensao_conforme=percentual_extensao >= PERCENTUAL_MINIMO_EXTENSAO
+    )
@@ -0,0 +1,263 @@
+"""
+Módulo do diário de operações dos componentes curriculares.
+Responsável pelos backups incrementais: em vez de serializar o curso inteiro
+a cada backup, apenas as operações feitas desde o último backup completo
+são exportadas.
+
+Uma cadeia de backups começa com um backup completo (snapshot) e segue com
+backups incrementais (deltas), identificados pela linhagem da cadeia e pelo
+número de sequência das operações. Cada delta contém todas as operações
+desde o último snapshot, então a restauração usa apenas o snapshot e o delta
+mais recente. Quando as operações acumuladas passam do limite, o próximo
+backup volta a ser completo (compactação), para que os deltas não cresçam
+indefinidamente.
+"""
+
+import json
+import uuid
+from datetime import datetime
+
+from utils.armazenamento import Alteracao, ComponentStore
+from utils.backup import exportar_backup_json, importar_backup_json
+from utils.perfil import instrumentar
+
+
+VERSAO_DELTA = "1.0"
+
+# Operações desde o último snapshot a partir das quais o próximo backup é completo
+LIMITE_OPERACOES_COMPACTACAO = 500
+
+
+def _serializar(dados: dict) -> str:
+    return json.dumps(dados, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class DiarioOperacoes:
+    """
+    Registro das operações (adicionar, atualizar, remover) feitas em um
+    ComponentStore desde o último backup completo, na ordem em que
+    aconteceram.
+
+    Cada operação recebe um número de sequência. Atualizações guardam apenas
+    os campos alterados, então o tamanho de um delta é proporcional às
+    mudanças, e não ao tamanho do curso. Cada backup incremental contém todas
+    as operações desde o último backup completo: basta o incremental mais
+    recente para restaurar, e um incremental gerado mas não baixado não deixa
+    lacunas. Antes do primeiro backup completo, e depois que as operações
+    passam do limite de compactação, apenas a sequência avança.
+    """
+
+    def __init__(self, componentes: ComponentStore, limite_compactacao: int = LIMITE_OPERACOES_COMPACTACAO):
+        self.componentes = componentes
+        self.limite_compactacao = limite_compactacao
+        self.linhagem = uuid.uuid4().hex[:12]
+        self.seq = 0
+        # Sequência do último backup completo, base dos backups incrementais
+        self.seq_snapshot: int | None = None
+        self._operacoes: list[dict] = []
+        componentes.observar(self.registrar)
+
+    def registrar(self, alteracao: Alteracao):
+        """Registra uma alteração do store (usado como observador)."""
+        # Inserções em posições definidas (ex.: remoção desfeita) guardam a posição
+        posicoes = alteracao.posicoes if alteracao.operacao == "adicionar" else ()
+        for i, (antes, depois) in enumerate(zip(alteracao.antes, alteracao.depois)):
+            self.seq += 1
+            if self.precisa_snapshot():
+                # O próximo backup será completo: as operações não são mais necessárias
+                self._operacoes.clear()
+                continue
+            if depois is None:
+                operacao = {"seq": self.seq, "op": "remover", "id": antes["id"]}
+            elif antes is None:
+                operacao = {"seq": self.seq, "op": "adicionar", "componente": depois}
+                if posicoes:
+                    operacao["posicao"] = posicoes[i]
+            else:
+                campos = {campo: valor for campo, valor in depois.items() if antes.get(campo) != valor}
+                operacao = {"seq": self.seq, "op": "atualizar", "id": depois["id"], "campos": campos}
+            self._operacoes.append(operacao)
+
+    @property
+    def operacoes_pendentes(self) -> int:
+        """Quantidade de operações desde o último backup completo."""
+        return self.seq - (self.seq_snapshot or 0)
+
+    def precisa_snapshot(self) -> bool:
+        """Indica se o próximo backup deve ser completo (início da cadeia ou compactação)."""
+        if self.seq_snapshot is None:
+            return True
+        return self.seq - self.seq_snapshot > self.limite_compactacao
+
+    @instrumentar
+    def exportar_snapshot(self, ultimo_id: int) -> str:
+        """
+        Exporta o curso inteiro e compacta o diário.
+
+        As operações registradas até aqui são descartadas: o snapshot passa a
+        ser a base dos próximos backups incrementais.
+
+        Args:
+            ultimo_id: Último id usado no curso
+
+        Returns:
+            Backup completo em JSON (mesmo formato de exportar_backup_json)
+        """
+        conteudo = exportar_backup_json(
+            self.componentes.para_lista(),
+            ultimo_id,
+            diario={"linhagem": self.linhagem, "seq": self.seq},
+            compacto=True
+        )
+        self._operacoes.clear()
+        self.seq_snapshot = self.seq
+        return conteudo
+
+    @instrumentar
+    def exportar_delta(self, ultimo_id: int) -> str:
+        """
+        Exporta as operações feitas desde o último backup completo.
+
+        Args:
+            ultimo_id: Último id usado no curso
+
+        Returns:
+            Backup incremental em JSON compacto
+        """
+        if self.seq_snapshot is None:
+            raise ValueError("A cadeia de backups precisa começar com um backup completo.")
+        delta = {
+            "tipo": "delta",
+            "versao": VERSAO_DELTA,
+            "linhagem": self.linhagem,
+            "desde": self.seq_snapshot,
+            "ate": self.seq,
+            "ultimo_id": ultimo_id,
+            "data_backup": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "operacoes": self._operacoes
+        }
+        return _serializar(delta)
+
+    def exportar_backup(self, ultimo_id: int) -> tuple[str, bool]:
+        """
+        Exporta o próximo backup da cadeia: completo quando necessário,
+        incremental nos demais casos.
+
+        Returns:
+            Tupla (conteúdo JSON, se o backup é completo)
+        """
+        if self.precisa_snapshot():
+            return self.exportar_snapshot(ultimo_id), True
+        return self.exportar_delta(ultimo_id), False
+
+
+def aplicar_delta(componentes: list[dict], delta: dict) -> list[dict]:
+    """
+    Aplica as operações de um backup incremental a uma lista de componentes.
+
+    Args:
+        componentes: Componentes do curso no backup completo, na ordem de cadastro
+        delta: Backup incremental (dicionário lido do JSON)
+
+    Returns:
+        Nova lista de componentes, com as operações aplicadas
+    """
+    por_id = {componente["id"]: componente for componente in componentes}
+    for operacao in delta["operacoes"]:
+        if operacao["op"] == "adicionar":
+            componente = operacao["componente"]
+            if "posicao" in operacao and componente["id"] not in por_id:
+                itens = list(por_id.items())
+                itens.insert(operacao["posicao"], (componente["id"], componente))
+                por_id = dict(itens)
+            else:
+                por_id[componente["id"]] = componente
+        elif operacao["op"] == "atualizar":
+            if operacao["id"] in por_id:
+                por_id[operacao["id"]] = {**por_id[operacao["id"]], **operacao["campos"]}
+        elif operacao["op"] == "remover":
+            por_id.pop(operacao["id"], None)
+        else:
+            raise ValueError(f"Operação desconhecida no backup incremental: {operacao['op']}")
+    return list(por_id.values())
+
+
+def _erro(mensagem: str) -> tuple[list, int, bool, str]:
+    return [], 0, False, mensagem
+
+
+@instrumentar
+def restaurar_cadeia(arquivos: list[tuple[str, str]]) -> tuple[list, int, bool, str]:
+    """
+    Restaura um curso a partir de um backup completo e, opcionalmente, dos
+    backups incrementais gerados depois dele.
+
+    Os arquivos podem vir em qualquer ordem. Entre os backups completos da
+    cadeia é usado o mais recente, e sobre ele o incremental mais recente
+    (cada incremental já contém todas as operações desde o backup completo).
+    Arquivos de outra cadeia, ou incrementais de um backup completo que não
+    foi enviado, interrompem a restauração.
+
+    Args:
+        arquivos: Tuplas (nome do arquivo, conteúdo JSON)
+
+    Returns:
+        Tupla (componentes, ultimo_id, sucesso, mensagem), como em importar_backup_json
+    """
+    snapshots, deltas = [], []
+    for nome, conteudo in arquivos:
+        try:
+            dados = json.loads(conteudo)
+        except json.JSONDecodeError as e:
+            return _erro(f"Erro ao ler o arquivo {nome}: {str(e)}")
+        if isinstance(dados, dict) and dados.get("tipo") == "delta":
+            deltas.append((nome, dados))
+        else:
+            diario = dados.get("diario") if isinstance(dados, dict) else None
+            snapshots.append((nome, diario or {}, conteudo))
+
+    if not snapshots:
+        return _erro("Selecione também o backup completo em que os backups incrementais se baseiam.")
+
+    linhagens = {diario.get("linhagem") for _, diario, _ in snapshots}
+    if len(linhagens) > 1:
+        return _erro(
+            "Os backups completos selecionados pertencem a cursos ou cadeias diferentes: "
+            + ", ".join(nome for nome, _, _ in snapshots) + ". Selecione apenas um deles."
+        )
+
+    # Backup completo mais recente da cadeia (o de maior sequência)
+    _, diario, conteudo = max(snapshots, key=lambda item: item[1].get("seq", -1))
+    componentes, ultimo_id, sucesso, mensagem = importar_backup_json(conteudo)
+    if not sucesso or not deltas:
+        return componentes, ultimo_id, sucesso, mensagem
+
+    linhagem = diario.get("linhagem")
+    seq = diario.get("seq")
+    outra_cadeia = [nome for nome, delta in deltas if linhagem is None or delta.get("linhagem") != linhagem]
+    if outra_cadeia:
+        return _erro(
+            "Os backups incrementais a seguir não pertencem à cadeia do backup completo selecionado: "
+            + ", ".join(outra_cadeia) + "."
+        )
+    sem_base = [nome for nome, delta in deltas if delta["desde"] > seq]
+    if sem_base:
+        return _erro(
+            "Os backups incrementais a seguir foram gerados a partir de um backup completo mais recente, "
+            "que não foi selecionado: " + ", ".join(sem_base) + "."
+        )
+
+    # Incrementais de backups completos anteriores da mesma cadeia já estão incluídos no selecionado
+    aplicaveis = [(nome, delta) for nome, delta in deltas if delta["desde"] == seq]
+    if not aplicaveis:
+        return componentes, ultimo_id, True, mensagem
+
+    nome, delta = max(aplicaveis, key=lambda item: item[1]["ate"])
+    componentes = aplicar_delta(componentes, delta)
+    return (
+        componentes,
+        max(ultimo_id, delta["ultimo_id"]),
+        True,
+        f"Backup restaurado com sucesso! {len(componentes)} componente(s) carregado(s), "
+        f"com as alterações do backup incremental {nome}."
+    )
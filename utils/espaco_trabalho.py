@@ -0,0 +1,237 @@
+"""
+Módulo do espaço de trabalho com vários cursos.
+Responsável por listar os cursos de uma sessão e abrir cada um sob demanda.
+
+O banco é compartilhado por todas as sessões, mas cada espaço de trabalho
+contém apenas os cursos criados nele ou incluídos pelo identificador (o
+link ?curso=). Os resumos (nome, quantidade de componentes, CH total e
+conformidade) desses cursos ficam em memória; os componentes só são lidos do banco
+quando o curso é aberto, e apenas os cursos abertos mais recentemente são
+mantidos em memória.
+"""
+
+import uuid
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Iterable
+
+from utils.armazenamento import Alteracao, ComponentStore
+from utils.cache import CacheLRU
+from utils.persistencia import RepositorioCursos
+from utils.validacoes import validar_curso_completo
+
+
+# Quantidade de cursos mantidos em memória por sessão
+MAX_CURSOS_ABERTOS = 4
+
+NOME_PADRAO_CURSO = "Curso sem nome"
+
+
+@dataclass(frozen=True)
+class ResumoCurso:
+    """Dados de um curso exibidos na lista de cursos, sem os componentes."""
+    id: str
+    nome: str
+    ultimo_id: int
+    quantidade_componentes: int
+    ch_total: float
+    conforme: bool
+    atualizado_em: str
+
+
+class EspacoTrabalho:
+    """
+    Cursos de uma sessão, gravados em um RepositorioCursos.
+
+    ``abrir`` devolve o ComponentStore do curso: se ele estiver entre os
+    abertos recentemente, sem acesso ao banco; caso contrário, lido com uma
+    consulta. Cada alteração do store é gravada no banco e atualiza o
+    resumo do curso.
+
+    Cursos criados vazios ficam apenas em memória até a primeira alteração
+    (cadastro, renomeação ou reserva de ids), para que visitas sem nenhuma
+    edição não deixem cursos vazios no banco.
+    """
+
+    def __init__(
+        self,
+        repositorio: RepositorioCursos,
+        cursos: Iterable[str] = (),
+        max_cursos_abertos: int = MAX_CURSOS_ABERTOS
+    ):
+        self.repositorio = repositorio
+        self._abertos = CacheLRU(max_itens=max_cursos_abertos)
+        # Cursos ainda não gravados no banco
+        self._pendentes: set[str] = set()
+        self._resumos: dict[str, ResumoCurso] = {}
+        self._carregar_resumos(cursos)
+
+    def _carregar_resumos(self, cursos: Iterable[str]):
+        for linha in self.repositorio.listar_cursos(cursos):
+            self._resumos[linha["id"]] = ResumoCurso(
+                id=linha["id"],
+                nome=linha["nome"] or NOME_PADRAO_CURSO,
+                ultimo_id=linha["ultimo_id"],
+                quantidade_componentes=linha["quantidade_componentes"],
+                ch_total=linha["ch_total"],
+                conforme=bool(linha["conforme"]),
+                atualizado_em=linha["atualizado_em"]
+            )
+
+    def __contains__(self, curso_id) -> bool:
+        return curso_id in self._resumos
+
+    def __len__(self) -> int:
+        return len(self._resumos)
+
+    def listar(self) -> list[ResumoCurso]:
+        """Retorna os resumos dos cursos, do alterado mais recentemente ao mais antigo."""
+        return sorted(self._resumos.values(), key=lambda resumo: resumo.atualizado_em, reverse=True)
+
+    def incluir(self, curso_id: str) -> bool:
+        """
+        Inclui no espaço de trabalho um curso gravado (ex.: aberto pelo link ?curso=).
+
+        Args:
+            curso_id: Identificador do curso
+
+        Returns:
+            True se o curso está no espaço de trabalho; False se ele não existir
+        """
+        if curso_id not in self._resumos:
+            self._carregar_resumos([curso_id])
+        return curso_id in self._resumos
+
+    def resumo(self, curso_id: str) -> ResumoCurso | None:
+        """Retorna o resumo de um curso, ou None se ele não existir."""
+        return self._resumos.get(curso_id)
+
+    def criar(self, nome: str = "", componentes: list | None = None, ultimo_id: int = 0, curso_id: str | None = None) -> str:
+        """
+        Cria um curso; sem componentes iniciais, ele só é gravado no banco na
+        primeira alteração.
+
+        Args:
+            nome: Nome do curso
+            componentes: Componentes iniciais (ex.: os de um backup)
+            ultimo_id: Último id usado pelos componentes iniciais
+            curso_id: Identificador desejado; por padrão, um novo é gerado
+
+        Returns:
+            Identificador do curso
+        """
+        curso_id = curso_id or uuid.uuid4().hex[:12]
+        if componentes:
+            self.repositorio.substituir_curso(curso_id, list(componentes), ultimo_id, nome)
+        else:
+            self._pendentes.add(curso_id)
+        store = self._guardar(curso_id, ComponentStore(componentes))
+        self._atualizar_resumo(curso_id, store, nome=nome or NOME_PADRAO_CURSO, ultimo_id=ultimo_id)
+        return curso_id
+
+    def abrir(self, curso_id: str) -> ComponentStore:
+        """
+        Retorna os componentes de um curso, lendo-os do banco se necessário.
+
+        Args:
+            curso_id: Identificador do curso
+
+        Returns:
+            ComponentStore do curso; as alterações feitas nele são gravadas
+        """
+        store = self._abertos.obter(curso_id)
+        if store is not None:
+            return store
+        if curso_id in self._pendentes:
+            return self._guardar(curso_id, ComponentStore())
+
+        gravado = self.repositorio.carregar_curso(curso_id)
+        if gravado is None:
+            raise KeyError(f"Curso {curso_id} não encontrado.")
+        componentes, _ = gravado
+        return self._guardar(curso_id, ComponentStore(componentes))
+
+    def substituir(self, curso_id: str, componentes: list, ultimo_id: int) -> ComponentStore:
+        """
+        Troca todos os componentes de um curso (ex.: ao restaurar um backup).
+
+        Returns:
+            Novo ComponentStore do curso
+        """
+        self._gravar_pendente(curso_id)
+        self.repositorio.substituir_curso(curso_id, componentes, ultimo_id)
+        store = self._guardar(curso_id, ComponentStore(componentes))
+        anterior = self._resumos.get(curso_id)
+        self._atualizar_resumo(
+            curso_id,
+            store,
+            ultimo_id=max(ultimo_id, anterior.ultimo_id if anterior else 0)
+        )
+        return store
+
+    def renomear(self, curso_id: str, nome: str):
+        """Altera o nome de um curso."""
+        self._resumos[curso_id] = replace(self._resumos[curso_id], nome=nome or NOME_PADRAO_CURSO)
+        if not self._gravar_pendente(curso_id):
+            self.repositorio.renomear_curso(curso_id, nome)
+
+    def reservar_ids(self, curso_id: str, quantidade: int = 1) -> range:
+        """
+        Reserva, no banco, ids para novos componentes de um curso.
+
+        Args:
+            curso_id: Identificador do curso
+            quantidade: Quantidade de ids
+
+        Returns:
+            Ids reservados, em ordem crescente
+        """
+        self._gravar_pendente(curso_id)
+        ultimo_id = self.repositorio.reservar_ids(curso_id, quantidade)
+        self._resumos[curso_id] = replace(self._resumos[curso_id], ultimo_id=ultimo_id)
+        return range(ultimo_id - quantidade + 1, ultimo_id + 1)
+
+    def _gravar_pendente(self, curso_id: str) -> bool:
+        """Grava no banco, com o conteúdo atual, um curso que só existia em memória."""
+        if curso_id not in self._pendentes:
+            return False
+        self._pendentes.discard(curso_id)
+        resumo = self._resumos[curso_id]
+        store = self._abertos.obter(curso_id)
+        componentes = store.para_lista() if store is not None else []
+        nome = "" if resumo.nome == NOME_PADRAO_CURSO else resumo.nome
+        self.repositorio.substituir_curso(curso_id, componentes, resumo.ultimo_id, nome)
+        self.repositorio.atualizar_resumo(curso_id, resumo.quantidade_componentes, resumo.ch_total, resumo.conforme)
+        return True
+
+    def _guardar(self, curso_id: str, store: ComponentStore) -> ComponentStore:
+        store.observar(lambda alteracao: self._ao_alterar(curso_id, store, alteracao))
+        self._abertos.guardar(curso_id, store)
+        return store
+
+    def _ao_alterar(self, curso_id: str, store: ComponentStore, alteracao: Alteracao):
+        anterior = self._resumos[curso_id]
+        ids_gravados = [depois["id"] for depois in alteracao.depois if depois is not None]
+        self._atualizar_resumo(curso_id, store, ultimo_id=max([anterior.ultimo_id, *ids_gravados]))
+        # Um curso pendente é gravado por inteiro, já com a alteração
+        if not self._gravar_pendente(curso_id):
+            self.repositorio.gravar_alteracao(curso_id, alteracao)
+
+    def _atualizar_resumo(self, curso_id: str, store: ComponentStore, **campos):
+        conforme = bool(store) and validar_curso_completo(store)["valido"]
+        ch_total = store.agregado.total()
+        if curso_id not in self._pendentes:
+            self.repositorio.atualizar_resumo(curso_id, len(store), ch_total, conforme)
+
+        anterior = self._resumos.get(curso_id)
+        valores = {
+            "id": curso_id,
+            "nome": anterior.nome if anterior else NOME_PADRAO_CURSO,
+            "ultimo_id": anterior.ultimo_id if anterior else 0,
+            "quantidade_componentes": len(store),
+            "ch_total": ch_total,
+            "conforme": conforme,
+            "atualizado_em": datetime.now().isoformat(timespec="seconds"),
+            **campos
+        }
+        self._resumos[curso_id] = ResumoCurso(**valores)
@@ -0,0 +1,138 @@
+"""
+Módulo de estilos dos relatórios em PDF.
+Responsável por construir, uma única vez por processo, os estilos de parágrafo
+e de tabela usados pelas exportações em PDF.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+
+
+AZUL_UFAL = colors.HexColor('#0B5FA5')
+COR_GRADE = colors.HexColor('#B5C6E0')
+COR_LINHA_ALTERNADA = colors.HexColor('#F6F8FC')
+COR_LINHA_PERIODO = colors.HexColor('#E8EFF9')
+COR_LINHA_TOTAL = colors.HexColor('#F2F5FA')
+
+
+@dataclass(frozen=True)
+class EstilosPDF:
+    """
+    Registro de estilos compartilhado por todos os relatórios em PDF.
+
+    Os estilos são somente leitura: seções que precisam de comandos próprios
+    aplicam um segundo TableStyle sobre o estilo base da tabela, sem alterá-lo.
+    Novos tipos de relatório registram seus estilos em _construir_estilos_pdf.
+    """
+    paragrafos: Mapping[str, ParagraphStyle]
+    tabelas: Mapping[str, TableStyle]
+
+
+def _construir_estilos_pdf() -> EstilosPDF:
+    styles = getSampleStyleSheet()
+
+    paragrafos = {
+        "titulo": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            textColor=AZUL_UFAL,
+            spaceAfter=18,
+            alignment=TA_CENTER
+        ),
+        "secao": ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=12,
+            textColor=AZUL_UFAL,
+            spaceAfter=10,
+            leading=14
+        ),
+        "texto_tabela": ParagraphStyle(
+            'TableText',
+            parent=styles['Normal'],
+            fontSize=7,
+            leading=9,
+            alignment=TA_LEFT
+        ),
+        "cabecalho_tabela": ParagraphStyle(
+            'TableHeader',
+            parent=styles['Normal'],
+            fontSize=7,
+            leading=9,
+            alignment=TA_CENTER,
+            textColor=colors.whitesmoke
+        )
+    }
+
+    tabelas = {
+        "matriz": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), AZUL_UFAL),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (-3, -1), 'CENTER'),
+            ('ALIGN', (-2, 1), (-2, -1), 'CENTER'),
+            ('ALIGN', (-1, 1), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 0.5, COR_GRADE),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, COR_LINHA_ALTERNADA]),
+            ('TOPPADDING', (0, 0), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ]),
+        "resumo_nucleo": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), AZUL_UFAL),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, COR_LINHA_ALTERNADA]),
+            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#E5EDF9')),
+            ('GRID', (0, 0), (-1, -1), 0.5, COR_GRADE),
+            ('TOPPADDING', (0, 0), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ]),
+        # Quadros de duas colunas (rótulo e valor): resumo geral e conformidade
+        "chave_valor": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), AZUL_UFAL),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, COR_GRADE),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ])
+    }
+
+    return EstilosPDF(
+        paragrafos=MappingProxyType(paragrafos),
+        tabelas=MappingProxyType(tabelas)
+    )
+
+
+@lru_cache(maxsize=1)
+def obter_estilos_pdf() -> EstilosPDF:
+    """
+    Retorna o registro de estilos dos relatórios em PDF.
+
+    Construído na primeira chamada e reaproveitado por todas as exportações
+    seguintes do processo.
+
+    Returns:
+        EstilosPDF com os estilos de parágrafo e de tabela
+    """
+    return _construir_estilos_pdf()
@@ -3,27 +3,149 @@ Módulo de exportações para componentes curriculares.
 Responsável por gerar arquivos CSV, XLSX e PDF.
 """
 
-import pandas as pd
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from __future__ import annotations
 
+import csv
+import io
+import math
+import os
+import threading
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
 
-def exportar_csv(componentes: list, caminho_arquivo: str, tabela: str = "componentes") -> str:
+from utils.cache import CacheLRU
+from utils.perfil import instrumentar
+
+# pandas e reportlab são carregados no primeiro uso (ou por aquecer_exportadores),
+# para não pesar na inicialização do app de quem não exporta
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Colunas da tabela de componentes (formato SIGAA), na ordem de exportação
+COLUNAS_COMPONENTES = [
+    "Semestre",
+    "Nome",
+    "Tipo",
+    "Aulas Semanais",
+    "CH Total",
+    "CH Teórica",
+    "CH Prática",
+    "CH Extensão",
+    "Núcleo",
+    "Temas Núcleo I",
+    "Diretrizes Núcleo II",
+    "Descrição Extensão",
+    "Local Realização",
+    "Etapa Estágio",
+    "Bloco",
+    "Observações"
+]
+
+
+def _valor_numerico(valor):
+    """Escreve números como float (36 → 36.0), como a tabela montada com o pandas."""
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return float(valor)
+    return valor
+
+
+def _linha_componente(comp: dict) -> list:
+    """Converte um componente na linha da tabela de componentes (formato SIGAA)."""
+    return [
+        comp.get("semestre", ""),
+        comp.get("nome", ""),
+        comp.get("tipo", ""),
+        _valor_numerico(comp.get("aulas_semanais", "")),
+        _valor_numerico(comp.get("ch_total", "")),
+        _valor_numerico(comp.get("ch_teorica", "")),
+        _valor_numerico(comp.get("ch_pratica", "")),
+        _valor_numerico(comp.get("ch_extensao", "")),
+        comp.get("nucleo", ""),
+        "; ".join(comp.get("temas_nucleo_i", [])) if comp.get("temas_nucleo_i") else "",
+        comp.get("diretrizes_nucleo_ii", ""),
+        comp.get("descricao_extensao", ""),
+        comp.get("local_realizacao", ""),
+        comp.get("etapa_estagio", ""),
+        comp.get("bloco", ""),
+        comp.get("observacoes", "")
+    ]
+
+
+def gerar_csv_componentes(componentes: Iterable[dict], linhas_por_bloco: int = 500) -> Iterator[bytes]:
+    """
+    Gera o CSV da tabela de componentes em blocos, sem montar a tabela inteira.
+    
+    Usa o mesmo formato de exportar_csv (UTF-8 com BOM, delimitador ponto e
+    vírgula). As linhas são escritas diretamente a partir dos componentes,
+    então a memória usada não cresce com o tamanho do catálogo.
+    
+    Args:
+        componentes: Componentes (lista, ComponentStore ou qualquer iterável)
+        linhas_por_bloco: Quantidade de linhas por bloco de bytes gerado
+    
+    Yields:
+        Blocos de bytes do arquivo CSV, prontos para gravação ou download
+    """
+    buffer = io.StringIO()
+    buffer.write("\ufeff")
+    escritor = csv.writer(buffer, delimiter=";", lineterminator="\n")
+    escritor.writerow(COLUNAS_COMPONENTES)
+    linhas_no_bloco = 0
+    
+    for comp in componentes:
+        escritor.writerow(["" if valor is None else valor for valor in _linha_componente(comp)])
+        linhas_no_bloco += 1
+        if linhas_no_bloco >= linhas_por_bloco:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            linhas_no_bloco = 0
+    
+    # O BOM vai no primeiro bloco; o último bloco leva as linhas restantes
+    restante = buffer.getvalue()
+    if restante:
+        yield restante.encode("utf-8")
+
+
+def _abrir_destino(caminho_arquivo: str | BinaryIO | None) -> tuple[str | BinaryIO, io.BytesIO | None]:
+    """
+    Resolve o destino de uma exportação.
+    
+    Caminhos e fluxos graváveis são usados como recebidos; sem destino, a
+    exportação é feita em um buffer em memória.
+    
+    Returns:
+        Tupla (destino, buffer_em_memoria ou None)
+    """
+    if caminho_arquivo is None:
+        buffer = io.BytesIO()
+        return buffer, buffer
+    return caminho_arquivo, None
+
+
+def _resultado_destino(caminho_arquivo: str | BinaryIO | None, buffer: io.BytesIO | None) -> str | BinaryIO | bytes:
+    return buffer.getvalue() if buffer is not None else caminho_arquivo
+
+
+@instrumentar
+def exportar_csv(
+    componentes: list,
+    caminho_arquivo: str | BinaryIO | None = None,
+    tabela: str = "componentes"
+) -> str | BinaryIO | bytes:
     """
     Exporta dados para CSV, permitindo escolher qual tabela será gerada.
     
     Args:
         componentes: Lista de dicionários com os componentes
-        caminho_arquivo: Caminho onde o arquivo será salvo
+        caminho_arquivo: Caminho onde o arquivo será salvo, fluxo binário
+            gravável, ou None para gerar o arquivo em memória
         tabela: Nome da tabela desejada (componentes, matriz, resumo_nucleo)
     
     Returns:
-        Caminho do arquivo salvo
+        Caminho (ou fluxo) recebido; bytes do arquivo quando caminho_arquivo é None
     """
+    destino, buffer = _abrir_destino(caminho_arquivo)
     tabela_normalizada = (tabela or "componentes").lower()
     
     if tabela_normalizada == "matriz":
@@ -31,46 +153,44 @@ def exportar_csv(componentes: list, caminho_arquivo: str, tabela: str = "compone
     elif tabela_normalizada in {"resumo", "resumo_nucleo", "por_nucleo"}:
         df = gerar_resumo_por_semestre_nucleo(componentes)
     else:
-        dados_csv = []
-        for comp in componentes:
-            linha = {
-                "Semestre": comp.get("semestre", ""),
-                "Nome": comp.get("nome", ""),
-                "Tipo": comp.get("tipo", ""),
-                "Aulas Semanais": comp.get("aulas_semanais", ""),
-                "CH Total": comp.get("ch_total", ""),
-                "CH Teórica": comp.get("ch_teorica", ""),
-                "CH Prática": comp.get("ch_pratica", ""),
-                "CH Extensão": comp.get("ch_extensao", ""),
-                "Núcleo": comp.get("nucleo", ""),
-                "Temas Núcleo I": "; ".join(comp.get("temas_nucleo_i", [])) if comp.get("temas_nucleo_i") else "",
-                "Diretrizes Núcleo II": comp.get("diretrizes_nucleo_ii", ""),
-                "Descrição Extensão": comp.get("descricao_extensao", ""),
-                "Local Realização": comp.get("local_realizacao", ""),
-                "Etapa Estágio": comp.get("etapa_estagio", ""),
-                "Bloco": comp.get("bloco", ""),
-                "Observações": comp.get("observacoes", "")
-            }
-            dados_csv.append(linha)
-        df = pd.DataFrame(dados_csv)
+        # Tabela de componentes: escrita em blocos, direto dos componentes
+        if isinstance(destino, (str, os.PathLike)):
+            with open(destino, "wb") as arquivo:
+                for bloco in gerar_csv_componentes(componentes):
+                    arquivo.write(bloco)
+        else:
+            for bloco in gerar_csv_componentes(componentes):
+                destino.write(bloco)
+        return _resultado_destino(caminho_arquivo, buffer)
     
-    df.to_csv(caminho_arquivo, index=False, encoding="utf-8-sig", sep=";")
+    df.to_csv(destino, index=False, encoding="utf-8-sig", sep=";")
     
-    return caminho_arquivo
+    return _resultado_destino(caminho_arquivo, buffer)
 
 
-def exportar_xlsx(componentes: list, caminho_arquivo: str, abas: list[str] | None = None) -> str:
+@instrumentar
+def exportar_xlsx(
+    componentes: list,
+    caminho_arquivo: str | BinaryIO | None = None,
+    abas: list[str] | None = None,
+    memoria_constante: bool = False
+) -> str | BinaryIO | bytes:
     """
     Exporta dados para arquivo XLSX, permitindo selecionar quais abas devem ser geradas.
     
     Args:
         componentes: Lista de dicionários com os componentes
-        caminho_arquivo: Caminho onde o arquivo será salvo
+        caminho_arquivo: Caminho onde o arquivo será salvo, fluxo binário
+            gravável, ou None para gerar o arquivo em memória
         abas: Lista de abas desejadas (matriz, resumo_nucleo, componentes)
+        memoria_constante: Se True, grava as linhas uma a uma com o xlsxwriter
+            em modo de memória constante, sem manter as células em memória
+            (indicado para planilhas institucionais com milhares de linhas)
     
     Returns:
-        Caminho do arquivo salvo
+        Caminho (ou fluxo) recebido; bytes do arquivo quando caminho_arquivo é None
     """
+    import pandas as pd
     from openpyxl.utils import get_column_letter
     
     abas_padrao = ["matriz", "resumo_nucleo", "componentes"]
@@ -79,7 +199,13 @@ def exportar_xlsx(componentes: list, caminho_arquivo: str, abas: list[str] | Non
     if not abas_normalizadas:
         raise ValueError("Selecione ao menos uma aba para exportação.")
     
-    with pd.ExcelWriter(caminho_arquivo, engine='openpyxl') as writer:
+    destino, buffer = _abrir_destino(caminho_arquivo)
+    
+    if memoria_constante:
+        _exportar_xlsx_memoria_constante(componentes, destino, abas_normalizadas)
+        return _resultado_destino(caminho_arquivo, buffer)
+    
+    with pd.ExcelWriter(destino, engine='openpyxl') as writer:
         if "matriz" in abas_normalizadas:
             df_matriz = gerar_matriz_por_periodo(componentes)
             df_matriz.to_excel(writer, sheet_name="Matriz", index=False)
@@ -105,29 +231,10 @@ def exportar_xlsx(componentes: list, caminho_arquivo: str, abas: list[str] | Non
                 worksheet_nucleo.column_dimensions[col_letter].width = min(max_length + 2, 50)
         
         if "componentes" in abas_normalizadas:
-            dados_componentes = []
-            for comp in componentes:
-                linha = {
-                    "Semestre": comp.get("semestre", ""),
-                    "Nome": comp.get("nome", ""),
-                    "Tipo": comp.get("tipo", ""),
-                    "Aulas Semanais": comp.get("aulas_semanais", ""),
-                    "CH Total": comp.get("ch_total", ""),
-                    "CH Teórica": comp.get("ch_teorica", ""),
-                    "CH Prática": comp.get("ch_pratica", ""),
-                    "CH Extensão": comp.get("ch_extensao", ""),
-                    "Núcleo": comp.get("nucleo", ""),
-                    "Temas Núcleo I": "; ".join(comp.get("temas_nucleo_i", [])) if comp.get("temas_nucleo_i") else "",
-                    "Diretrizes Núcleo II": comp.get("diretrizes_nucleo_ii", ""),
-                    "Descrição Extensão": comp.get("descricao_extensao", ""),
-                    "Local Realização": comp.get("local_realizacao", ""),
-                    "Etapa Estágio": comp.get("etapa_estagio", ""),
-                    "Bloco": comp.get("bloco", ""),
-                    "Observações": comp.get("observacoes", "")
-                }
-                dados_componentes.append(linha)
-            
-            df_componentes = pd.DataFrame(dados_componentes)
+            df_componentes = pd.DataFrame(
+                [_linha_componente(comp) for comp in componentes],
+                columns=COLUNAS_COMPONENTES
+            )
             df_componentes.to_excel(writer, sheet_name="Componentes", index=False)
             worksheet_comp = writer.sheets["Componentes"]
             for idx, col in enumerate(df_componentes.columns, 1):
@@ -138,7 +245,122 @@ def exportar_xlsx(componentes: list, caminho_arquivo: str, abas: list[str] | Non
                 col_letter = get_column_letter(idx)
                 worksheet_comp.column_dimensions[col_letter].width = min(max_length + 2, 50)
     
-    return caminho_arquivo
+    return _resultado_destino(caminho_arquivo, buffer)
+
+
+def _escrever_aba_memoria_constante(workbook, nome_aba: str, colunas: list, linhas, formato_cabecalho):
+    """
+    Grava uma aba linha a linha, estimando a largura das colunas durante a escrita.
+    
+    Args:
+        workbook: Workbook do xlsxwriter (em modo constant_memory)
+        nome_aba: Nome da aba
+        colunas: Rótulos do cabeçalho
+        linhas: Iterável de linhas (sequências na ordem das colunas)
+        formato_cabecalho: Formato aplicado ao cabeçalho
+    """
+    worksheet = workbook.add_worksheet(nome_aba)
+    larguras = [len(str(coluna)) for coluna in colunas]
+    worksheet.write_row(0, 0, colunas, formato_cabecalho)
+    
+    for indice_linha, linha in enumerate(linhas, 1):
+        for indice_coluna, valor in enumerate(linha):
+            if valor is None or valor == "" or (isinstance(valor, float) and math.isnan(valor)):
+                continue
+            worksheet.write(indice_linha, indice_coluna, valor)
+            tamanho = len(str(valor))
+            if tamanho > larguras[indice_coluna]:
+                larguras[indice_coluna] = tamanho
+    
+    for indice_coluna, largura in enumerate(larguras):
+        worksheet.set_column(indice_coluna, indice_coluna, min(largura + 2, 50))
+
+
+def _exportar_xlsx_memoria_constante(componentes: list, destino: str | BinaryIO, abas: list[str]):
+    """
+    Gera o XLSX com o xlsxwriter em modo de memória constante.
+    
+    Cada linha é descarregada em disco assim que a próxima começa, então o uso
+    de memória não depende do número de componentes. Mantém as mesmas abas,
+    cabeçalhos e larguras de coluna do modo padrão.
+    """
+    import xlsxwriter
+    
+    workbook = xlsxwriter.Workbook(destino, {"constant_memory": True})
+    # Mesmo estilo de cabeçalho usado pelo pandas no modo padrão
+    formato_cabecalho = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    
+    try:
+        if "matriz" in abas:
+            df_matriz = gerar_matriz_por_periodo(componentes)
+            _escrever_aba_memoria_constante(
+                workbook, "Matriz", list(df_matriz.columns),
+                df_matriz.itertuples(index=False, name=None), formato_cabecalho
+            )
+        
+        if "resumo_nucleo" in abas or "por_nucleo" in abas:
+            df_nucleo = gerar_resumo_por_semestre_nucleo(componentes)
+            _escrever_aba_memoria_constante(
+                workbook, "Por Núcleo", list(df_nucleo.columns),
+                df_nucleo.itertuples(index=False, name=None), formato_cabecalho
+            )
+        
+        if "componentes" in abas:
+            _escrever_aba_memoria_constante(
+                workbook, "Componentes", COLUNAS_COMPONENTES,
+                (_linha_componente(comp) for comp in componentes), formato_cabecalho
+            )
+    finally:
+        workbook.close()
+
+
+# Arquivos gerados, compartilhados por todas as sessões do processo
+_CACHE_ARTEFATOS = CacheLRU(max_itens=128, max_bytes=64 * 1024 * 1024)
+
+
+def _normalizar_opcoes_exportacao(formato: str, opcoes) -> tuple:
+    if formato == "csv":
+        return ((opcoes or "componentes").lower(),)
+    # Abas e seções sempre saem na mesma ordem, independentemente da seleção
+    return tuple(sorted({opcao.lower() for opcao in opcoes or [] if opcao}))
+
+
+@instrumentar
+def exportar_com_cache(formato: str, componentes: list, opcoes=None) -> tuple[bytes, bool]:
+    """
+    Gera um arquivo de exportação em memória, reaproveitando resultados anteriores.
+    
+    Os arquivos ficam em um cache do processo, compartilhado entre sessões e
+    limitado em tamanho (LRU), com chave composta pela impressão digital do
+    conteúdo do curso, pelo formato e pelas opções escolhidas. Assim, exportar
+    de novo o mesmo curso com as mesmas opções não refaz o documento.
+    
+    Args:
+        formato: "csv", "xlsx" ou "pdf"
+        componentes: Lista de dicionários com os componentes (ou ComponentStore)
+        opcoes: Tabela (CSV), lista de abas (XLSX) ou lista de seções (PDF)
+    
+    Returns:
+        Tupla (bytes do arquivo, veio_do_cache)
+    """
+    from utils.armazenamento import calcular_impressao_digital
+    
+    exportadores = {
+        "csv": lambda: exportar_csv(componentes, tabela=opcoes or "componentes"),
+        "xlsx": lambda: exportar_xlsx(componentes, abas=opcoes),
+        "pdf": lambda: exportar_pdf(componentes, secoes=opcoes)
+    }
+    if formato not in exportadores:
+        raise ValueError(f"Formato de exportação desconhecido: {formato}")
+    
+    chave = (calcular_impressao_digital(componentes), formato, _normalizar_opcoes_exportacao(formato, opcoes))
+    dados = _CACHE_ARTEFATOS.obter(chave)
+    if dados is not None:
+        return dados, True
+    
+    dados = exportadores[formato]()
+    _CACHE_ARTEFATOS.guardar(chave, dados)
+    return dados, False
 
 
 def _ordenar_semestre_valor(semestre) -> tuple:
@@ -220,11 +442,42 @@ def _obter_observacao_nucleo(componente: dict) -> str:
     return " | ".join(partes)
 
 
+def _memoizar_derivado(componentes, construtor) -> pd.DataFrame:
+    """
+    Reaproveita um DataFrame derivado enquanto o conteúdo do curso não muda.
+    
+    Para um ComponentStore, o resultado fica no cache LRU da própria coleção
+    (um por sessão), com chave (função, versão do conteúdo). Qualquer alteração
+    incrementa a versão, de modo que resultados antigos nunca são reutilizados.
+    Listas simples são processadas diretamente.
+    """
+    from utils.armazenamento import ComponentStore
+    
+    if not isinstance(componentes, ComponentStore):
+        return construtor(componentes)
+    
+    chave = (construtor.__name__, componentes.versao)
+    df = componentes.derivados.obter(chave)
+    if df is None:
+        df = construtor(componentes)
+        componentes.derivados.guardar(chave, df)
+    # Cópia protege o valor em cache de alterações feitas por quem chamou
+    return df.copy()
+
+
+@instrumentar
 def gerar_matriz_por_periodo(componentes: list) -> pd.DataFrame:
     """
     Gera a matriz curricular principal organizada por período/semestre.
     Inclui linha de cabeçalho por período e linha TOTAL por período.
+    O resultado é reaproveitado enquanto o curso não for alterado.
     """
+    return _memoizar_derivado(componentes, _construir_matriz_por_periodo)
+
+
+def _construir_matriz_por_periodo(componentes: list) -> pd.DataFrame:
+    import pandas as pd
+    
     colunas = [
         "Semestre",
         "Nome",
@@ -331,9 +584,11 @@ def gerar_matriz_por_periodo(componentes: list) -> pd.DataFrame:
     return pd.DataFrame(dados_matriz, columns=colunas)
 
 
+@instrumentar
 def gerar_resumo_por_semestre_nucleo(componentes: list) -> pd.DataFrame:
     """
     Gera um resumo da carga horária por semestre e núcleo.
+    O resultado é reaproveitado enquanto o curso não for alterado.
     
     Args:
         componentes: Lista de dicionários com os componentes
@@ -341,22 +596,23 @@ def gerar_resumo_por_semestre_nucleo(componentes: list) -> pd.DataFrame:
     Returns:
         DataFrame com resumo por semestre e núcleo
     """
-    from utils.calculos import calcular_ch_por_nucleo
+    return _memoizar_derivado(componentes, _construir_resumo_por_semestre_nucleo)
+
+
+def _construir_resumo_por_semestre_nucleo(componentes: list) -> pd.DataFrame:
+    import pandas as pd
+    from utils.calculos import calcular_indicadores
     
-    # Obter todos os semestres únicos
-    semestres = sorted(set(comp.get("semestre", 0) for comp in componentes if comp.get("semestre")))
+    ch_semestre_nucleo = calcular_indicadores(componentes).ch_semestre_nucleo
     
     dados_resumo = []
     
-    for semestre in semestres:
-        # Filtrar componentes do semestre
-        comps_semestre = [c for c in componentes if c.get("semestre") == semestre]
-        
-        # Calcular CH por núcleo neste semestre
-        ch_i = sum(c.get("ch_total", 0) for c in comps_semestre if c.get("nucleo") == "I")
-        ch_ii = sum(c.get("ch_total", 0) for c in comps_semestre if c.get("nucleo") == "II")
-        ch_iii = sum(c.get("ch_total", 0) for c in comps_semestre if c.get("nucleo") == "III")
-        ch_iv = sum(c.get("ch_total", 0) for c in comps_semestre if c.get("nucleo") == "IV")
+    for semestre in sorted(sem for sem in ch_semestre_nucleo if sem):
+        linha = ch_semestre_nucleo[semestre]
+        ch_i = linha["I"]
+        ch_ii = linha["II"]
+        ch_iii = linha["III"]
+        ch_iv = linha["IV"]
         ch_total_semestre = ch_i + ch_ii + ch_iii + ch_iv
         
         dados_resumo.append({
@@ -453,27 +709,173 @@ def _formatar_celula_matriz_pdf(valor, coluna: str) -> str:
     return str(valor)
 
 
-def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | None = None) -> str:
+# Layouts da matriz curricular no PDF
+LAYOUTS_MATRIZ_PDF = ("auto", "tabela_unica", "por_periodo")
+
+# Acima deste número de componentes, o layout "auto" usa uma tabela por período
+LIMITE_TABELA_UNICA_PDF = 150
+
+COLUNAS_MATRIZ_PDF = [
+    "Nome do Componente",
+    "Tipo",
+    "CH Semanal",
+    "CH Teórica",
+    "CH Prática",
+    "CH Extensão",
+    "CH Total",
+    "Núcleo",
+    "Observação do Núcleo"
+]
+
+
+def _resolver_layout_matriz_pdf(layout: str | None, quantidade: int) -> str:
+    layout_normalizado = (layout or "auto").lower()
+    if layout_normalizado not in LAYOUTS_MATRIZ_PDF:
+        raise ValueError(
+            f"Layout de matriz inválido: {layout}. Use um de: {', '.join(LAYOUTS_MATRIZ_PDF)}."
+        )
+    if layout_normalizado == "auto":
+        return "por_periodo" if quantidade > LIMITE_TABELA_UNICA_PDF else "tabela_unica"
+    return layout_normalizado
+
+
+def _linhas_bloco_matriz_pdf(bloco: dict, table_text_style, table_header_style) -> list[list]:
+    """
+    Monta as linhas de um período da matriz: rótulo, componentes e total.
+    """
+    from reportlab.platypus import Paragraph
+    
+    linhas = [[Paragraph(f"{bloco['rotulo']}", table_header_style)] + [""] * (len(COLUNAS_MATRIZ_PDF) - 1)]
+    
+    for comp in bloco["componentes"]:
+        linhas.append([
+            Paragraph(comp.get("nome", "") or "-", table_text_style),
+            comp.get("tipo", "") or "",
+            _formatar_celula_matriz_pdf(_formatar_aulas_semanais(comp.get("aulas_semanais")), "CH Semanal"),
+            _formatar_celula_matriz_pdf(comp.get("ch_teorica", 0), "CH Teórica"),
+            _formatar_celula_matriz_pdf(comp.get("ch_pratica", 0), "CH Prática"),
+            _formatar_celula_matriz_pdf(comp.get("ch_extensao", 0), "CH Extensão"),
+            _formatar_celula_matriz_pdf(comp.get("ch_total", 0), "CH Total"),
+            comp.get("nucleo", "") or "",
+            Paragraph(_obter_observacao_nucleo(comp), table_text_style)
+        ])
+    
+    totais = bloco["totais"]
+    linhas.append([
+        Paragraph("<b>TOTAL DO PERÍODO</b>", table_text_style),
+        "",
+        "",
+        _formatar_celula_matriz_pdf(totais["ch_teorica"], "CH Teórica"),
+        _formatar_celula_matriz_pdf(totais["ch_pratica"], "CH Prática"),
+        _formatar_celula_matriz_pdf(totais["ch_extensao"], "CH Extensão"),
+        _formatar_celula_matriz_pdf(totais["ch_total"], "CH Total"),
+        "",
+        ""
+    ])
+    return linhas
+
+
+def _estilos_periodo_matriz_pdf(linha_periodo: int, linha_total: int) -> list[tuple]:
+    from utils.estilos_pdf import COR_LINHA_PERIODO, COR_LINHA_TOTAL
+    
+    return [
+        ('SPAN', (0, linha_periodo), (-1, linha_periodo)),
+        ('BACKGROUND', (0, linha_periodo), (-1, linha_periodo), COR_LINHA_PERIODO),
+        ('FONTNAME', (0, linha_periodo), (-1, linha_periodo), 'Helvetica-Bold'),
+        ('FONTNAME', (0, linha_total), (-1, linha_total), 'Helvetica-Bold'),
+        ('BACKGROUND', (0, linha_total), (-1, linha_total), COR_LINHA_TOTAL)
+    ]
+
+
+def _montar_tabelas_matriz_pdf(blocos: list[dict], layout: str, estilos) -> list:
+    """
+    Monta a matriz curricular do PDF no layout escolhido.
+    
+    Em "tabela_unica", todos os períodos ficam em uma só tabela. Em
+    "por_periodo", cada período vira uma LongTable própria, que repete o
+    cabeçalho e o rótulo do período nas quebras de página; assim, o custo de
+    layout e de quebra de página cresce linearmente com o número de
+    componentes, em vez de recalcular uma tabela cada vez maior.
+    
+    Returns:
+        Lista de flowables do reportlab
+    """
+    from reportlab.lib.units import cm
+    from reportlab.platypus import LongTable, Paragraph, Table
+    
+    col_widths = [
+        5.9 * cm,  # Nome
+        1.85 * cm,  # Tipo
+        1.4 * cm,  # CH Semanal
+        1.25 * cm,  # CH Teórica
+        1.25 * cm,  # CH Prática
+        1.5 * cm,  # CH Extensão
+        1.25 * cm,  # CH Total
+        1.25 * cm,  # Núcleo
+        2.70 * cm   # Observação
+    ]
+    table_text_style = estilos.paragrafos["texto_tabela"]
+    table_header_style = estilos.paragrafos["cabecalho_tabela"]
+    estilo_base = estilos.tabelas["matriz"]
+    cabecalho = [Paragraph(titulo, table_header_style) for titulo in COLUNAS_MATRIZ_PDF]
+    
+    if layout == "por_periodo":
+        tabelas = []
+        for bloco in blocos:
+            dados_periodo = [cabecalho] + _linhas_bloco_matriz_pdf(bloco, table_text_style, table_header_style)
+            # Cabeçalho e rótulo do período se repetem nas quebras de página
+            tabela_periodo = LongTable(dados_periodo, repeatRows=2, colWidths=col_widths)
+            tabela_periodo.setStyle(estilo_base)
+            tabela_periodo.setStyle(_estilos_periodo_matriz_pdf(1, len(dados_periodo) - 1))
+            tabelas.append(tabela_periodo)
+        return tabelas
+    
+    dados_tabela = [cabecalho]
+    estilos_especificos: list[tuple] = []
+    for bloco in blocos:
+        linhas = _linhas_bloco_matriz_pdf(bloco, table_text_style, table_header_style)
+        linha_periodo_idx = len(dados_tabela)
+        dados_tabela.extend(linhas)
+        estilos_especificos.extend(_estilos_periodo_matriz_pdf(linha_periodo_idx, len(dados_tabela) - 1))
+    
+    tabela_matriz = Table(dados_tabela, repeatRows=1, colWidths=col_widths)
+    tabela_matriz.setStyle(estilo_base)
+    tabela_matriz.setStyle(estilos_especificos)
+    return [tabela_matriz]
+
+
+@instrumentar
+def exportar_pdf(
+    componentes: list,
+    caminho_arquivo: str | BinaryIO | None = None,
+    secoes: list[str] | None = None,
+    layout_matriz: str = "auto"
+) -> str | BinaryIO | bytes:
     """
     Exporta um relatório em PDF configurável, com possibilidade de escolher seções.
     
     Args:
         componentes: Lista de dicionários com os componentes
-        caminho_arquivo: Caminho onde o arquivo será salvo
+        caminho_arquivo: Caminho onde o arquivo será salvo, fluxo binário
+            gravável, ou None para gerar o arquivo em memória
         secoes: Lista de seções desejadas (matriz, resumo_nucleo, resumo_geral, conformidade)
+        layout_matriz: Layout da matriz curricular (tabela_unica, por_periodo
+            ou auto, que usa uma tabela por período em cursos grandes)
     
     Returns:
-        Caminho do arquivo salvo
+        Caminho (ou fluxo) recebido; bytes do arquivo quando caminho_arquivo é None
     """
     from utils.calculos import (
-        calcular_ch_total_curso,
-        calcular_ch_por_nucleo,
-        calcular_percentual_extensao,
-        calcular_percentual_pratica_pedagogica,
+        calcular_indicadores,
         obter_ch_minima_por_nucleo,
-        validar_ch_minima_nucleo
+        CH_MINIMA_CURSO,
+        PERCENTUAL_MINIMO_EXTENSAO
     )
     from utils.validacoes import validar_curso_completo
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+    from utils.estilos_pdf import obter_estilos_pdf
     
     secoes_padrao = ["matriz", "resumo_nucleo", "resumo_geral", "conformidade"]
     secoes_normalizadas = [sec.lower() for sec in (secoes or secoes_padrao) if sec]
@@ -481,8 +883,12 @@ def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | No
     if not secoes_normalizadas:
         raise ValueError("Selecione ao menos uma seção para exportação.")
     
+    layout_resolvido = _resolver_layout_matriz_pdf(layout_matriz, len(componentes))
+    indicadores = calcular_indicadores(componentes)
+    destino, buffer = _abrir_destino(caminho_arquivo)
+    
     doc = SimpleDocTemplate(
-        caminho_arquivo,
+        destino,
         pagesize=A4,
         leftMargin=1.2 * cm,
         rightMargin=1.0 * cm,
@@ -491,38 +897,11 @@ def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | No
     )
     story = []
     
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#0B5FA5'),
-        spaceAfter=18,
-        alignment=TA_CENTER
-    )
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=colors.HexColor('#0B5FA5'),
-        spaceAfter=10,
-        leading=14
-    )
-    table_text_style = ParagraphStyle(
-        'TableText',
-        parent=styles['Normal'],
-        fontSize=7,
-        leading=9,
-        alignment=TA_LEFT
-    )
-    table_header_style = ParagraphStyle(
-        'TableHeader',
-        parent=styles['Normal'],
-        fontSize=7,
-        leading=9,
-        alignment=TA_CENTER,
-        textColor=colors.whitesmoke
-    )
+    estilos = obter_estilos_pdf()
+    title_style = estilos.paragrafos["titulo"]
+    heading_style = estilos.paragrafos["secao"]
+    table_text_style = estilos.paragrafos["texto_tabela"]
+    table_header_style = estilos.paragrafos["cabecalho_tabela"]
     
     story.append(Paragraph("Relatório de Carga Horária - Componentes Curriculares", title_style))
     story.append(Spacer(1, 0.25 * cm))
@@ -533,91 +912,7 @@ def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | No
         if not blocos:
             story.append(Paragraph("Nenhum componente cadastrado.", table_text_style))
         else:
-            colunas_pdf = [
-                "Nome do Componente",
-                "Tipo",
-                "CH Semanal",
-                "CH Teórica",
-                "CH Prática",
-                "CH Extensão",
-                "CH Total",
-                "Núcleo",
-                "Observação do Núcleo"
-            ]
-            dados_tabela = [[Paragraph(titulo, table_header_style) for titulo in colunas_pdf]]
-            estilos_especificos: list[tuple] = []
-            
-            for bloco in blocos:
-                linha_periodo_idx = len(dados_tabela)
-                linha_periodo = [Paragraph(f"{bloco['rotulo']}", table_header_style)] + [""] * (len(colunas_pdf) - 1)
-                dados_tabela.append(linha_periodo)
-                estilos_especificos.extend([
-                    ('SPAN', (0, linha_periodo_idx), (-1, linha_periodo_idx)),
-                    ('BACKGROUND', (0, linha_periodo_idx), (-1, linha_periodo_idx), colors.HexColor('#E8EFF9')),
-                    ('FONTNAME', (0, linha_periodo_idx), (-1, linha_periodo_idx), 'Helvetica-Bold')
-                ])
-                
-                for comp in bloco["componentes"]:
-                    linha = [
-                        Paragraph(comp.get("nome", "") or "-", table_text_style),
-                        comp.get("tipo", "") or "",
-                        _formatar_celula_matriz_pdf(_formatar_aulas_semanais(comp.get("aulas_semanais")), "CH Semanal"),
-                        _formatar_celula_matriz_pdf(comp.get("ch_teorica", 0), "CH Teórica"),
-                        _formatar_celula_matriz_pdf(comp.get("ch_pratica", 0), "CH Prática"),
-                        _formatar_celula_matriz_pdf(comp.get("ch_extensao", 0), "CH Extensão"),
-                        _formatar_celula_matriz_pdf(comp.get("ch_total", 0), "CH Total"),
-                        comp.get("nucleo", "") or "",
-                        Paragraph(_obter_observacao_nucleo(comp), table_text_style)
-                    ]
-                    dados_tabela.append(linha)
-                
-                totais = bloco["totais"]
-                linha_total_idx = len(dados_tabela)
-                dados_tabela.append([
-                    Paragraph("<b>TOTAL DO PERÍODO</b>", table_text_style),
-                    "",
-                    "",
-                    _formatar_celula_matriz_pdf(totais["ch_teorica"], "CH Teórica"),
-                    _formatar_celula_matriz_pdf(totais["ch_pratica"], "CH Prática"),
-                    _formatar_celula_matriz_pdf(totais["ch_extensao"], "CH Extensão"),
-                    _formatar_celula_matriz_pdf(totais["ch_total"], "CH Total"),
-                    "",
-                    ""
-                ])
-                estilos_especificos.append(('FONTNAME', (0, linha_total_idx), (-1, linha_total_idx), 'Helvetica-Bold'))
-                estilos_especificos.append(('BACKGROUND', (0, linha_total_idx), (-1, linha_total_idx), colors.HexColor('#F2F5FA')))
-            
-            col_widths = [
-                5.9 * cm,  # Nome
-                1.85 * cm,  # Tipo
-                1.4 * cm,  # CH Semanal
-                1.25 * cm,  # CH Teórica
-                1.25 * cm,  # CH Prática
-                1.5 * cm,  # CH Extensão
-                1.25 * cm,  # CH Total
-                1.25 * cm,  # Núcleo
-                2.70 * cm   # Observação
-            ]
-            
-            tabela_matriz = Table(dados_tabela, repeatRows=1, colWidths=col_widths)
-            estilo_base = [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0B5FA5')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 8),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 1), (-3, -1), 'CENTER'),
-                ('ALIGN', (-2, 1), (-2, -1), 'CENTER'),
-                ('ALIGN', (-1, 1), (-1, -1), 'LEFT'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#B5C6E0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F6F8FC')]),
-                ('TOPPADDING', (0, 0), (-1, -1), 3),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ]
-            tabela_matriz.setStyle(TableStyle(estilo_base + estilos_especificos))
-            story.append(tabela_matriz)
+            story.extend(_montar_tabelas_matriz_pdf(blocos, layout_resolvido, estilos))
             story.append(Spacer(1, 0.35 * cm))
     
     if "resumo_nucleo" in secoes_normalizadas or "por_nucleo" in secoes_normalizadas:
@@ -639,66 +934,26 @@ def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | No
             repeatRows=1,
             colWidths=[2.5 * cm, 2.6 * cm, 2.6 * cm, 2.6 * cm, 2.6 * cm, 2.6 * cm]
         )
-        tabela_resumo_nucleo.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0B5FA5')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F6F8FC')]),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#E5EDF9')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#B5C6E0')),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
+        tabela_resumo_nucleo.setStyle(estilos.tabelas["resumo_nucleo"])
         story.append(tabela_resumo_nucleo)
         story.append(Spacer(1, 0.35 * cm))
     
     if "resumo_geral" in secoes_normalizadas:
         story.append(Paragraph("Resumo Geral do Curso", heading_style))
-        ch_total = calcular_ch_total_curso(componentes)
-        ch_i = calcular_ch_por_nucleo(componentes, "I")
-        ch_ii = calcular_ch_por_nucleo(componentes, "II")
-        ch_iii = calcular_ch_por_nucleo(componentes, "III")
-        ch_iv = calcular_ch_por_nucleo(componentes, "IV")
-        perc_extensao = calcular_percentual_extensao(componentes)
-        perc_pratica = calcular_percentual_pratica_pedagogica(componentes)
-        
         resumo_geral = [
-            ["Carga Horária Total do Curso", _formatar_carga_horaria(ch_total)],
-            ["CH Núcleo I", _formatar_carga_horaria(ch_i)],
-            ["CH Núcleo II", _formatar_carga_horaria(ch_ii)],
-            ["CH Núcleo III", _formatar_carga_horaria(ch_iii)],
-            ["CH Núcleo IV", _formatar_carga_horaria(ch_iv)],
-            ["Percentual de Extensão", f"{perc_extensao:.2f}%"],
-            ["Percentual de Prática Pedagógica", f"{perc_pratica:.2f}%"]
+            ["Carga Horária Total do Curso", _formatar_carga_horaria(indicadores.ch_total)],
+            ["CH Núcleo I", _formatar_carga_horaria(indicadores.ch_por_nucleo["I"])],
+            ["CH Núcleo II", _formatar_carga_horaria(indicadores.ch_por_nucleo["II"])],
+            ["CH Núcleo III", _formatar_carga_horaria(indicadores.ch_por_nucleo["III"])],
+            ["CH Núcleo IV", _formatar_carga_horaria(indicadores.ch_por_nucleo["IV"])],
+            ["Percentual de Extensão", f"{indicadores.percentual_extensao:.2f}%"],
+            ["Percentual de Prática Pedagógica", f"{indicadores.percentual_pratica:.2f}%"]
         ]
         
         tabela_resumo = Table(resumo_geral, colWidths=[9.0 * cm, 5.0 * cm])
-        tabela_resumo.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0B5FA5')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#B5C6E0')),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
+        tabela_resumo.setStyle(estilos.tabelas["chave_valor"])
         story.append(tabela_resumo)
         story.append(Spacer(1, 0.35 * cm))
-    else:
-        # Necessário para cálculo de conformidade
-        ch_total = calcular_ch_total_curso(componentes)
-        ch_i = calcular_ch_por_nucleo(componentes, "I")
-        ch_ii = calcular_ch_por_nucleo(componentes, "II")
-        ch_iii = calcular_ch_por_nucleo(componentes, "III")
-        ch_iv = calcular_ch_por_nucleo(componentes, "IV")
-        perc_extensao = calcular_percentual_extensao(componentes)
     
     if "conformidade" in secoes_normalizadas:
         story.append(Paragraph("Resumo de Conformidade", heading_style))
@@ -706,18 +961,19 @@ def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | No
         conformidade_itens = []
         
         for nucleo in ["I", "II", "III", "IV"]:
-            ch_atual = calcular_ch_por_nucleo(componentes, nucleo)
             ch_minima = obter_ch_minima_por_nucleo(nucleo)
-            valido, _ = validar_ch_minima_nucleo(ch_atual, ch_minima)
-            status = "✓" if valido else "✗"
-            conformidade_itens.append([f"{status} Núcleo {nucleo} (mín. {ch_minima:.0f}h)", _formatar_carga_horaria(ch_atual)])
+            status = "✓" if indicadores.conformidade_nucleos[nucleo] else "✗"
+            conformidade_itens.append([
+                f"{status} Núcleo {nucleo} (mín. {ch_minima:.0f}h)",
+                _formatar_carga_horaria(indicadores.ch_por_nucleo[nucleo])
+            ])
         
-        status_total = "✓" if ch_total >= 3200 else "✗"
-        status_ext = "✓" if perc_extensao >= 10 else "✗"
+        status_total = "✓" if indicadores.ch_total_conforme else "✗"
+        status_ext = "✓" if indicadores.extensao_conforme else "✗"
         
         conformidade_itens.extend([
-            [f"{status_total} CH Total do Curso (mín. 3200h)", _formatar_carga_horaria(ch_total)],
-            [f"{status_ext} Percentual de Extensão (mín. 10%)", f"{perc_extensao:.2f}%"]
+            [f"{status_total} CH Total do Curso (mín. {CH_MINIMA_CURSO:.0f}h)", _formatar_carga_horaria(indicadores.ch_total)],
+            [f"{status_ext} Percentual de Extensão (mín. {PERCENTUAL_MINIMO_EXTENSAO:.0f}%)", f"{indicadores.percentual_extensao:.2f}%"]
         ])
         
         if resultado_validacao["erros"]:
@@ -726,21 +982,56 @@ def exportar_pdf(componentes: list, caminho_arquivo: str, secoes: list[str] | No
             conformidade_itens.append(["✓ Curso conforme com todas as validações principais", ""])
         
         tabela_conformidade = Table(conformidade_itens, colWidths=[9.0 * cm, 5.0 * cm])
-        tabela_conformidade.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0B5FA5')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#B5C6E0')),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
+        tabela_conformidade.setStyle(estilos.tabelas["chave_valor"])
         story.append(tabela_conformidade)
     
     doc.build(story)
-    return caminho_arquivo
+    return _resultado_destino(caminho_arquivo, buffer)
+
+
+_aquecimento_iniciado = False
+_lock_aquecimento = threading.Lock()
+
+
+def _carregar_bibliotecas_exportacao():
+    try:
+        import pandas  # noqa: F401
+        import openpyxl  # noqa: F401
+        import xlsxwriter  # noqa: F401
+        import reportlab.platypus  # noqa: F401
+        from utils.estilos_pdf import obter_estilos_pdf
+        obter_estilos_pdf()
+    except ImportError:
+        # A falta de uma biblioteca é informada na primeira exportação que precisar dela
+        pass
+
 
+def aquecer_exportadores(em_segundo_plano: bool = True) -> threading.Thread | None:
+    """
+    Carrega antecipadamente as bibliotecas de exportação (pandas, Excel, PDF).
+    
+    Pensado para ser chamado depois da primeira renderização do app: a primeira
+    exportação não espera pelos imports, e a inicialização não paga por eles.
+    Só tem efeito na primeira chamada do processo.
+    
+    Args:
+        em_segundo_plano: Se True, carrega em uma thread daemon; se False,
+            carrega imediatamente
+    
+    Returns:
+        Thread iniciada, ou None se o carregamento não foi feito em segundo plano
+        ou já havia sido iniciado
+    """
+    global _aquecimento_iniciado
+    with _lock_aquecimento:
+        if _aquecimento_iniciado:
+            return None
+        _aquecimento_iniciado = True
+    
+    if not em_segundo_plano:
+        _carregar_bibliotecas_exportacao()
+        return None
+    
+    thread = threading.Thread(target=_carregar_bibliotecas_exportacao, name="aquecimento-exportadores", daemon=True)
+    thread.start()
+    return thread
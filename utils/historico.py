@@ -0,0 +1,135 @@
+"""
+Módulo do histórico de alterações dos componentes curriculares.
+Responsável por desfazer e refazer cadastros, edições e remoções.
+
+O histórico não copia o curso a cada passo: cada entrada é a Alteracao
+entregue pelo ComponentStore, que guarda apenas referências aos componentes
+afetados. Como o store nunca modifica um componente armazenado (uma edição
+cria um novo dicionário), essas referências continuam válidas e são
+compartilhadas com o curso e com as demais entradas.
+"""
+
+from collections import deque
+
+from utils.armazenamento import Alteracao, ComponentStore
+
+
+# Quantidade de alterações que podem ser desfeitas por curso
+MAX_ENTRADAS_HISTORICO = 200
+
+DESCRICOES_OPERACOES = {
+    "adicionar": "cadastro",
+    "atualizar": "edição",
+    "remover": "remoção"
+}
+
+
+def descrever_alteracao(alteracao: Alteracao) -> str:
+    """
+    Descreve uma alteração para exibição (ex.: "remoção de 3 componentes").
+
+    Args:
+        alteracao: Alteração do histórico
+
+    Returns:
+        Descrição da operação e da quantidade de componentes afetados
+    """
+    operacao = DESCRICOES_OPERACOES.get(alteracao.operacao, alteracao.operacao)
+    quantidade = len(alteracao.antes)
+    if quantidade == 1:
+        componente = alteracao.depois[0] or alteracao.antes[0]
+        return f"{operacao} de \"{componente.get('nome', '')}\""
+    return f"{operacao} de {quantidade} componentes"
+
+
+class HistoricoAlteracoes:
+    """
+    Pilhas de desfazer e refazer das alterações de um ComponentStore.
+
+    O histórico observa o store: cada alteração feita no curso entra na
+    pilha de desfazer e esvazia a de refazer. Desfazer aplica ao store a
+    alteração inversa (trocando ``antes`` e ``depois``), que também chega aos
+    outros observadores, como o salvamento automático. As pilhas são
+    limitadas a ``max_entradas``; as alterações mais antigas são descartadas.
+    """
+
+    def __init__(self, componentes: ComponentStore, max_entradas: int = MAX_ENTRADAS_HISTORICO):
+        self.componentes = componentes
+        self._desfazer: deque[Alteracao] = deque(maxlen=max_entradas)
+        self._refazer: deque[Alteracao] = deque(maxlen=max_entradas)
+        self._aplicando = False
+        componentes.observar(self.registrar)
+
+    def registrar(self, alteracao: Alteracao):
+        """Registra uma alteração do store (usado como observador)."""
+        # Alterações feitas pelo próprio histórico não entram nas pilhas
+        if self._aplicando:
+            return
+        self._desfazer.append(alteracao)
+        self._refazer.clear()
+
+    @property
+    def pode_desfazer(self) -> bool:
+        return bool(self._desfazer)
+
+    @property
+    def pode_refazer(self) -> bool:
+        return bool(self._refazer)
+
+    def proximo_desfazer(self) -> Alteracao | None:
+        """Alteração que será desfeita na próxima chamada de ``desfazer``."""
+        return self._desfazer[-1] if self._desfazer else None
+
+    def proximo_refazer(self) -> Alteracao | None:
+        """Alteração que será refeita na próxima chamada de ``refazer``."""
+        return self._refazer[-1] if self._refazer else None
+
+    def _aplicar(self, estados_atuais: tuple, estados_desejados: tuple, posicoes: tuple = ()):
+        removidos = [
+            atual["id"] for atual, desejado in zip(estados_atuais, estados_desejados)
+            if desejado is None and atual is not None
+        ]
+        gravados = [desejado for desejado in estados_desejados if desejado is not None]
+        self._aplicando = True
+        try:
+            if removidos:
+                self.componentes.remover_varios(removidos)
+            if gravados and posicoes:
+                # Componentes que voltam ao curso retomam a posição registrada
+                self.componentes.inserir_varios(zip(posicoes, gravados))
+            elif gravados:
+                self.componentes.adicionar_varios(gravados)
+        finally:
+            self._aplicando = False
+
+    def desfazer(self) -> Alteracao | None:
+        """
+        Desfaz a alteração mais recente.
+
+        Componentes removidos voltam à posição que ocupavam no curso.
+
+        Returns:
+            Alteração desfeita, ou None se não houver o que desfazer
+        """
+        if not self._desfazer:
+            return None
+        alteracao = self._desfazer.pop()
+        posicoes = alteracao.posicoes if alteracao.operacao == "remover" else ()
+        self._aplicar(alteracao.depois, alteracao.antes, posicoes)
+        self._refazer.append(alteracao)
+        return alteracao
+
+    def refazer(self) -> Alteracao | None:
+        """
+        Refaz a última alteração desfeita.
+
+        Returns:
+            Alteração refeita, ou None se não houver o que refazer
+        """
+        if not self._refazer:
+            return None
+        alteracao = self._refazer.pop()
+        posicoes = alteracao.posicoes if alteracao.operacao == "adicionar" else ()
+        self._aplicar(alteracao.antes, alteracao.depois, posicoes)
+        self._desfazer.append(alteracao)
+        return alteracao
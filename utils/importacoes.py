@@ -0,0 +1,258 @@
+"""
+Módulo de importação de componentes curriculares.
+Responsável por ler a tabela de componentes (formato SIGAA) exportada pelo
+próprio sistema, em CSV ou na aba "Componentes" do XLSX, e convertê-la de
+volta em componentes.
+
+Todas as linhas são convertidas e validadas antes de qualquer alteração no
+curso, para que a importação possa ser revisada e aplicada de uma só vez.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator
+
+from utils.calculos import calcular_ch_total
+from utils.exportacoes import COLUNAS_COMPONENTES
+from utils.perfil import instrumentar
+from utils.validacoes import validar_componente
+
+
+# Campo do componente correspondente a cada coluna (inverso de _linha_componente)
+CAMPOS_POR_COLUNA = dict(zip(COLUNAS_COMPONENTES, [
+    "semestre",
+    "nome",
+    "tipo",
+    "aulas_semanais",
+    "ch_total",
+    "ch_teorica",
+    "ch_pratica",
+    "ch_extensao",
+    "nucleo",
+    "temas_nucleo_i",
+    "diretrizes_nucleo_ii",
+    "descricao_extensao",
+    "local_realizacao",
+    "etapa_estagio",
+    "bloco",
+    "observacoes"
+]))
+
+COLUNAS_OBRIGATORIAS = ("Semestre", "Nome", "Tipo", "Núcleo")
+
+CAMPOS_CARGA_HORARIA = ("ch_total", "ch_teorica", "ch_pratica", "ch_extensao")
+
+# Mesmos limites do campo "Semestre" do formulário de cadastro
+SEMESTRE_MINIMO = 1
+SEMESTRE_MAXIMO = 20
+
+# Abas aceitas no XLSX: a do exportar_xlsx e a de exportações anteriores
+ABAS_COMPONENTES = ("Componentes", "Componentes Curriculares")
+
+# Os temas do Núcleo I são exportados unidos por "; " e cada um começa com "a) " a "i) "
+_SEPARADOR_TEMAS = re.compile(r";\s(?=[a-iA-I]\)\s)")
+
+
+@dataclass
+class ResultadoImportacao:
+    """
+    Componentes lidos de um arquivo, separados entre válidos e inválidos.
+
+    ``invalidos`` traz tuplas (linha do arquivo, componente, erros), no mesmo
+    formato de ComponentStore.revalidar.
+    """
+    validos: list[dict] = field(default_factory=list)
+    invalidos: list[tuple[int, dict, list[str]]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.validos) + len(self.invalidos)
+
+
+def _vazio(valor) -> bool:
+    return valor is None or (isinstance(valor, str) and not valor.strip())
+
+
+def _converter_numero(valor, coluna: str) -> float:
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    texto = str(valor).strip().lower().removesuffix("h").strip().replace(",", ".")
+    try:
+        return float(texto)
+    except ValueError:
+        raise ValueError(f"{coluna}: valor numérico inválido ({valor})") from None
+
+
+def _converter_semestre(valor) -> int:
+    # As tabelas, a matriz e o PDF ordenam os semestres como números inteiros
+    erro = f"Semestre: informe um número inteiro de {SEMESTRE_MINIMO} a {SEMESTRE_MAXIMO}"
+    if _vazio(valor):
+        raise ValueError(f"{erro} (valor vazio)")
+    try:
+        numero = _converter_numero(valor, "Semestre")
+    except ValueError:
+        raise ValueError(f"{erro} ({valor})") from None
+    if not numero.is_integer() or not SEMESTRE_MINIMO <= numero <= SEMESTRE_MAXIMO:
+        raise ValueError(f"{erro} ({valor})")
+    return int(numero)
+
+
+def separar_temas(texto: str) -> list[str]:
+    """
+    Separa os temas do Núcleo I unidos na coluna "Temas Núcleo I".
+
+    Args:
+        texto: Conteúdo da coluna
+
+    Returns:
+        Lista de temas, na ordem em que aparecem
+    """
+    return [tema.strip() for tema in _SEPARADOR_TEMAS.split(texto) if tema.strip()]
+
+
+def converter_linha(linha: dict) -> dict:
+    """
+    Converte uma linha da tabela de componentes em um componente.
+
+    Args:
+        linha: Mapa coluna → valor (colunas de COLUNAS_COMPONENTES)
+
+    Returns:
+        Dicionário do componente, sem id
+
+    Raises:
+        ValueError: Se o semestre não for um inteiro válido ou alguma carga
+            horária não for numérica
+    """
+    componente = {}
+    for coluna, campo in CAMPOS_POR_COLUNA.items():
+        valor = linha.get(coluna)
+        if campo == "semestre":
+            componente[campo] = _converter_semestre(valor)
+        elif campo == "aulas_semanais":
+            componente[campo] = None if _vazio(valor) else int(_converter_numero(valor, coluna))
+        elif campo in CAMPOS_CARGA_HORARIA:
+            componente[campo] = 0.0 if _vazio(valor) else _converter_numero(valor, coluna)
+        elif campo == "temas_nucleo_i":
+            componente[campo] = [] if _vazio(valor) else separar_temas(str(valor))
+        else:
+            componente[campo] = "" if _vazio(valor) else str(valor).strip()
+
+    # Planilhas preenchidas à mão podem trazer só as aulas semanais das disciplinas
+    if not componente["ch_total"] and componente["tipo"] == "Disciplina" and componente["aulas_semanais"]:
+        componente["ch_total"] = calcular_ch_total("Disciplina", componente["aulas_semanais"])
+    return componente
+
+
+def _linhas_com_cabecalho(linhas: Iterator[tuple | list]) -> Iterator[tuple[int, dict]]:
+    """Associa cada linha ao cabeçalho (primeira linha), ignorando linhas vazias."""
+    cabecalho = [str(coluna).strip() if coluna is not None else "" for coluna in next(linhas, [])]
+    ausentes = [coluna for coluna in COLUNAS_OBRIGATORIAS if coluna not in cabecalho]
+    if ausentes:
+        raise ValueError(
+            f"Colunas obrigatórias ausentes: {', '.join(ausentes)}. "
+            "Use a tabela de componentes exportada pelo sistema (formato SIGAA)."
+        )
+    for numero, valores in enumerate(linhas, 2):
+        if all(_vazio(valor) for valor in valores):
+            continue
+        yield numero, dict(zip(cabecalho, valores))
+
+
+def ler_csv_componentes(conteudo: bytes | str) -> Iterator[tuple[int, dict]]:
+    """
+    Lê a tabela de componentes de um CSV gerado por exportar_csv
+    (UTF-8 com BOM, delimitador ponto e vírgula).
+
+    Args:
+        conteudo: Conteúdo do arquivo
+
+    Returns:
+        Iterador de tuplas (número da linha, mapa coluna → valor)
+    """
+    if isinstance(conteudo, bytes):
+        conteudo = conteudo.decode("utf-8-sig")
+    conteudo = conteudo.lstrip("\ufeff")
+    primeira_linha = conteudo.split("\n", 1)[0]
+    # Arquivos reabertos e salvos em outros programas podem usar vírgula
+    delimitador = ";" if ";" in primeira_linha or "," not in primeira_linha else ","
+    return _linhas_com_cabecalho(iter(csv.reader(io.StringIO(conteudo), delimiter=delimitador)))
+
+
+def ler_xlsx_componentes(arquivo: str | BinaryIO) -> Iterator[tuple[int, dict]]:
+    """
+    Lê a aba "Componentes" de um XLSX gerado por exportar_xlsx.
+
+    A planilha é aberta com o openpyxl em modo somente leitura, que percorre
+    as linhas sem carregar todas as células em memória.
+
+    Args:
+        arquivo: Caminho ou fluxo binário do arquivo
+
+    Returns:
+        Iterador de tuplas (número da linha, mapa coluna → valor)
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        nome_aba = next((aba for aba in ABAS_COMPONENTES if aba in workbook.sheetnames), None)
+        if nome_aba is None:
+            raise ValueError(
+                f"A planilha não tem a aba \"Componentes\" (abas encontradas: {', '.join(workbook.sheetnames)})."
+            )
+        yield from _linhas_com_cabecalho(workbook[nome_aba].iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+@instrumentar
+def importar_componentes(arquivo: str | BinaryIO | bytes, nome_arquivo: str | None = None) -> ResultadoImportacao:
+    """
+    Lê e valida os componentes de um CSV ou XLSX exportado pelo sistema.
+
+    Args:
+        arquivo: Caminho, fluxo binário ou conteúdo do arquivo
+        nome_arquivo: Nome do arquivo, usado para identificar o formato
+            (por padrão, o próprio caminho)
+
+    Returns:
+        ResultadoImportacao com os componentes válidos (sem id) e os
+        inválidos, com os erros de cada linha
+
+    Raises:
+        ValueError: Se o formato não for suportado ou faltarem colunas obrigatórias
+    """
+    nome_arquivo = nome_arquivo or (arquivo if isinstance(arquivo, (str, os.PathLike)) else "")
+    extensao = os.path.splitext(str(nome_arquivo))[1].lower()
+
+    if extensao == ".csv":
+        if isinstance(arquivo, (str, os.PathLike)):
+            with open(arquivo, "rb") as f:
+                arquivo = f.read()
+        elif not isinstance(arquivo, bytes):
+            arquivo = arquivo.read()
+        linhas = ler_csv_componentes(arquivo)
+    elif extensao == ".xlsx":
+        linhas = ler_xlsx_componentes(io.BytesIO(arquivo) if isinstance(arquivo, bytes) else arquivo)
+    else:
+        raise ValueError("Formato não suportado. Envie um arquivo .csv ou .xlsx exportado pelo sistema.")
+
+    resultado = ResultadoImportacao()
+    for numero, linha in linhas:
+        try:
+            componente = converter_linha(linha)
+        except ValueError as e:
+            resultado.invalidos.append((numero, {"nome": str(linha.get("Nome") or "")}, [str(e)]))
+            continue
+        valido, erros = validar_componente(componente)
+        if valido:
+            resultado.validos.append(componente)
+        else:
+            resultado.invalidos.append((numero, componente, erros))
+    return resultado
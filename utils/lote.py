@@ -0,0 +1,462 @@
+"""
+Módulo de processamento em lote de backups de cursos.
+Responsável pela linha de comando usada fora do Streamlit (ex.: PROGRAD).
+
+Uso:
+    python -m utils.lote validar <diretorio> [--saida relatorio] [--processos N]
+    python -m utils.lote exportar <backup.json|diretorio>... --destino <dir>
+        [--formatos csv xlsx pdf] [--processos N] [--forcar]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+from utils.backup import importar_backup_json
+
+
+FORMATOS_EXPORTACAO = ("csv", "xlsx", "pdf")
+
+COLUNAS_RELATORIO_VALIDACAO = [
+    "arquivo",
+    "carregado",
+    "mensagem",
+    "componentes",
+    "ch_total",
+    "ch_conforme",
+    "valido",
+    "quantidade_erros",
+    "erros",
+    "tempo_ms"
+]
+
+
+def listar_backups(diretorio: str) -> list[str]:
+    """
+    Lista os arquivos de backup JSON de um diretório, em ordem alfabética.
+
+    Args:
+        diretorio: Diretório com os backups
+
+    Returns:
+        Lista de caminhos dos arquivos .json
+    """
+    return sorted(
+        os.path.join(diretorio, nome)
+        for nome in os.listdir(diretorio)
+        if nome.lower().endswith(".json") and os.path.isfile(os.path.join(diretorio, nome))
+    )
+
+
+def validar_backup(caminho: str) -> dict:
+    """
+    Carrega um backup JSON e valida o curso completo.
+
+    Executado em processos separados; retorna apenas dados simples.
+
+    Args:
+        caminho: Caminho do arquivo de backup
+
+    Returns:
+        Dicionário com o resultado da validação e o tempo gasto
+    """
+    from utils.calculos import calcular_indicadores
+    from utils.validacoes import validar_curso_completo
+
+    inicio = time.perf_counter()
+    linha = dict.fromkeys(COLUNAS_RELATORIO_VALIDACAO)
+    linha["arquivo"] = os.path.basename(caminho)
+
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            conteudo = f.read()
+    except OSError as e:
+        componentes, sucesso, mensagem = [], False, f"Erro ao ler arquivo: {str(e)}"
+    else:
+        componentes, _, sucesso, mensagem = importar_backup_json(conteudo)
+
+    if sucesso:
+        # Um backup com dados malformados não pode interromper o lote inteiro
+        try:
+            indicadores = calcular_indicadores(componentes)
+            resultado = validar_curso_completo(componentes)
+        except Exception as e:
+            sucesso, mensagem = False, f"Erro ao validar curso: {str(e)}"
+
+    linha["carregado"] = sucesso
+    linha["mensagem"] = mensagem
+
+    if sucesso:
+        linha["componentes"] = len(componentes)
+        linha["ch_total"] = indicadores.ch_total
+        linha["ch_conforme"] = indicadores.conforme
+        linha["valido"] = resultado["valido"]
+        linha["quantidade_erros"] = len(resultado["erros"])
+        linha["erros"] = resultado["erros"]
+    else:
+        linha["valido"] = False
+        linha["erros"] = []
+
+    linha["tempo_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+    return linha
+
+
+def validar_lote(caminhos: list[str], processos: int | None = None) -> dict:
+    """
+    Valida vários backups em paralelo, usando todos os núcleos disponíveis.
+
+    Args:
+        caminhos: Caminhos dos arquivos de backup
+        processos: Número de processos (padrão: quantidade de CPUs)
+
+    Returns:
+        Relatório consolidado com os cursos e o resumo da execução
+    """
+    processos = processos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+
+    if processos == 1 or len(caminhos) <= 1:
+        cursos = [validar_backup(caminho) for caminho in caminhos]
+    else:
+        # Lotes maiores reduzem a troca de mensagens entre processos
+        tamanho_lote = max(1, len(caminhos) // (processos * 4))
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            cursos = list(executor.map(validar_backup, caminhos, chunksize=tamanho_lote))
+
+    duracao = time.perf_counter() - inicio
+    return {
+        "gerado_em": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "processos": processos,
+        "total_cursos": len(cursos),
+        "cursos_validos": sum(1 for curso in cursos if curso["valido"]),
+        "cursos_com_erro_de_leitura": sum(1 for curso in cursos if not curso["carregado"]),
+        "tempo_total_s": round(duracao, 3),
+        "cursos": cursos
+    }
+
+
+def salvar_relatorio_validacao(relatorio: dict, prefixo: str) -> tuple[str, str]:
+    """
+    Salva o relatório consolidado em JSON e CSV.
+
+    O CSV segue o formato das demais exportações (UTF-8 com BOM, delimitador
+    ponto e vírgula), com os erros de cada curso unidos por " | ".
+
+    Args:
+        relatorio: Relatório retornado por validar_lote
+        prefixo: Caminho sem extensão dos arquivos de saída
+
+    Returns:
+        Tupla (caminho_json, caminho_csv)
+    """
+    caminho_json = f"{prefixo}.json"
+    caminho_csv = f"{prefixo}.csv"
+
+    with open(caminho_json, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+    with open(caminho_csv, "w", encoding="utf-8-sig", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=COLUNAS_RELATORIO_VALIDACAO, delimiter=";")
+        escritor.writeheader()
+        for curso in relatorio["cursos"]:
+            escritor.writerow({**curso, "erros": " | ".join(curso["erros"] or [])})
+
+    return caminho_json, caminho_csv
+
+
+def nomes_exportacao(caminhos: list[str]) -> list[str]:
+    """
+    Define o nome (sem extensão) das exportações de cada backup.
+
+    O nome é o do arquivo de backup; backups com o mesmo nome em diretórios
+    diferentes recebem o caminho relativo ao diretório comum (com "__" no
+    lugar das barras), para que um não sobrescreva as exportações do outro.
+
+    Args:
+        caminhos: Caminhos dos arquivos de backup
+
+    Returns:
+        Nomes das exportações, na ordem dos caminhos
+    """
+    nomes = [os.path.splitext(os.path.basename(caminho))[0] for caminho in caminhos]
+    repetidos = {nome for nome in nomes if nomes.count(nome) > 1}
+    if not repetidos:
+        return nomes
+
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(caminho)) for caminho in caminhos])
+    return [
+        os.path.splitext(os.path.relpath(os.path.abspath(caminho), base))[0].replace(os.sep, "__")
+        if nome in repetidos else nome
+        for caminho, nome in zip(caminhos, nomes)
+    ]
+
+
+def _caminhos_exportacao(nome_curso: str, destino: str, formatos: list[str]) -> dict[str, str]:
+    return {
+        formato: os.path.join(destino, f"{nome_curso}.{formato}")
+        for formato in formatos
+    }
+
+
+def _exportacao_atualizada(caminho_backup: str, saidas: dict[str, str]) -> bool:
+    """Indica se todas as saídas existem e são mais novas que o backup."""
+    mtime_backup = os.path.getmtime(caminho_backup)
+    return all(
+        os.path.exists(caminho) and os.path.getmtime(caminho) >= mtime_backup
+        for caminho in saidas.values()
+    )
+
+
+def exportar_backup(tarefa: tuple[str, str, list[str], bool, str]) -> dict:
+    """
+    Gera as exportações solicitadas de um backup JSON.
+
+    Executado em processos separados. Cada arquivo é gravado em um caminho
+    temporário e renomeado ao final, para que uma exportação interrompida
+    nunca seja considerada atualizada.
+
+    Args:
+        tarefa: Tupla (caminho_backup, destino, formatos, forcar, nome_curso),
+            com nome_curso definido por nomes_exportacao
+
+    Returns:
+        Dicionário com a situação do curso, bytes gerados e tempo gasto
+    """
+    from utils.armazenamento import ComponentStore
+    from utils.exportacoes import exportar_csv, exportar_xlsx, exportar_pdf
+
+    caminho_backup, destino, formatos, forcar, nome_curso = tarefa
+    inicio = time.perf_counter()
+    saidas = _caminhos_exportacao(nome_curso, destino, formatos)
+    resultado = {
+        "arquivo": os.path.basename(caminho_backup),
+        "situacao": "gerado",
+        "mensagem": "",
+        "bytes": 0,
+        "arquivos": list(saidas.values()),
+        "tempo_ms": 0.0
+    }
+
+    try:
+        if not forcar and _exportacao_atualizada(caminho_backup, saidas):
+            resultado["situacao"] = "atualizado"
+        else:
+            with open(caminho_backup, encoding="utf-8") as f:
+                componentes, _, sucesso, mensagem = importar_backup_json(f.read())
+            if not sucesso:
+                resultado["situacao"] = "erro"
+                resultado["mensagem"] = mensagem
+            else:
+                # O ComponentStore compartilha os DataFrames derivados entre os formatos
+                curso = ComponentStore(componentes)
+                # Planilhas institucionais podem ter milhares de linhas: XLSX em memória constante
+                exportadores = {
+                    "csv": exportar_csv,
+                    "xlsx": partial(exportar_xlsx, memoria_constante=True),
+                    "pdf": exportar_pdf
+                }
+                for formato, caminho in saidas.items():
+                    raiz, extensao = os.path.splitext(caminho)
+                    temporario = f"{raiz}.tmp-{os.getpid()}{extensao}"
+                    try:
+                        exportadores[formato](curso, temporario)
+                        os.replace(temporario, caminho)
+                    finally:
+                        if os.path.exists(temporario):
+                            os.remove(temporario)
+                    resultado["bytes"] += os.path.getsize(caminho)
+    except Exception as e:
+        resultado["situacao"] = "erro"
+        resultado["mensagem"] = f"Erro ao exportar: {str(e)}"
+
+    resultado["tempo_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+    return resultado
+
+
+def exportar_lote(
+    caminhos: list[str],
+    destino: str,
+    formatos: list[str],
+    processos: int | None = None,
+    forcar: bool = False
+) -> dict:
+    """
+    Gera as exportações de vários cursos em paralelo.
+
+    Cursos cujas saídas já existem e são mais novas que o backup são
+    ignorados, a menos que forcar seja verdadeiro.
+
+    Args:
+        caminhos: Caminhos dos arquivos de backup
+        destino: Diretório onde os arquivos serão salvos
+        formatos: Formatos desejados (csv, xlsx, pdf)
+        processos: Número de processos (padrão: quantidade de CPUs)
+        forcar: Regerar mesmo as exportações atualizadas
+
+    Returns:
+        Relatório com a situação de cada curso e a vazão obtida
+    """
+    processos = processos or os.cpu_count() or 1
+    os.makedirs(destino, exist_ok=True)
+    # O mesmo arquivo informado duas vezes (ex.: diretório e arquivo) é exportado uma vez só
+    caminhos = list(dict.fromkeys(os.path.normpath(caminho) for caminho in caminhos))
+    tarefas = [
+        (caminho, destino, list(formatos), forcar, nome_curso)
+        for caminho, nome_curso in zip(caminhos, nomes_exportacao(caminhos))
+    ]
+    inicio = time.perf_counter()
+
+    if processos == 1 or len(tarefas) <= 1:
+        cursos = [exportar_backup(tarefa) for tarefa in tarefas]
+    else:
+        # Exportações são pesadas: um curso por vez por processo equilibra melhor a carga
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            cursos = list(executor.map(exportar_backup, tarefas))
+
+    duracao = time.perf_counter() - inicio
+    gerados = [curso for curso in cursos if curso["situacao"] == "gerado"]
+    total_bytes = sum(curso["bytes"] for curso in gerados)
+    return {
+        "gerado_em": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "processos": processos,
+        "formatos": list(formatos),
+        "total_cursos": len(cursos),
+        "cursos_gerados": len(gerados),
+        "cursos_atualizados": sum(1 for curso in cursos if curso["situacao"] == "atualizado"),
+        "cursos_com_erro": sum(1 for curso in cursos if curso["situacao"] == "erro"),
+        "bytes_gerados": total_bytes,
+        "tempo_total_s": round(duracao, 3),
+        "cursos_por_segundo": round(len(gerados) / duracao, 3) if duracao else 0.0,
+        "mb_por_segundo": round(total_bytes / (1024 * 1024) / duracao, 3) if duracao else 0.0,
+        "cursos": cursos
+    }
+
+
+def _expandir_backups(entradas: list[str]) -> list[str]:
+    caminhos = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            caminhos.extend(listar_backups(entrada))
+        elif os.path.isfile(entrada):
+            caminhos.append(entrada)
+        else:
+            print(f"Ignorando caminho inexistente: {entrada}", file=sys.stderr)
+    return caminhos
+
+
+def _comando_validar(args: argparse.Namespace) -> int:
+    if not os.path.isdir(args.diretorio):
+        print(f"Diretório não encontrado: {args.diretorio}", file=sys.stderr)
+        return 2
+
+    caminhos = listar_backups(args.diretorio)
+    if not caminhos:
+        print(f"Nenhum backup JSON encontrado em {args.diretorio}", file=sys.stderr)
+        return 2
+
+    relatorio = validar_lote(caminhos, args.processos)
+    caminho_json, caminho_csv = salvar_relatorio_validacao(relatorio, args.saida)
+
+    print(
+        f"{relatorio['total_cursos']} curso(s) validado(s) em {relatorio['tempo_total_s']:.2f}s "
+        f"com {relatorio['processos']} processo(s): {relatorio['cursos_validos']} conforme(s), "
+        f"{relatorio['cursos_com_erro_de_leitura']} com erro de leitura."
+    )
+    print(f"Relatórios: {caminho_json}, {caminho_csv}")
+    return 0
+
+
+def _comando_exportar(args: argparse.Namespace) -> int:
+    caminhos = _expandir_backups(args.entradas)
+    if not caminhos:
+        print("Nenhum backup JSON encontrado.", file=sys.stderr)
+        return 2
+
+    relatorio = exportar_lote(caminhos, args.destino, args.formatos, args.processos, args.forcar)
+
+    for curso in relatorio["cursos"]:
+        if curso["situacao"] == "erro":
+            print(f"{curso['arquivo']}: {curso['mensagem']}", file=sys.stderr)
+
+    print(
+        f"{relatorio['cursos_gerados']} curso(s) exportado(s), {relatorio['cursos_atualizados']} já atualizado(s), "
+        f"{relatorio['cursos_com_erro']} com erro, em {relatorio['tempo_total_s']:.2f}s "
+        f"com {relatorio['processos']} processo(s)."
+    )
+    print(
+        f"Vazão: {relatorio['cursos_por_segundo']:.2f} cursos/s, "
+        f"{relatorio['mb_por_segundo']:.2f} MB/s ({relatorio['bytes_gerados']} bytes)"
+    )
+
+    if args.relatorio:
+        with open(args.relatorio, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+    return 1 if relatorio["cursos_com_erro"] else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.lote",
+        description="Processamento em lote de backups de cursos (sem Streamlit)."
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    validar = subcomandos.add_parser(
+        "validar",
+        help="Valida todos os backups JSON de um diretório e gera relatório consolidado."
+    )
+    validar.add_argument("diretorio", help="Diretório com os arquivos de backup JSON")
+    validar.add_argument(
+        "--saida",
+        default="relatorio_validacao",
+        help="Caminho sem extensão dos relatórios gerados (padrão: relatorio_validacao)"
+    )
+    validar.add_argument(
+        "--processos",
+        type=int,
+        default=None,
+        help="Número de processos paralelos (padrão: número de CPUs)"
+    )
+    validar.set_defaults(executar=_comando_validar)
+
+    exportar = subcomandos.add_parser(
+        "exportar",
+        help="Gera CSV/XLSX/PDF de vários backups JSON em paralelo."
+    )
+    exportar.add_argument("entradas", nargs="+", help="Arquivos de backup JSON ou diretórios com backups")
+    exportar.add_argument("--destino", required=True, help="Diretório onde as exportações serão salvas")
+    exportar.add_argument(
+        "--formatos",
+        nargs="+",
+        choices=FORMATOS_EXPORTACAO,
+        default=list(FORMATOS_EXPORTACAO),
+        help="Formatos a gerar (padrão: csv xlsx pdf)"
+    )
+    exportar.add_argument(
+        "--processos",
+        type=int,
+        default=None,
+        help="Número de processos paralelos (padrão: número de CPUs)"
+    )
+    exportar.add_argument(
+        "--forcar",
+        action="store_true",
+        help="Regera também os cursos cujas exportações já estão atualizadas"
+    )
+    exportar.add_argument("--relatorio", default=None, help="Salva o relatório da execução neste arquivo JSON")
+    exportar.set_defaults(executar=_comando_exportar)
+
+    args = parser.parse_args(argv)
+    return args.executar(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Módulo de diagnóstico de desempenho do app.
+Responsável por medir o tempo de cada seção de uma execução (rerun) do Streamlit.
+
+O diagnóstico é opcional: fica ativo com a variável de ambiente PPC_PERFIL=1
+ou com o parâmetro ?perfil=1 na URL. Desativado, o custo de cada função
+instrumentada é apenas a consulta de uma ContextVar.
+"""
+
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Mapping
+
+
+VARIAVEL_AMBIENTE = "PPC_PERFIL"
+PARAMETRO_URL = "perfil"
+VALORES_ATIVOS = ("1", "true", "sim")
+
+logger = logging.getLogger("ppc.perfil")
+
+_perfil_atual: ContextVar["PerfilExecucao | None"] = ContextVar("perfil_atual", default=None)
+
+
+class PerfilExecucao:
+    """
+    Tempos de uma execução do app, agrupados por seção.
+
+    As seções podem ser aninhadas (ex.: uma aba que chama uma função de
+    utils); cada caminho de seções é acumulado separadamente, com o número
+    de chamadas e o tempo total, na ordem em que foi visto pela primeira vez.
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.fim: float | None = None
+        self._pilha: list[str] = []
+        self._secoes: dict[str, dict] = {}
+
+    @contextmanager
+    def secao(self, nome: str) -> Iterator[None]:
+        """Mede o tempo de um trecho, aninhado na seção em andamento."""
+        self._pilha.append(nome)
+        caminho = " › ".join(self._pilha)
+        registro = self._secoes.get(caminho)
+        if registro is None:
+            registro = self._secoes[caminho] = {
+                "secao": caminho,
+                "nome": nome,
+                "nivel": len(self._pilha) - 1,
+                "chamadas": 0,
+                "total_ms": 0.0
+            }
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            registro["chamadas"] += 1
+            registro["total_ms"] += (time.perf_counter() - inicio) * 1000
+            self._pilha.pop()
+
+    def finalizar(self):
+        """Marca o fim da execução."""
+        if self.fim is None:
+            self.fim = time.perf_counter()
+
+    @property
+    def total_ms(self) -> float:
+        fim = self.fim if self.fim is not None else time.perf_counter()
+        return (fim - self.inicio) * 1000
+
+    def secoes(self) -> list[dict]:
+        """Retorna as seções medidas, com tempos arredondados e percentual da execução."""
+        total = self.total_ms or 1.0
+        return [
+            {
+                **registro,
+                "total_ms": round(registro["total_ms"], 3),
+                "percentual": round(registro["total_ms"] * 100 / total, 1)
+            }
+            for registro in self._secoes.values()
+        ]
+
+    def para_log(self) -> dict:
+        """Resumo estruturado da execução, no formato gravado no log."""
+        return {
+            "evento": "perfil_execucao",
+            "total_ms": round(self.total_ms, 3),
+            "secoes": [
+                {chave: secao[chave] for chave in ("secao", "chamadas", "total_ms", "percentual")}
+                for secao in self.secoes()
+            ]
+        }
+
+
+def perfil_habilitado(parametros_url: Mapping | None = None) -> bool:
+    """
+    Indica se o diagnóstico de desempenho está ativo.
+
+    Args:
+        parametros_url: Parâmetros da URL (ex.: st.query_params)
+
+    Returns:
+        True se PPC_PERFIL ou o parâmetro ?perfil da URL estiverem ativos
+    """
+    if os.environ.get(VARIAVEL_AMBIENTE, "").lower() in VALORES_ATIVOS:
+        return True
+    if parametros_url is not None:
+        return str(parametros_url.get(PARAMETRO_URL, "")).lower() in VALORES_ATIVOS
+    return False
+
+
+def _configurar_log():
+    # Sem configuração de log no processo, o resumo vai para a saída de erro
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        logger.addHandler(logging.StreamHandler())
+
+
+@contextmanager
+def perfilar_execucao() -> Iterator[PerfilExecucao]:
+    """
+    Mede uma execução completa do app e registra o resumo no log "ppc.perfil".
+
+    Yields:
+        PerfilExecucao da execução em andamento
+    """
+    _configurar_log()
+    perfil = PerfilExecucao()
+    token = _perfil_atual.set(perfil)
+    try:
+        yield perfil
+    finally:
+        perfil.finalizar()
+        _perfil_atual.reset(token)
+        logger.info(json.dumps(perfil.para_log(), ensure_ascii=False))
+
+
+@contextmanager
+def secao(nome: str) -> Iterator[None]:
+    """
+    Mede um trecho da execução em andamento; sem diagnóstico ativo, não faz nada.
+
+    Args:
+        nome: Nome da seção (ex.: "Aba: Componentes")
+    """
+    perfil = _perfil_atual.get()
+    if perfil is None:
+        yield
+        return
+    with perfil.secao(nome):
+        yield
+
+
+def instrumentar(funcao: Callable) -> Callable:
+    """
+    Decorador que mede cada chamada da função quando o diagnóstico está ativo.
+
+    A seção recebe o nome "<módulo>.<função>" (ex.: "calculos.calcular_indicadores").
+    Destina-se a funções que processam o curso inteiro: funções chamadas uma
+    vez por componente não são instrumentadas, para não somar o envoltório
+    a cada iteração nem encher o diagnóstico de seções triviais.
+    """
+    nome = f"{funcao.__module__.rsplit('.', 1)[-1]}.{funcao.__qualname__}"
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        perfil = _perfil_atual.get()
+        if perfil is None:
+            return funcao(*args, **kwargs)
+        with perfil.secao(nome):
+            return funcao(*args, **kwargs)
+
+    return envoltorio
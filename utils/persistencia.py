@@ -0,0 +1,415 @@
+"""
+Módulo de persistência dos cursos em SQLite.
+Responsável por gravar cada alteração de componente assim que ela acontece
+e por restaurar o curso ao abrir uma nova sessão.
+
+O banco usa o modo WAL, em que leituras não bloqueiam a gravação. O esquema
+é criado uma única vez, quando o repositório é aberto; as conexões ficam em
+um conjunto reaproveitado pelas execuções do Streamlit (cada uma roda em uma
+thread nova) e são fechadas por ``fechar``.
+"""
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from utils.armazenamento import Alteracao
+from utils.perfil import instrumentar
+
+
+VARIAVEL_CAMINHO = "PPC_BANCO_DADOS"
+VARIAVEL_ATIVACAO = "PPC_PERSISTENCIA"
+CAMINHO_PADRAO = os.path.join("dados", "cursos.db")
+
+# Tempo máximo esperado de cada operação; acima dele, um aviso é registrado no log
+LIMITE_GRAVACAO_MS = 15.0
+LIMITE_CARREGAMENTO_MS = 100.0
+
+logger = logging.getLogger("ppc.persistencia")
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS cursos (
+    id TEXT PRIMARY KEY,
+    nome TEXT NOT NULL DEFAULT '',
+    ultimo_id INTEGER NOT NULL DEFAULT 0,
+    atualizado_em TEXT NOT NULL,
+    quantidade_componentes INTEGER NOT NULL DEFAULT 0,
+    ch_total REAL NOT NULL DEFAULT 0,
+    conforme INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS componentes (
+    curso_id TEXT NOT NULL REFERENCES cursos(id) ON DELETE CASCADE,
+    id INTEGER NOT NULL,
+    ordem INTEGER NOT NULL,
+    dados TEXT NOT NULL,
+    PRIMARY KEY (curso_id, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_componentes_ordem ON componentes (curso_id, ordem);
+"""
+
+# Colunas acrescentadas a bancos criados por versões anteriores
+COLUNAS_ADICIONAIS_CURSOS = {
+    "quantidade_componentes": "INTEGER NOT NULL DEFAULT 0",
+    "ch_total": "REAL NOT NULL DEFAULT 0",
+    "conforme": "INTEGER NOT NULL DEFAULT 0"
+}
+
+# UPDATE ... RETURNING existe a partir do SQLite 3.35
+SUPORTA_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def persistencia_habilitada() -> bool:
+    """Indica se o salvamento automático está ativo (desativável com PPC_PERSISTENCIA=0)."""
+    return os.environ.get(VARIAVEL_ATIVACAO, "1") != "0"
+
+
+def _serializar(componente: dict) -> str:
+    return json.dumps(componente, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class RepositorioCursos:
+    """
+    Cursos e componentes gravados em um banco SQLite.
+
+    Cada componente é uma linha (curso_id, id) com o dicionário em JSON;
+    a coluna ``ordem`` preserva a ordem de cadastro. Gravações alteram
+    apenas as linhas dos componentes afetados.
+    """
+
+    def __init__(self, caminho: str | None = None):
+        self.caminho = caminho or os.environ.get(VARIAVEL_CAMINHO) or CAMINHO_PADRAO
+        diretorio = os.path.dirname(self.caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        # Conexões livres, usadas por uma operação de cada vez
+        self._livres: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._abertas: list[sqlite3.Connection] = []
+        self._trava = threading.Lock()
+        self._criar_esquema()
+
+    def __enter__(self) -> "RepositorioCursos":
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _criar_esquema(self):
+        conexao = sqlite3.connect(self.caminho, timeout=5.0)
+        try:
+            # O modo WAL fica gravado no arquivo do banco
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.executescript(ESQUEMA)
+            existentes = {linha[1] for linha in conexao.execute("PRAGMA table_info(cursos)")}
+            with conexao:
+                for coluna, definicao in COLUNAS_ADICIONAIS_CURSOS.items():
+                    if coluna not in existentes:
+                        conexao.execute(f"ALTER TABLE cursos ADD COLUMN {coluna} {definicao}")
+        finally:
+            conexao.close()
+
+    def _nova_conexao(self) -> sqlite3.Connection:
+        # A conexão passa de uma thread a outra, mas nunca é usada por duas ao mesmo tempo
+        conexao = sqlite3.connect(self.caminho, timeout=5.0, check_same_thread=False)
+        # Com WAL, NORMAL só sincroniza o disco nos checkpoints
+        conexao.execute("PRAGMA synchronous=NORMAL")
+        conexao.execute("PRAGMA foreign_keys=ON")
+        with self._trava:
+            self._abertas.append(conexao)
+        return conexao
+
+    @contextmanager
+    def _conexao(self) -> Iterator[sqlite3.Connection]:
+        """
+        Empresta uma conexão livre (ou abre uma nova) durante uma transação.
+
+        A transação é confirmada ao final do bloco, ou desfeita se ocorrer
+        uma exceção, e a conexão volta ao conjunto de conexões livres.
+        """
+        try:
+            conexao = self._livres.get_nowait()
+        except queue.Empty:
+            conexao = self._nova_conexao()
+        try:
+            with conexao:
+                yield conexao
+        finally:
+            with self._trava:
+                aberta = conexao in self._abertas
+            if aberta:
+                self._livres.put(conexao)
+            else:
+                # O repositório foi fechado durante a operação
+                conexao.close()
+
+    def fechar(self):
+        """Fecha todas as conexões abertas pelo repositório."""
+        with self._trava:
+            abertas, self._abertas = self._abertas, []
+        for conexao in abertas:
+            conexao.close()
+        while True:
+            try:
+                self._livres.get_nowait()
+            except queue.Empty:
+                break
+
+    @contextmanager
+    def _medir(self, operacao: str, limite_ms: float) -> Iterator[None]:
+        inicio = time.perf_counter()
+        yield
+        decorrido = (time.perf_counter() - inicio) * 1000
+        if decorrido > limite_ms:
+            logger.warning(
+                "%s levou %.1f ms (limite: %.0f ms) em %s",
+                operacao, decorrido, limite_ms, self.caminho
+            )
+
+    @staticmethod
+    def _gravar_curso(conexao: sqlite3.Connection, curso_id: str, ultimo_id: int, nome: str | None = None):
+        # Mantém o maior ultimo_id já gravado, para que ids removidos não sejam reutilizados
+        conexao.execute(
+            """
+            INSERT INTO cursos (id, nome, ultimo_id, atualizado_em) VALUES (?, COALESCE(?, ''), ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                nome = COALESCE(?, nome),
+                ultimo_id = MAX(ultimo_id, excluded.ultimo_id),
+                atualizado_em = excluded.atualizado_em
+            """,
+            (curso_id, nome, ultimo_id, datetime.now().isoformat(timespec="seconds"), nome)
+        )
+
+    @instrumentar
+    def salvar_componentes(self, curso_id: str, componentes: Iterable[dict]):
+        """
+        Grava (insere ou atualiza) componentes de um curso.
+
+        Componentes novos entram no fim da ordem do curso; os existentes
+        mantêm a posição.
+
+        Args:
+            curso_id: Identificador do curso
+            componentes: Componentes a gravar
+        """
+        componentes = list(componentes)
+        if not componentes:
+            return
+        with self._medir("Gravação de componentes", LIMITE_GRAVACAO_MS), self._conexao() as conexao:
+            self._gravar_curso(conexao, curso_id, max(c["id"] for c in componentes))
+            conexao.executemany(
+                """
+                INSERT INTO componentes (curso_id, id, ordem, dados) VALUES (
+                    ?, ?,
+                    (SELECT COALESCE(MAX(ordem), 0) + 1 FROM componentes WHERE curso_id = ?),
+                    ?
+                )
+                ON CONFLICT (curso_id, id) DO UPDATE SET dados = excluded.dados
+                """,
+                [(curso_id, c["id"], curso_id, _serializar(c)) for c in componentes]
+            )
+
+    @instrumentar
+    def inserir_componentes(self, curso_id: str, itens: Iterable[tuple[int, dict]]):
+        """
+        Grava componentes em posições definidas da ordem do curso (ex.: ao
+        desfazer uma remoção); os componentes seguintes avançam uma posição.
+
+        Args:
+            curso_id: Identificador do curso
+            itens: Tuplas (índice a partir de 0, componente), em ordem crescente de índice
+        """
+        itens = list(itens)
+        if not itens:
+            return
+        with self._medir("Inserção de componentes", LIMITE_GRAVACAO_MS), self._conexao() as conexao:
+            self._gravar_curso(conexao, curso_id, max(c["id"] for _, c in itens))
+            for posicao, componente in itens:
+                linha = conexao.execute(
+                    "SELECT ordem FROM componentes WHERE curso_id = ? ORDER BY ordem LIMIT 1 OFFSET ?",
+                    (curso_id, posicao)
+                ).fetchone()
+                if linha is None:
+                    (ordem,) = conexao.execute(
+                        "SELECT COALESCE(MAX(ordem), 0) + 1 FROM componentes WHERE curso_id = ?",
+                        (curso_id,)
+                    ).fetchone()
+                else:
+                    ordem = linha[0]
+                    conexao.execute(
+                        "UPDATE componentes SET ordem = ordem + 1 WHERE curso_id = ? AND ordem >= ?",
+                        (curso_id, ordem)
+                    )
+                conexao.execute(
+                    """
+                    INSERT INTO componentes (curso_id, id, ordem, dados) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (curso_id, id) DO UPDATE SET ordem = excluded.ordem, dados = excluded.dados
+                    """,
+                    (curso_id, componente["id"], ordem, _serializar(componente))
+                )
+
+    @instrumentar
+    def remover_componentes(self, curso_id: str, ids: Iterable[int]):
+        """
+        Remove componentes de um curso.
+
+        Args:
+            curso_id: Identificador do curso
+            ids: Identificadores dos componentes
+        """
+        with self._medir("Remoção de componentes", LIMITE_GRAVACAO_MS), self._conexao() as conexao:
+            conexao.executemany(
+                "DELETE FROM componentes WHERE curso_id = ? AND id = ?",
+                [(curso_id, id_componente) for id_componente in ids]
+            )
+
+    @instrumentar
+    def substituir_curso(self, curso_id: str, componentes: list[dict], ultimo_id: int, nome: str | None = None):
+        """
+        Grava o curso inteiro, descartando os componentes anteriores
+        (ex.: ao restaurar um backup).
+
+        Args:
+            curso_id: Identificador do curso
+            componentes: Componentes, na ordem de cadastro
+            ultimo_id: Último id usado no curso
+            nome: Nome do curso (mantido se None)
+        """
+        with self._medir("Gravação do curso", LIMITE_CARREGAMENTO_MS), self._conexao() as conexao:
+            self._gravar_curso(conexao, curso_id, ultimo_id, nome)
+            conexao.execute("DELETE FROM componentes WHERE curso_id = ?", (curso_id,))
+            conexao.executemany(
+                "INSERT INTO componentes (curso_id, id, ordem, dados) VALUES (?, ?, ?, ?)",
+                [(curso_id, c["id"], ordem, _serializar(c)) for ordem, c in enumerate(componentes, 1)]
+            )
+
+    @instrumentar
+    def carregar_curso(self, curso_id: str) -> tuple[list[dict], int] | None:
+        """
+        Lê um curso gravado.
+
+        Args:
+            curso_id: Identificador do curso
+
+        Returns:
+            Tupla (componentes na ordem de cadastro, ultimo_id), ou None se o
+            curso não existir
+        """
+        with self._medir("Carregamento do curso", LIMITE_CARREGAMENTO_MS), self._conexao() as conexao:
+            curso = conexao.execute("SELECT ultimo_id FROM cursos WHERE id = ?", (curso_id,)).fetchone()
+            if curso is None:
+                return None
+            linhas = conexao.execute(
+                "SELECT dados FROM componentes WHERE curso_id = ? ORDER BY ordem",
+                (curso_id,)
+            ).fetchall()
+        return [json.loads(dados) for (dados,) in linhas], curso[0]
+
+    @instrumentar
+    def listar_cursos(self, ids: Iterable[str]) -> list[dict]:
+        """
+        Lista os cursos informados que estão gravados, sem ler os componentes.
+
+        Apenas os cursos pedidos são consultados: o banco é compartilhado por
+        todas as sessões, e cada uma só enxerga os cursos a que tem acesso.
+
+        Args:
+            ids: Identificadores dos cursos
+
+        Returns:
+            Lista de dicionários com id, nome, ultimo_id, atualizado_em,
+            quantidade_componentes, ch_total e conforme
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        with self._medir("Listagem de cursos", LIMITE_CARREGAMENTO_MS), self._conexao() as conexao:
+            cursor = conexao.execute(
+                f"""
+                SELECT id, nome, ultimo_id, atualizado_em, quantidade_componentes, ch_total, conforme
+                FROM cursos WHERE id IN ({", ".join("?" * len(ids))}) ORDER BY atualizado_em DESC
+                """,
+                ids
+            )
+            colunas = [descricao[0] for descricao in cursor.description]
+            return [dict(zip(colunas, linha)) for linha in cursor.fetchall()]
+
+    def atualizar_resumo(self, curso_id: str, quantidade_componentes: int, ch_total: float, conforme: bool):
+        """
+        Grava os totais do curso exibidos na lista de cursos.
+
+        Args:
+            curso_id: Identificador do curso
+            quantidade_componentes: Número de componentes
+            ch_total: Carga horária total
+            conforme: Se o curso atende a todas as regras
+        """
+        with self._medir("Gravação do resumo do curso", LIMITE_GRAVACAO_MS), self._conexao() as conexao:
+            conexao.execute(
+                """
+                UPDATE cursos SET quantidade_componentes = ?, ch_total = ?, conforme = ?, atualizado_em = ?
+                WHERE id = ?
+                """,
+                (quantidade_componentes, ch_total, int(conforme), datetime.now().isoformat(timespec="seconds"), curso_id)
+            )
+
+    def reservar_ids(self, curso_id: str, quantidade: int = 1) -> int:
+        """
+        Reserva ids para novos componentes de um curso.
+
+        O incremento é feito em uma única instrução no banco, então sessões
+        diferentes abertas no mesmo curso nunca recebem o mesmo id.
+
+        Args:
+            curso_id: Identificador do curso
+            quantidade: Quantidade de ids
+
+        Returns:
+            Último id reservado (os ids vão de retorno - quantidade + 1 a retorno)
+        """
+        with self._medir("Reserva de ids", LIMITE_GRAVACAO_MS), self._conexao() as conexao:
+            if SUPORTA_RETURNING:
+                linha = conexao.execute(
+                    "UPDATE cursos SET ultimo_id = ultimo_id + ? WHERE id = ? RETURNING ultimo_id",
+                    (quantidade, curso_id)
+                ).fetchone()
+            else:
+                # Na mesma transação: o UPDATE bloqueia outras gravações até a leitura
+                conexao.execute("UPDATE cursos SET ultimo_id = ultimo_id + ? WHERE id = ?", (quantidade, curso_id))
+                linha = conexao.execute("SELECT ultimo_id FROM cursos WHERE id = ?", (curso_id,)).fetchone()
+        if linha is None:
+            raise KeyError(f"Curso {curso_id} não encontrado.")
+        return linha[0]
+
+    def renomear_curso(self, curso_id: str, nome: str):
+        """Altera o nome de um curso."""
+        with self._conexao() as conexao:
+            conexao.execute("UPDATE cursos SET nome = ? WHERE id = ?", (nome, curso_id))
+
+    def excluir_curso(self, curso_id: str):
+        """Apaga um curso e todos os seus componentes."""
+        with self._conexao() as conexao:
+            conexao.execute("DELETE FROM cursos WHERE id = ?", (curso_id,))
+
+    def gravar_alteracao(self, curso_id: str, alteracao: Alteracao):
+        """
+        Grava uma alteração de um ComponentStore: apenas os componentes
+        afetados são escritos ou apagados.
+
+        Args:
+            curso_id: Identificador do curso
+            alteracao: Alteração recebida como observador do store
+        """
+        removidos = [antes["id"] for antes, depois in zip(alteracao.antes, alteracao.depois) if depois is None]
+        gravados = [depois for depois in alteracao.depois if depois is not None]
+        if removidos:
+            self.remover_componentes(curso_id, removidos)
+        if gravados and alteracao.operacao == "adicionar" and alteracao.posicoes:
+            self.inserir_componentes(curso_id, zip(alteracao.posicoes, gravados))
+        elif gravados:
+            self.salvar_componentes(curso_id, gravados)
@@ -3,6 +3,9 @@ Módulo de validações para componentes curriculares.
 Responsável por validar regras de negócio e conformidade.
 """
 
+from utils.armazenamento import ComponentStore
+from utils.perfil import instrumentar
+
 
 def validar_componente(componente: dict) -> tuple[bool, list[str]]:
     """
@@ -79,10 +82,46 @@ def validar_componente(componente: dict) -> tuple[bool, list[str]]:
     return len(erros) == 0, erros
 
 
+def validar_alteracoes(componentes: ComponentStore, alteracoes: dict[int, dict]) -> dict[int, list[str]]:
+    """
+    Valida alterações de componentes existentes antes de aplicá-las.
+    
+    Apenas os erros introduzidos pela alteração são apontados: um componente
+    que já era inválido (ex.: restaurado de um backup) pode ser renomeado ou
+    mudado de semestre sem que a mesma edição corrija todos os seus erros.
+    
+    Args:
+        componentes: Componentes do curso
+        alteracoes: Mapa id → campos a alterar
+    
+    Returns:
+        Mapa id → erros novos, apenas dos componentes com problemas
+    """
+    erros = {}
+    for id_componente, campos in alteracoes.items():
+        anterior = componentes.obter(id_componente)
+        if anterior is None:
+            erros[id_componente] = [f"Componente {id_componente} não encontrado."]
+            continue
+        valido, erros_atuais = validar_componente({**anterior, **campos, "id": id_componente})
+        if valido:
+            continue
+        _, erros_anteriores = validar_componente(anterior)
+        novos = [erro for erro in erros_atuais if erro not in erros_anteriores]
+        if novos:
+            erros[id_componente] = novos
+    return erros
+
+
+@instrumentar
 def validar_curso_completo(componentes: list) -> dict:
     """
     Valida a conformidade do curso completo com todas as regras.
     
+    Com um ComponentStore, os resultados por componente ficam em cache e só
+    os componentes alterados são revalidados; as regras do curso usam os
+    totais do agregado.
+    
     Args:
         componentes: Lista de dicionários com os componentes
     
@@ -97,29 +136,36 @@ def validar_curso_completo(componentes: list) -> dict:
     
     # Importar aqui para evitar circular
     from utils.calculos import (
-        calcular_ch_total_curso,
-        calcular_ch_por_nucleo,
-        calcular_percentual_extensao,
+        calcular_indicadores,
         obter_ch_minima_por_nucleo,
         validar_ch_minima_nucleo
     )
     
-    # Validar cada componente individualmente
-    for i, comp in enumerate(componentes, 1):
-        valido, erros = validar_componente(comp)
-        if not valido:
-            resultado["valido"] = False
-            resultado["erros"].append(f"Componente {i} ({comp.get('nome', 'sem nome')}): {', '.join(erros)}")
+    # Validar cada componente individualmente (no ComponentStore, apenas os alterados)
+    if isinstance(componentes, ComponentStore):
+        invalidos = componentes.revalidar(validar_componente)
+    else:
+        invalidos = []
+        for i, comp in enumerate(componentes, 1):
+            valido, erros = validar_componente(comp)
+            if not valido:
+                invalidos.append((i, comp, erros))
+    
+    for i, comp, erros in invalidos:
+        resultado["valido"] = False
+        resultado["erros"].append(f"Componente {i} ({comp.get('nome', 'sem nome')}): {', '.join(erros)}")
+    
+    indicadores = calcular_indicadores(componentes)
     
     # Validar CH total do curso
-    ch_total = calcular_ch_total_curso(componentes)
-    if ch_total < 3200:
+    ch_total = indicadores.ch_total
+    if not indicadores.ch_total_conforme:
         resultado["valido"] = False
         resultado["erros"].append(f"CH total do curso ({ch_total:.0f}h) está abaixo do mínimo exigido (3200h)")
     
     # Validar CH mínima por núcleo
     for nucleo in ["I", "II", "III", "IV"]:
-        ch_atual = calcular_ch_por_nucleo(componentes, nucleo)
+        ch_atual = indicadores.ch_por_nucleo[nucleo]
         ch_minima = obter_ch_minima_por_nucleo(nucleo)
         valido, mensagem = validar_ch_minima_nucleo(ch_atual, ch_minima)
         if not valido:
@@ -127,8 +173,8 @@ def validar_curso_completo(componentes: list) -> dict:
             resultado["erros"].append(f"Núcleo {nucleo}: {mensagem}")
     
     # Validar percentual de extensão (10% mínimo)
-    percentual_extensao = calcular_percentual_extensao(componentes)
-    if percentual_extensao < 10:
+    percentual_extensao = indicadores.percentual_extensao
+    if not indicadores.extensao_conforme:
         resultado["valido"] = False
         resultado["erros"].append(f"Percentual de extensão ({percentual_extensao:.2f}%) está abaixo do mínimo exigido (10%)")
     